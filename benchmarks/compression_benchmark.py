@@ -0,0 +1,133 @@
+"""
+Benchmark de tamaño y coste de CPU de la compresión de respuestas de búsqueda del backend.
+
+Uso (desde la raíz del repositorio):
+
+    python benchmarks/compression_benchmark.py
+    python benchmarks/compression_benchmark.py --payloads 10x20,100x100,1000x50 --output compression.json
+
+Cada payload es ITEMSxCAMPOS: una respuesta de búsqueda ({items, current_page, max_pages}) con
+ITEMS documentos de CAMPOS propiedades. brotli solo se mide si está instalado.
+"""
+import argparse
+import datetime
+import json
+import random
+import string
+import sys
+import time
+
+from laia_cli.templates.compression import CompressionMiddleware, brotli
+
+DEFAULT_PAYLOADS = "10x20,100x20,100x100,1000x50"
+GZIP_LEVELS = (1, 6, 9)
+BROTLI_QUALITIES = (1, 4, 6, 11)
+
+WORDS = [
+    "madrid", "barcelona", "valencia", "report", "active", "pending", "library", "station",
+    "sensor", "reading", "user", "admin", "north", "south", "center", "building", "river", "street",
+]
+
+
+def parse_payloads(value: str) -> list:
+    payloads = []
+    for item in value.split(","):
+        items, _, fields = item.strip().lower().partition("x")
+        if not items.isdigit() or not fields.isdigit():
+            raise argparse.ArgumentTypeError(f"Invalid payload '{item}', expected ITEMSxFIELDS (e.g. 100x20)")
+        payloads.append((int(items), int(fields)))
+    return payloads
+
+
+def synthesize_search_response(items: int, fields: int, seed: int = 0) -> bytes:
+    """Respuesta de búsqueda parecida a las de laiagenlib: ids de Mongo, textos, números, fechas y GeoJSON."""
+    rng = random.Random(seed)
+    base_date = datetime.datetime(2024, 1, 1)
+
+    def value(j: int):
+        kind = j % 6
+        if kind == 0:
+            return " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 6)))
+        if kind == 1:
+            return rng.randint(0, 100000)
+        if kind == 2:
+            return round(rng.uniform(-1000, 1000), 4)
+        if kind == 3:
+            return (base_date + datetime.timedelta(minutes=rng.randint(0, 10**6))).isoformat()
+        if kind == 4:
+            return rng.random() < 0.5
+        return {"type": "Point", "coordinates": [round(rng.uniform(-10, 5), 6), round(rng.uniform(35, 44), 6)]}
+
+    documents = []
+    for _ in range(items):
+        document = {"id": "".join(rng.choice("0123456789abcdef") for _ in range(24))}
+        document["name"] = "".join(rng.choice(string.ascii_lowercase) for _ in range(12))
+        for j in range(fields):
+            document[f"field{j}"] = value(j)
+        documents.append(document)
+
+    response = {"items": documents, "current_page": 1, "max_pages": max(1, items // 10)}
+    return json.dumps(response, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def codecs() -> list:
+    """(nombre, encoding, middleware configurado) de cada nivel a medir."""
+    result = [(f"gzip-{level}", "gzip", CompressionMiddleware(None, gzip_level=level)) for level in GZIP_LEVELS]
+    if brotli is not None:
+        result += [
+            (f"br-{quality}", "br", CompressionMiddleware(None, brotli_quality=quality))
+            for quality in BROTLI_QUALITIES
+        ]
+    return result
+
+
+def measure(middleware, encoding: str, body: bytes, repeat: int) -> tuple:
+    """(tamaño comprimido, mejor tiempo de compresión en segundos)."""
+    best = None
+    compressed = b""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        compressed = middleware.compress(encoding, body)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(compressed), best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compression benchmark on synthetic search responses")
+    parser.add_argument("--payloads", type=parse_payloads, default=parse_payloads(DEFAULT_PAYLOADS), help=f"Comma separated ITEMSxFIELDS payloads (default: {DEFAULT_PAYLOADS})")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per codec, the best one is kept")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic payloads")
+    parser.add_argument("--output", help="Write the results JSON here")
+    args = parser.parse_args(argv)
+
+    if brotli is None:
+        print("ℹ️  brotli is not installed, only gzip is measured (pip install brotli).")
+
+    results = {}
+    print(f"{'payload':>10}  {'codec':<8} {'bytes':>12} {'ratio':>7} {'ms':>9} {'MB/s':>8}")
+    for items, fields in args.payloads:
+        label = f"{items}x{fields}"
+        body = synthesize_search_response(items, fields, args.seed)
+        results[label] = {"identity": {"bytes": len(body)}}
+        print(f"{label:>10}  {'identity':<8} {len(body):>12}")
+
+        for name, encoding, middleware in codecs():
+            size, elapsed = measure(middleware, encoding, body, args.repeat)
+            throughput = len(body) / elapsed / 1e6 if elapsed else float("inf")
+            results[label][name] = {
+                "bytes": size,
+                "ratio": round(size / len(body), 4),
+                "seconds": round(elapsed, 6),
+            }
+            print(f"{'':>10}  {name:<8} {size:>12} {size / len(body):>7.1%} {elapsed * 1000:>9.2f} {throughput:>8.1f}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"brotli": brotli is not None, "results": results}, f, indent=2)
+        print(f"\n✅ Results saved to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,261 @@
+"""
+Benchmark de los generadores del backoffice sobre un corpus sintético de schemas.
+
+Uso (desde la raíz del repositorio):
+
+    python benchmarks/generators_benchmark.py --sizes 10x5,100x30,500x100
+    python benchmarks/generators_benchmark.py --save-baseline     # guarda benchmarks/baseline.json
+    python benchmarks/generators_benchmark.py --threshold 0.25    # falla si algo es >25% más lento
+
+Cada tamaño es MODELOSxPROPIEDADES. Todo se genera en un directorio temporal.
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+import yaml
+
+from laia_cli.generators.backoffice.angular.models.model_component_files import modify_model_component_files
+from laia_cli.generators.backoffice.angular.models.models_component_ts import modify_models_component_ts
+from laia_cli.generators.backoffice.angular.route_to_app_routing import add_new_route, add_route_to_app_routing, collect_routes
+from laia_cli.generators.files_generator import virtual_file_tree, write_file
+from laia_cli.generators.generate_service_ts import generate_ts_service
+from laia_cli.generators.generate_ts_interface import generate_all_interfaces_from_schemas
+from laia_cli.generators.kebab_case_converter import to_kebab_case
+
+DEFAULT_SIZES = "10x5,100x30,500x100"
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+SCHEMAS_DIR = "backend/openapi/schemas"
+INTERFACES_DIR = "backoffice/src/app/interfaces"
+ROUTING_PATH = "backoffice/src/app/app-routing.module.ts"
+MODELS_COMPONENT_PATH = "backoffice/src/app/pages/models/models.component.ts"
+
+PROPERTY_TYPES = [
+    {"type": "string"},
+    {"type": "integer"},
+    {"type": "number"},
+    {"type": "boolean"},
+    {"type": "string", "format": "date-time"},
+    {"type": "array", "items": {"type": "string"}},
+]
+
+
+def parse_sizes(value: str) -> list:
+    sizes = []
+    for item in value.split(","):
+        models, _, properties = item.strip().lower().partition("x")
+        if not models.isdigit() or not properties.isdigit():
+            raise argparse.ArgumentTypeError(f"Invalid size '{item}', expected MODELSxPROPERTIES (e.g. 100x30)")
+        sizes.append((int(models), int(properties)))
+    return sizes
+
+
+def synthesize_corpus(models: int, properties: int, seed: int = 0) -> list:
+    """Escribe 'models' schemas YAML con 'properties' propiedades cada uno y devuelve sus nombres."""
+    rng = random.Random(seed)
+    os.makedirs(SCHEMAS_DIR, exist_ok=True)
+
+    names = []
+    for i in range(models):
+        model_name = f"BenchModel{i}"
+        props = {}
+        for j in range(properties):
+            prop = dict(rng.choice(PROPERTY_TYPES))
+            prop["description"] = f"Property {j} of {model_name}"
+            prop["x_frontend_fieldName"] = f"Field {j}"
+            props[f"field{j}"] = prop
+
+        schema = {
+            model_name: {
+                "type": "object",
+                "properties": props,
+                "required": [f"field{j}" for j in range(min(2, properties))],
+                "x-frontend-defaultFields": [f"field{j}" for j in range(min(3, properties))],
+            }
+        }
+        with open(os.path.join(SCHEMAS_DIR, f"{model_name}.yaml"), "w") as f:
+            yaml.dump(schema, f, sort_keys=False)
+        names.append(model_name)
+    return names
+
+
+def reset_backoffice():
+    """Deja un backoffice mínimo (routing y models.component.ts) igual que tras 'ng generate'."""
+    shutil.rmtree("backoffice", ignore_errors=True)
+    write_file(ROUTING_PATH, "")
+    add_route_to_app_routing()
+    write_file(MODELS_COMPONENT_PATH, "")
+
+
+def run_interfaces(names):
+    generate_all_interfaces_from_schemas(SCHEMAS_DIR, INTERFACES_DIR)
+
+
+def run_services(names):
+    for name in names:
+        generate_ts_service(name)
+
+
+def run_model_components(names):
+    for name in names:
+        modify_model_component_files(
+            yaml_path=os.path.join(SCHEMAS_DIR, f"{name}.yaml"),
+            component_base_path=f"models/{to_kebab_case(name)}"
+        )
+
+
+def run_models_component_ts(names):
+    modify_models_component_ts()
+
+
+def run_routes(names):
+    with collect_routes():
+        for name in names:
+            kebab_name = to_kebab_case(name)
+            add_new_route(
+                path=f"models/{kebab_name}",
+                component=f"{name}Component",
+                import_path=f"./pages/models/{kebab_name}/{kebab_name}.component",
+                guard=True
+            )
+            add_new_route(
+                path=f"models/{kebab_name}/new-{kebab_name}",
+                component=f"New{name}Component",
+                import_path=f"./pages/models/{kebab_name}/new-{kebab_name}/new-{kebab_name}.component",
+                guard=True
+            )
+
+
+CASES = {
+    "generate_all_interfaces_from_schemas": run_interfaces,
+    "generate_ts_service": run_services,
+    "modify_model_component_files": run_model_components,
+    "modify_models_component_ts": run_models_component_ts,
+    "add_new_route": run_routes,
+}
+
+
+def time_case(case, names, repeat: int, in_memory: bool) -> float:
+    """Mejor tiempo de 'repeat' ejecuciones, cada una sobre un backoffice recién creado."""
+    best = None
+    for _ in range(repeat):
+        reset_backoffice()
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            if in_memory:
+                with virtual_file_tree():
+                    start = time.perf_counter()
+                    case(names)
+                    elapsed = time.perf_counter() - start
+            else:
+                start = time.perf_counter()
+                case(names)
+                elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run_benchmarks(sizes, cases, repeat: int, in_memory: bool, seed: int) -> dict:
+    results = {}
+    cwd = os.getcwd()
+    for models, properties in sizes:
+        label = f"{models}x{properties}"
+        workdir = tempfile.mkdtemp(prefix=f"laia-bench-{label}-")
+        try:
+            os.chdir(workdir)
+            names = synthesize_corpus(models, properties, seed)
+            results[label] = {}
+            for case_name in cases:
+                elapsed = time_case(CASES[case_name], names, repeat, in_memory)
+                results[label][case_name] = round(elapsed, 6)
+                print(f"  {label:>10}  {case_name:<40} {elapsed * 1000:10.2f} ms")
+        finally:
+            os.chdir(cwd)
+            shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+def compare_with_baseline(results: dict, baseline: dict, threshold: float, min_time: float) -> list:
+    """Devuelve (tamaño, caso, baseline, actual) de los casos más lentos que baseline * (1 + threshold)."""
+    regressions = []
+    for label, cases in results.items():
+        for case_name, elapsed in cases.items():
+            reference = baseline.get(label, {}).get(case_name)
+            # Por debajo de min_time el ruido domina: no se comparan
+            if reference is None or max(reference, elapsed) < min_time:
+                continue
+            if elapsed > reference * (1 + threshold):
+                regressions.append((label, case_name, reference, elapsed))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark of the LAIA backoffice generators")
+    parser.add_argument("--sizes", type=parse_sizes, default=parse_sizes(DEFAULT_SIZES), help=f"Comma separated MODELSxPROPERTIES corpora (default: {DEFAULT_SIZES})")
+    parser.add_argument("--cases", help=f"Comma separated subset of: {', '.join(CASES)}")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case, the best one is kept")
+    parser.add_argument("--in-memory", action="store_true", help="Generate into a virtual file tree (no disk I/O)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic corpus")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--output", help="Also write the results JSON here")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown over the baseline (0.25 = 25%%)")
+    parser.add_argument("--min-time", type=float, default=0.005, help="Cases faster than this (seconds) are not compared")
+    args = parser.parse_args(argv)
+
+    cases = [c.strip() for c in args.cases.split(",")] if args.cases else list(CASES)
+    unknown = [c for c in cases if c not in CASES]
+    if unknown:
+        parser.error(f"Unknown cases: {', '.join(unknown)}")
+
+    print(f"⏱️  Benchmarking {len(cases)} generators on {len(args.sizes)} corpora ({'memory' if args.in_memory else 'disk'})...")
+    results = run_benchmarks(args.sizes, cases, args.repeat, args.in_memory, args.seed)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "in_memory": args.in_memory,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"✅ Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"ℹ️  No baseline at {args.baseline}, run with --save-baseline to create it.")
+        return 0
+
+    with open(args.baseline, "r") as f:
+        baseline = json.load(f)
+    if baseline.get("meta", {}).get("in_memory") != args.in_memory:
+        print("⚠️  Baseline was recorded with a different --in-memory setting.")
+
+    regressions = compare_with_baseline(results, baseline.get("results", {}), args.threshold, args.min_time)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regressions over {args.threshold:.0%}:")
+        for label, case_name, reference, elapsed in regressions:
+            print(f"  {label:>10}  {case_name:<40} {reference * 1000:.2f} ms → {elapsed * 1000:.2f} ms ({elapsed / reference - 1:+.0%})")
+        return 1
+
+    print(f"\n✅ No regressions over {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
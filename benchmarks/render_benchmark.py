@@ -0,0 +1,222 @@
+"""
+Benchmark de la detección de cambios del backoffice generado: OnPush + trackBy frente a Default.
+
+Uso (desde la raíz de un proyecto LAIA con el backoffice creado y sus node_modules):
+
+    python /ruta/a/laia-cli/benchmarks/render_benchmark.py
+    python /ruta/a/laia-cli/benchmarks/render_benchmark.py --rows 100 --ticks 500 --output render.json
+
+Compila dos copias del backoffice con 'ng build --configuration development': la generada (OnPush, trackBy)
+y otra a la que se le quitan 'changeDetection: OnPush' y los trackBy. Las abre en Chromium headless
+(Playwright) con respuestas sintéticas del backend de ROWS filas y, en cada página, lanza TICKS ciclos de
+detección de cambios desde la raíz con ng.applyChanges. Mide ms por ciclo y plantillas actualizadas
+por ciclo (con el profiler de Angular, ng.ɵsetProfiler, disponible en modo desarrollo).
+
+Requiere: pip install playwright && playwright install chromium
+"""
+import argparse
+import functools
+import http.server
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+
+import yaml
+
+from laia_cli.commands.build_project import find_build_output
+from laia_cli.generators.kebab_case_converter import to_kebab_case
+
+try:
+    from playwright.sync_api import sync_playwright
+except ImportError:  # Solo hace falta para este benchmark
+    sync_playwright = None
+
+API_URL = "http://localhost:8005"
+SCHEMAS_DIR = os.path.join("backend", "openapi", "schemas")
+ON_PUSH_LINE = re.compile(r"^\s*changeDetection: ChangeDetectionStrategy\.OnPush,?\n", re.MULTILINE)
+TRACK_BY = re.compile(r";\s*trackBy:\s*\w+")
+# ProfilerEvent.TemplateUpdateStart en @angular/core
+TEMPLATE_UPDATE_START = 2
+
+MEASURE_SCRIPT = """
+({ ticks, templateUpdateStart }) => {
+  const component = ng.getComponent(document.querySelector('app-root'));
+  let updates = 0;
+  const hasProfiler = typeof ng.ɵsetProfiler === 'function';
+  const removeProfiler = hasProfiler ? ng.ɵsetProfiler((event) => { if (event === templateUpdateStart) updates++; }) : null;
+  const start = performance.now();
+  for (let i = 0; i < ticks; i++) {
+    ng.applyChanges(component);
+  }
+  const elapsed = performance.now() - start;
+  if (typeof removeProfiler === 'function') removeProfiler();
+  else if (hasProfiler) ng.ɵsetProfiler(null);
+  return { ms: elapsed / ticks, templates: hasProfiler ? updates / ticks : null };
+}
+"""
+
+
+def load_default_fields() -> dict:
+    """{ruta del backoffice: campos por defecto} de cada schema: la tabla de /auth y de /models/<modelo>."""
+    pages = {}
+    for filename in sorted(os.listdir(SCHEMAS_DIR)):
+        if not filename.endswith((".yaml", ".yml")):
+            continue
+        with open(os.path.join(SCHEMAS_DIR, filename), "r", encoding="utf-8") as f:
+            model_name, definition = next(iter(yaml.safe_load(f).items()))
+        fields = definition.get("x-frontend-defaultFields", [])
+        route = "/auth" if model_name == "User" else f"/models/{to_kebab_case(model_name)}"
+        pages[route] = fields
+    return pages
+
+
+def prepare_variant(backoffice: str, target: str, on_push: bool):
+    """Copia el código del backoffice (node_modules enlazado) y, para la variante Default, quita OnPush y trackBy."""
+    shutil.copytree(backoffice, target, symlinks=True, ignore=shutil.ignore_patterns("node_modules", "dist", ".angular"))
+    os.symlink(os.path.abspath(os.path.join(backoffice, "node_modules")), os.path.join(target, "node_modules"))
+    if on_push:
+        return
+    for root, _, files in os.walk(os.path.join(target, "src")):
+        for name in files:
+            path = os.path.join(root, name)
+            if name.endswith(".ts"):
+                pattern, replacement = ON_PUSH_LINE, ""
+            elif name.endswith(".html"):
+                pattern, replacement = TRACK_BY, ""
+            else:
+                continue
+            with open(path, "r", encoding="utf-8") as f:
+                content = f.read()
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(pattern.sub(replacement, content))
+
+
+def build_variant(project: str) -> str:
+    ng = os.path.join(project, "node_modules", ".bin", "ng")
+    env = os.environ.copy()
+    env["NG_CLI_ANALYTICS"] = "false"
+    subprocess.run([ng, "build", "--configuration", "development"], cwd=project, env=env, check=True,
+                   stdout=subprocess.DEVNULL)
+    return find_build_output(os.path.join(project, "dist"))
+
+
+class SpaHandler(http.server.SimpleHTTPRequestHandler):
+    def translate_path(self, path):
+        translated = super().translate_path(path)
+        return translated if os.path.isfile(translated) else os.path.join(self.directory, "index.html")
+
+    def log_message(self, *args):
+        pass
+
+
+def serve(directory: str):
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(SpaHandler, directory=directory))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def fake_backend(rows: int, fields: list):
+    """Responde a las búsquedas del backoffice con ROWS filas sintéticas, sin backend real."""
+    cors = {
+        "access-control-allow-origin": "*",
+        "access-control-allow-headers": "*",
+        "access-control-allow-methods": "GET, POST, PUT, DELETE, OPTIONS",
+    }
+
+    def handle(route, request):
+        if request.method == "OPTIONS":
+            return route.fulfill(status=204, headers=cors)
+        query = parse_qs(urlparse(request.url).query)
+        skip = int(query.get("skip", ["0"])[0])
+        items = [{"id": f"id{skip + i}", **{field: f"{field} {skip + i}" for field in fields}} for i in range(rows)]
+        body = {"items": items, "max_pages": rows * 10, "current_page": 0}
+        route.fulfill(status=200, headers=cors, content_type="application/json", body=json.dumps(body))
+
+    return handle
+
+
+def measure_variant(playwright, base_url: str, pages: dict, rows: int, ticks: int, repeat: int) -> dict:
+    browser = playwright.chromium.launch(headless=True)
+    results = {}
+    try:
+        for route, fields in pages.items():
+            page = browser.new_page()
+            # El guard solo mira si hay token; las llamadas al backend se responden aquí
+            page.add_init_script("localStorage.setItem('access_token', 'benchmark');")
+            page.route(f"{API_URL}/**", fake_backend(rows, fields))
+            page.goto(base_url + route)
+            page.wait_for_load_state("networkidle")
+            page.wait_for_timeout(200)
+            runs = [page.evaluate(MEASURE_SCRIPT, {"ticks": ticks, "templateUpdateStart": TEMPLATE_UPDATE_START}) for _ in range(repeat)]
+            results[route] = min(runs, key=lambda run: run["ms"])
+            page.close()
+    finally:
+        browser.close()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Change detection benchmark of the generated backoffice (OnPush vs Default)")
+    parser.add_argument("--backoffice", default="backoffice", help="Angular backoffice folder (default: backoffice)")
+    parser.add_argument("--rows", type=int, default=50, help="Rows returned by the fake backend per page")
+    parser.add_argument("--ticks", type=int, default=200, help="Change detection cycles per measurement")
+    parser.add_argument("--repeat", type=int, default=3, help="Measurements per page, the fastest one is kept")
+    parser.add_argument("--routes", help="Comma separated routes to measure (default: /models, /auth and each model list)")
+    parser.add_argument("--output", help="Write the results JSON here")
+    args = parser.parse_args(argv)
+
+    if sync_playwright is None:
+        print("❌ Playwright is not installed: pip install playwright && playwright install chromium")
+        return 1
+    if not os.path.isdir(os.path.join(args.backoffice, "node_modules")):
+        print(f"❌ {args.backoffice}/node_modules not found. Create the backoffice first ('laia start --backoffice').")
+        return 1
+
+    pages = {"/models": [], **load_default_fields()}
+    if args.routes:
+        pages = {route: pages.get(route, []) for route in args.routes.split(",") if route}
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="laia-render-") as workdir, sync_playwright() as playwright:
+        for variant in ("default", "onpush"):
+            project = os.path.join(workdir, variant)
+            prepare_variant(args.backoffice, project, on_push=variant == "onpush")
+            print(f"🏗️  Building {variant} variant...")
+            start = time.perf_counter()
+            build_dir = build_variant(project)
+            print(f"   built in {time.perf_counter() - start:.1f}s")
+            server = serve(build_dir)
+            try:
+                base_url = f"http://127.0.0.1:{server.server_address[1]}"
+                results[variant] = measure_variant(playwright, base_url, pages, args.rows, args.ticks, args.repeat)
+            finally:
+                server.shutdown()
+
+    print(f"\n{'route':<28} {'ms/tick':>18} {'templates/tick':>20} {'reduction':>10}")
+    print(f"{'':<28} {'default':>9}{'onpush':>9} {'default':>10}{'onpush':>10}")
+    for route in pages:
+        before, after = results["default"][route], results["onpush"][route]
+        if before["templates"] is not None:
+            reduction = 1 - after["templates"] / before["templates"] if before["templates"] else 0
+            templates = f"{before['templates']:>10.1f}{after['templates']:>10.1f}"
+        else:
+            reduction = 1 - after["ms"] / before["ms"] if before["ms"] else 0
+            templates = f"{'n/a':>10}{'n/a':>10}"
+        print(f"{route:<28} {before['ms']:>9.3f}{after['ms']:>9.3f} {templates} {reduction:>10.0%}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"rows": args.rows, "ticks": args.ticks, "results": results}, f, indent=2)
+        print(f"\n✅ Results saved to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,32 +1,167 @@
 import argparse
+import os
 
 from laia_cli.commands.start_project import start_project
 from laia_cli.commands.init_project import init_project
 from laia_cli.commands.generate_schema import generate_schema
+from laia_cli.commands.dev_watch import dev_watch
+from laia_cli.commands.ontology_sync import ontology_sync
+from laia_cli.commands.seed import seed
+from laia_cli.commands.data_transfer import export_data, import_data
+from laia_cli.commands.migrate import migrate
+from laia_cli.commands.build_project import build_project
+from laia_cli.commands.cache import cache_clear, cache_info, cache_warm
 
 def main():
     parser = argparse.ArgumentParser(description="Laia CLI")
     subparsers = parser.add_subparsers(dest="command")
 
-    subparsers.add_parser("init", help="Init new project of LAIA")
+    init_parser = subparsers.add_parser("init", help="Init new project of LAIA")
+    init_parser.add_argument("--name", help="Project name")
+    init_parser.add_argument("--ontology", action=argparse.BooleanOptionalAction, default=None, help="Use ontology")
+    init_parser.add_argument("--storage", action=argparse.BooleanOptionalAction, default=None, help="Add storage (MinIO)")
+    init_parser.add_argument("--access-rights", dest="access_rights", action=argparse.BooleanOptionalAction, default=None, help="Use access rights")
+    init_parser.add_argument("--database", choices=["MongoDB", "PostgreSQL"], help="Database to use")
+    init_parser.add_argument("--replica-members", dest="replica_members", type=int, default=None, help="MongoDB replica set members (1 = single node)")
+    init_parser.add_argument("--frontend", choices=["Flutter", "Ionic Angular"], help="Frontend framework")
+    init_parser.add_argument("--backoffice", choices=["Angular", "React", "Vue"], help="Backoffice framework")
+    init_parser.add_argument("--answers", help="JSON/YAML file with the answers to the init prompts")
+    init_parser.add_argument("--non-interactive", "-y", dest="non_interactive", action="store_true", help="Never prompt, use defaults for missing answers")
+    init_parser.add_argument("--batch", help="YAML/JSON file describing several projects to scaffold in parallel")
+    init_parser.add_argument("--workers", type=int, default=None, help="Worker processes for --batch (default: CPU count)")
+
     start_parser = subparsers.add_parser("start", help="Start existing LAIA project")
     start_parser.add_argument("--backend", action="store_true", help="Start backend server")
     start_parser.add_argument("--backoffice", action="store_true", help="Start backoffice project")
     start_parser.add_argument("--frontend", action="store_true", help="Start frontend project")
     start_parser.add_argument("--env", choices=["dev", "prod"], default="dev", help="Environment to use")
-    subparsers.add_parser("generate-schema", help="Generate new OpenAPI schema")
+    start_parser.add_argument("--dry-run", action="store_true", help="With --backoffice: list the files that would change without writing them")
+    start_parser.add_argument("--diff", action="store_true", help="With --backoffice: like --dry-run, also printing a unified diff")
+
+    schema_parser = subparsers.add_parser("generate-schema", help="Generate new OpenAPI schema")
+    schema_parser.add_argument("--name", help="Schema name (e.g. User)")
+    schema_parser.add_argument("--auth", action=argparse.BooleanOptionalAction, default=None, help="Require auth")
+    schema_parser.add_argument("--property", action="append", metavar="NAME:TYPE[:DESCRIPTION]", help="Schema property, can be repeated")
+    schema_parser.add_argument("--answers", help="JSON/YAML file with the schema answers")
+    schema_parser.add_argument("--non-interactive", "-y", dest="non_interactive", action="store_true", help="Never prompt")
+    schema_parser.add_argument("--from-mongo", metavar="DB", help="Infer one schema per collection of an existing Mongo database")
+    schema_parser.add_argument("--mongo-url", help="Mongo URL for --from-mongo (default: config/dev.json or localhost)")
+    schema_parser.add_argument("--collections", help="Comma separated collections to import (default: all)")
+    schema_parser.add_argument("--sample-size", type=int, default=1000, help="Documents sampled per collection with $sample")
+    schema_parser.add_argument("--workers", type=int, default=4, help="Collections processed in parallel")
+    schema_parser.add_argument("--force", action="store_true", help="Overwrite existing schema files")
+
+    dev_parser = subparsers.add_parser("dev", help="Development helpers for the backoffice")
+    dev_parser.add_argument("--watch", action="store_true", help="Regenerate backoffice artifacts when schemas change")
+    dev_parser.add_argument("--poll", action="store_true", help="Use polling instead of inotify")
+    dev_parser.add_argument("--interval", type=float, default=1.0, help="Polling interval in seconds")
+    dev_parser.add_argument("--serve", action="store_true", help="Also launch 'ng serve' in the background")
+
+    ontology_parser = subparsers.add_parser("ontology", help="Ontology (Fuseki) tools")
+    ontology_subparsers = ontology_parser.add_subparsers(dest="ontology_command")
+    ontology_sync_parser = ontology_subparsers.add_parser("sync", help="Sync Mongo collections into Fuseki")
+    ontology_sync_parser.add_argument("--full", action="store_true", help="Bulk load every document of the ontology collections")
+    ontology_sync_parser.add_argument("--env", choices=["dev", "prod"], default="dev", help="Environment to use")
+    ontology_sync_parser.add_argument("--collections", help="Comma separated collections to sync (default: all with x_ontology)")
+    ontology_sync_parser.add_argument("--batch-size", type=int, default=1000, help="Mongo cursor batch size")
+    ontology_sync_parser.add_argument("--chunk-size", type=int, default=5000, help="Documents per N-Triples upload")
+    ontology_sync_parser.add_argument("--workers", type=int, default=4, help="Parallel uploads to Fuseki")
+    ontology_sync_parser.add_argument("--restart", action="store_true", help="Ignore saved progress and sync every collection again")
+    ontology_sync_parser.add_argument("--clear", action="store_true", help="Clear each dataset before loading it from scratch")
+
+    seed_parser = subparsers.add_parser("seed", help="Insert synthetic documents of a schema (load testing)")
+    seed_parser.add_argument("--model", required=True, help="Schema name (e.g. Book)")
+    seed_parser.add_argument("--count", type=int, required=True, help="Documents to insert")
+    seed_parser.add_argument("--batch-size", type=int, default=1000, help="Documents per insert_many")
+    seed_parser.add_argument("--workers", type=int, default=os.cpu_count() or 4, help="Worker processes (default: CPU count)")
+    seed_parser.add_argument("--seed", type=int, default=0, help="Random seed: same seed and batch size, same documents")
+    seed_parser.add_argument("--env", choices=["dev", "prod"], default="dev", help="Environment to use")
+    seed_parser.add_argument("--mongo-url", help="Mongo URL (default: config/<env>.json)")
+    seed_parser.add_argument("--write-concern", type=int, default=1, help="Write concern 'w' of the inserts")
+    seed_parser.add_argument("--drop", action="store_true", help="Drop the collection before seeding")
+
+    export_parser = subparsers.add_parser("export", help="Export model collections to NDJSON/BSON files")
+    export_parser.add_argument("--models", help="Comma separated schemas to export (default: all)")
+    export_parser.add_argument("--output", help="Output directory (default: exports/<timestamp>)")
+    export_parser.add_argument("--format", choices=["ndjson", "bson"], default="ndjson", help="File format")
+    export_parser.add_argument("--compress", choices=["none", "zstd"], default="none", help="Compression of the data files")
+    export_parser.add_argument("--workers", type=int, default=4, help="Collections exported in parallel")
+    export_parser.add_argument("--batch-size", type=int, default=1000, help="Mongo cursor batch size")
+    export_parser.add_argument("--env", choices=["dev", "prod"], default="dev", help="Environment to use")
+    export_parser.add_argument("--mongo-url", help="Mongo URL (default: config/<env>.json)")
+
+    import_parser = subparsers.add_parser("import", help="Import model collections exported with 'laia export'")
+    import_parser.add_argument("input", help="Directory created by 'laia export'")
+    import_parser.add_argument("--models", help="Comma separated schemas to import (default: all in the manifest)")
+    import_parser.add_argument("--workers", type=int, default=4, help="Collections imported in parallel")
+    import_parser.add_argument("--batch-size", type=int, default=1000, help="Documents validated and written per bulk_write")
+    import_parser.add_argument("--no-validate", dest="no_validate", action="store_true", help="Skip validation against the schema YAML")
+    import_parser.add_argument("--drop", action="store_true", help="Drop each collection before importing it")
+    import_parser.add_argument("--restart", action="store_true", help="Ignore saved progress and import everything again")
+    import_parser.add_argument("--env", choices=["dev", "prod"], default="dev", help="Environment to use")
+    import_parser.add_argument("--mongo-url", help="Mongo URL (default: config/<env>.json)")
+
+    migrate_parser = subparsers.add_parser("migrate", help="Backfill documents after schema changes")
+    migrate_parser.add_argument("--dry-run", action="store_true", help="Print the plan with document counts and estimated duration")
+    migrate_parser.add_argument("--models", help="Comma separated schemas to migrate (default: all)")
+    migrate_parser.add_argument("--batch-size", type=int, default=1000, help="Documents per bulk_write")
+    migrate_parser.add_argument("--max-rate", type=float, default=None, help="Throttle to this many documents per second")
+    migrate_parser.add_argument("--unset-removed", action="store_true", help="Delete properties removed from the schemas")
+    migrate_parser.add_argument("--env", choices=["dev", "prod"], default="dev", help="Environment to use")
+    migrate_parser.add_argument("--mongo-url", help="Mongo URL (default: config/<env>.json)")
+
+    build_parser = subparsers.add_parser("build", help="Production builds served by the backend")
+    build_parser.add_argument("--backoffice", action="store_true", help="Build the Angular backoffice into backend/static/backoffice")
+    build_parser.add_argument("--frontend", action="store_true", help="Release web build of the Flutter frontend into backend/static/frontend")
+    build_parser.add_argument("--skip-generate", dest="skip_generate", action="store_true", help="Build without regenerating the apps from the schemas")
+
+    cache_parser = subparsers.add_parser("cache", help="Offline cache of project skeletons")
+    cache_subparsers = cache_parser.add_subparsers(dest="cache_command")
+    cache_warm_parser = cache_subparsers.add_parser("warm", help="Create the Angular backoffice skeleton (needs network once)")
+    cache_warm_parser.add_argument("--force", action="store_true", help="Rebuild the skeleton even if it is already cached")
+    cache_subparsers.add_parser("info", help="Show the cache location and its skeletons")
+    cache_subparsers.add_parser("clear", help="Remove the cached skeletons")
 
     subparsers.add_parser("help", help="Help")
 
     args = parser.parse_args()
 
     if args.command == "init":
-        init_project()
+        init_project(args)
     elif args.command == "start":
         start_project(args)
     elif args.command == "generate-schema":
-        generate_schema()
+        generate_schema(args)
+    elif args.command == "dev":
+        if args.watch:
+            dev_watch(args)
+        else:
+            print("⚠️  Nothing to do. Use 'laia dev --watch'.")
+    elif args.command == "ontology":
+        if args.ontology_command == "sync":
+            ontology_sync(args)
+        else:
+            ontology_parser.print_help()
+    elif args.command == "seed":
+        seed(args)
+    elif args.command == "export":
+        export_data(args)
+    elif args.command == "import":
+        import_data(args)
+    elif args.command == "migrate":
+        migrate(args)
+    elif args.command == "build":
+        build_project(args)
+    elif args.command == "cache":
+        if args.cache_command == "warm":
+            cache_warm(args)
+        elif args.cache_command == "info":
+            cache_info(args)
+        elif args.cache_command == "clear":
+            cache_clear(args)
+        else:
+            cache_parser.print_help()
     elif args.command == "help":
         parser.print_help()
     else:
-        print(f"Invalid command. Type 'help' to see the list of available commands.")
\ No newline at end of file
+        print(f"Invalid command. Type 'help' to see the list of available commands.")
@@ -0,0 +1,15 @@
+import json
+import os
+
+import yaml
+
+
+def load_answers_file(path: str):
+    """Carga un fichero de respuestas (.json, .yaml o .yml) para ejecutar comandos sin prompts."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Answers file not found: {path}")
+
+    with open(path, "r", encoding="utf-8") as f:
+        if path.endswith(".json"):
+            return json.load(f)
+        return yaml.safe_load(f) or {}
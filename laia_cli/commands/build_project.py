@@ -0,0 +1,252 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from laia_cli.commands.run_laia_flutter import build_laia_flutter_web
+from laia_cli.commands.start_project import generate_backoffice
+from laia_cli.generators.files_generator import write_file
+
+try:
+    import brotli
+except ImportError:  # Sin brotli solo se generan las variantes .gz
+    brotli = None
+
+BACKOFFICE_PATH = "backoffice"
+STATIC_DIR = os.path.join("backend", "static")
+BACKOFFICE_STATIC_DIR = os.path.join(STATIC_DIR, "backoffice")
+BACKOFFICE_BASE_HREF = "/backoffice/"
+FRONTEND_PATH = "frontend"
+FRONTEND_STATIC_DIR = os.path.join(STATIC_DIR, "frontend")
+FRONTEND_BASE_HREF = "/app/"
+# Ficheros de la build web de Flutter que cargan main.dart.js por su nombre
+FLUTTER_LOADERS = ("flutter_bootstrap.js", "index.html", "flutter_service_worker.js")
+
+# Presupuestos de la build de producción: 'ng build' avisa o falla si se superan
+DEFAULT_BUDGETS = [
+    {"type": "initial", "maximumWarning": "1mb", "maximumError": "2mb"},
+    {"type": "anyComponentStyle", "maximumWarning": "6kb", "maximumError": "12kb"},
+]
+
+COMPRESSIBLE_EXTENSIONS = (".js", ".mjs", ".css", ".html", ".json", ".svg", ".txt", ".xml", ".map", ".ico", ".wasm", ".webmanifest")
+MIN_COMPRESS_SIZE = 1024
+
+
+def load_build_config(target: str) -> dict:
+    """Sección 'build.<target>' de laia.json (budgets, base_href)."""
+    if not os.path.exists("laia.json"):
+        return {}
+    with open("laia.json", "r", encoding="utf-8") as f:
+        return json.load(f).get("build", {}).get(target, {})
+
+
+def configure_angular_production(angular_json_path: str, budgets: list) -> str:
+    """Ajusta la configuración 'production' de angular.json (budgets, hashing, sin source maps). Devuelve el proyecto."""
+    with open(angular_json_path, "r", encoding="utf-8") as f:
+        angular = json.load(f)
+
+    project_name = angular.get("defaultProject") or next(iter(angular["projects"]))
+    build = angular["projects"][project_name]["architect"]["build"]
+    production = build.setdefault("configurations", {}).setdefault("production", {})
+    production.update({
+        "budgets": budgets,
+        "outputHashing": "all",
+        "optimization": True,
+        "sourceMap": False,
+        "extractLicenses": True,
+    })
+    # namedChunks solo existe en el builder de webpack
+    if not build.get("builder", "").endswith(":application"):
+        production["namedChunks"] = False
+
+    write_file(angular_json_path, json.dumps(angular, indent=2) + "\n")
+    return project_name
+
+
+def find_build_output(dist_dir: str) -> str:
+    """Carpeta con el index.html: dist/<proyecto>/browser (builder application) o dist/<proyecto> (webpack)."""
+    for root, _, files in os.walk(dist_dir):
+        if "index.html" in files:
+            return root
+    return None
+
+
+def precompress_file(path: str) -> int:
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < MIN_COMPRESS_SIZE:
+        return 0
+
+    written = 0
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    if len(gz) < len(data):
+        with open(path + ".gz", "wb") as f:
+            f.write(gz)
+        written += 1
+    if brotli is not None:
+        br = brotli.compress(data, quality=11)
+        if len(br) < len(data):
+            with open(path + ".br", "wb") as f:
+                f.write(br)
+            written += 1
+    return written
+
+
+def precompress_directory(directory: str, workers: int = None) -> int:
+    """Genera .gz (y .br si brotli está instalado) junto a cada fichero comprimible: el backend los sirve tal cual."""
+    paths = [
+        os.path.join(root, name)
+        for root, _, files in os.walk(directory)
+        for name in files
+        if name.endswith(COMPRESSIBLE_EXTENSIONS)
+    ]
+    # zlib y brotli sueltan el GIL: los hilos comprimen en paralelo
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        return sum(executor.map(precompress_file, paths))
+
+
+def publish_static(build_dir: str, target_dir: str) -> int:
+    """Copia la build a backend/static/<target> sustituyendo la anterior de golpe."""
+    staging_dir = target_dir + ".new"
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    shutil.copytree(build_dir, staging_dir)
+    variants = precompress_directory(staging_dir)
+
+    shutil.rmtree(target_dir, ignore_errors=True)
+    os.replace(staging_dir, target_dir)
+    return variants
+
+
+def directory_size(directory: str, suffix: str = None) -> int:
+    """Bytes de los originales, o solo de las variantes con 'suffix' (.gz, .br)."""
+    total = 0
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if (name.endswith(suffix) if suffix else not name.endswith((".gz", ".br"))):
+                total += os.path.getsize(os.path.join(root, name))
+    return total
+
+
+def build_backoffice(args):
+    angular_json = os.path.join(BACKOFFICE_PATH, "angular.json")
+    if not os.path.exists(angular_json):
+        print("❌ No Angular backoffice found. Create it first with 'laia start --backoffice'.")
+        return False
+
+    print("🏗️  Building backoffice for production...")
+    if not args.skip_generate:
+        generate_backoffice()
+
+    build_config = load_build_config("backoffice")
+    project_name = configure_angular_production(angular_json, build_config.get("budgets", DEFAULT_BUDGETS))
+    base_href = build_config.get("base_href", BACKOFFICE_BASE_HREF)
+
+    dist_dir = os.path.join(BACKOFFICE_PATH, "dist")
+    shutil.rmtree(dist_dir, ignore_errors=True)
+
+    env = os.environ.copy()
+    env["NG_CLI_ANALYTICS"] = "ci"
+    start = time.perf_counter()
+    result = subprocess.run(
+        ["ng", "build", "--configuration", "production", "--base-href", base_href],
+        cwd=BACKOFFICE_PATH, env=env,
+    )
+    if result.returncode != 0:
+        print("❌ 'ng build' failed (budgets exceeded or compilation errors, see above).")
+        return False
+
+    build_dir = find_build_output(dist_dir)
+    if build_dir is None:
+        print(f"❌ No index.html found under {dist_dir} after the build.")
+        return False
+
+    variants = publish_static(build_dir, BACKOFFICE_STATIC_DIR)
+    print(
+        f"✅ Backoffice '{project_name}' built in {time.perf_counter() - start:.1f}s → {BACKOFFICE_STATIC_DIR} "
+        f"({directory_size(BACKOFFICE_STATIC_DIR) / 1e6:.2f} MB, gzip {directory_size(BACKOFFICE_STATIC_DIR, '.gz') / 1e6:.2f} MB"
+        + (f", brotli {directory_size(BACKOFFICE_STATIC_DIR, '.br') / 1e6:.2f} MB" if brotli is not None else "")
+        + f", {variants} precompressed files)"
+    )
+    print(f"🌐 The backend serves it at {base_href} ('laia start --backend').")
+    return True
+
+
+def fingerprint_main_js(build_dir: str):
+    """
+    Renombra main.dart.js a main.dart.<hash>.js y actualiza quien lo carga, para servirlo como immutable.
+    Si ningún loader lo referencia (formato de build desconocido) se deja como estaba.
+    """
+    main_path = os.path.join(build_dir, "main.dart.js")
+    if not os.path.exists(main_path):
+        return None
+    with open(main_path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:16]
+    hashed_name = f"main.dart.{digest}.js"
+
+    loaders = {}
+    for name in FLUTTER_LOADERS:
+        path = os.path.join(build_dir, name)
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                content = f.read()
+            if '"main.dart.js"' in content:
+                loaders[path] = content.replace('"main.dart.js"', f'"{hashed_name}"')
+    if not loaders:
+        print("⚠️  main.dart.js is not referenced by the usual loaders, it keeps its name (served with revalidation).")
+        return None
+
+    for path, content in loaders.items():
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+    os.replace(main_path, os.path.join(build_dir, hashed_name))
+    return hashed_name
+
+
+def build_frontend(args):
+    if not os.path.exists("laia.json"):
+        print("❌ laia.json not found. Run this command from the root of a LAIA project.")
+        return False
+    with open("laia.json", "r", encoding="utf-8") as f:
+        frontend = json.load(f).get("frontend", "Flutter")
+    if frontend != "Flutter":
+        print(f"❌ 'laia build --frontend' builds Flutter web apps, this project uses {frontend}.")
+        return False
+
+    print("🏗️  Building frontend (Flutter web, release)...")
+    base_href = load_build_config("frontend").get("base_href", FRONTEND_BASE_HREF)
+    openapi_path = os.path.join(os.getcwd(), "backend", "openapi.yaml")
+    start = time.perf_counter()
+    if not asyncio.run(build_laia_flutter_web(openapi_path, "backend", FRONTEND_PATH, base_href, generate=not args.skip_generate)):
+        return False
+
+    build_dir = os.path.join(FRONTEND_PATH, "build", "web")
+    if not os.path.exists(os.path.join(build_dir, "index.html")):
+        print(f"❌ No index.html found in {build_dir} after the build.")
+        return False
+
+    hashed_main = fingerprint_main_js(build_dir)
+    variants = publish_static(build_dir, FRONTEND_STATIC_DIR)
+    print(
+        f"✅ Frontend built in {time.perf_counter() - start:.1f}s → {FRONTEND_STATIC_DIR} "
+        f"({directory_size(FRONTEND_STATIC_DIR) / 1e6:.2f} MB, gzip {directory_size(FRONTEND_STATIC_DIR, '.gz') / 1e6:.2f} MB"
+        + (f", brotli {directory_size(FRONTEND_STATIC_DIR, '.br') / 1e6:.2f} MB" if brotli is not None else "")
+        + f", {variants} precompressed files"
+        + (f", {hashed_main} immutable" if hashed_main else "") + ")"
+    )
+    print(f"🌐 The backend serves it at {base_href} ('laia start --backend').")
+    return True
+
+
+def build_project(args):
+    if not (args.backoffice or args.frontend):
+        print("⚠️  No target specified. Use --backoffice and/or --frontend.")
+        return
+    if args.backoffice and not build_backoffice(args):
+        exit(1)
+    if args.frontend and not build_frontend(args):
+        exit(1)
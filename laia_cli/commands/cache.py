@@ -0,0 +1,31 @@
+import os
+import shutil
+
+from laia_cli.generators.backoffice.angular.skeleton_cache import (
+    cache_root,
+    cache_size,
+    skeleton_dir,
+    skeleton_ready,
+    warm_angular_skeleton,
+)
+
+
+def cache_warm(args):
+    if not warm_angular_skeleton(force=args.force):
+        exit(1)
+
+
+def cache_info(args):
+    root = cache_root()
+    print(f"📁 Cache: {root}")
+    print(f"   Angular skeleton: {'ready' if skeleton_ready() else 'missing'} ({skeleton_dir()})")
+    skeletons = os.path.join(root, "skeletons")
+    if os.path.isdir(skeletons):
+        for name in sorted(os.listdir(skeletons)):
+            print(f"   - {name}: {cache_size(os.path.join(skeletons, name)) / 1e6:.0f} MB")
+
+
+def cache_clear(args):
+    root = cache_root()
+    shutil.rmtree(os.path.join(root, "skeletons"), ignore_errors=True)
+    print(f"🧹 Cached skeletons removed from {root}")
@@ -0,0 +1,230 @@
+import json
+import os
+import re
+import subprocess
+import time
+
+import yaml
+
+from laia_cli.generators.files_generator import read_file, write_file
+
+COMPOSE_PATH = "docker-compose.yaml"
+# docker compose lo combina solo con docker-compose.yaml en cada 'up'
+OVERRIDE_PATH = "docker-compose.override.yaml"
+
+# Nombre del servicio en el compose → clave de su bloque en config["services"]
+SERVICE_KEYS = {
+    "mongo": "mongo",
+    "jena-fuseki": "fuseki",
+    "minio": "minio",
+    "postgres": "postgres",
+}
+# Miembros extra del replica set (mongo2, mongo3...): mismos ajustes que mongo
+MONGO_MEMBER = re.compile(r"mongo\d+")
+
+DEFAULT_HEALTHCHECK = {
+    "interval": "5s",
+    "timeout": "5s",
+    "retries": 20,
+    "start_period": "10s",
+}
+
+DEFAULT_SERVICES_CONFIG = {
+    "mongo": {"cpus": 1.0, "memory": "1g", "wiredtiger_cache_gb": 0.25},
+    "fuseki": {"cpus": 1.0, "memory": "1g", "jvm_heap": "512m", "jvm_args": ""},
+    "minio": {"cpus": 0.5, "memory": "512m"},
+    "postgres": {"cpus": 1.0, "memory": "1g", "shared_buffers": "256MB", "effective_cache_size": "768MB",
+                 "work_mem": "8MB", "max_connections": 100},
+    "healthcheck": DEFAULT_HEALTHCHECK,
+    "wait_timeout": 120,
+}
+
+PROD_SERVICES_CONFIG = {
+    "mongo": {"cpus": 2.0, "memory": "4g", "wiredtiger_cache_gb": 1.5},
+    "fuseki": {"cpus": 2.0, "memory": "4g", "jvm_heap": "2g", "jvm_args": ""},
+    "minio": {"cpus": 1.0, "memory": "1g"},
+    "postgres": {"cpus": 2.0, "memory": "4g", "shared_buffers": "1GB", "effective_cache_size": "3GB",
+                 "work_mem": "16MB", "max_connections": 200},
+    "healthcheck": DEFAULT_HEALTHCHECK,
+    "wait_timeout": 300,
+}
+
+MONGO_PING = "if (db.adminCommand('ping').ok !== 1) quit(1)"
+# Con replica set solo está sano cuando rs.initiate() ya se ha ejecutado
+MONGO_RS_STATUS = "try { if (rs.status().ok !== 1) quit(1) } catch (e) { quit(1) }"
+
+
+def load_services_config(env: str) -> dict:
+    config_path = os.path.join("config", f"{env}.json")
+    if not os.path.exists(config_path):
+        return DEFAULT_SERVICES_CONFIG
+    with open(config_path, "r") as f:
+        return json.load(f).get("services", DEFAULT_SERVICES_CONFIG)
+
+
+def resource_limits(options: dict) -> dict:
+    limits = {}
+    if options.get("cpus"):
+        limits["cpus"] = str(options["cpus"])
+    if options.get("memory"):
+        limits["memory"] = str(options["memory"])
+    return {"deploy": {"resources": {"limits": limits}}} if limits else {}
+
+
+def healthcheck(test: list, options: dict) -> dict:
+    return {"healthcheck": {"test": test, **{**DEFAULT_HEALTHCHECK, **options}}}
+
+
+def service_key(name: str):
+    if MONGO_MEMBER.fullmatch(name):
+        return "mongo"
+    return SERVICE_KEYS.get(name)
+
+
+def mongo_override(service: dict, options: dict, health: dict) -> dict:
+    command = list(service.get("command") or [])
+    replica_set = "--replSet" in command
+    port = command[command.index("--port") + 1] if "--port" in command else None
+
+    cache_gb = options.get("wiredtiger_cache_gb")
+    if cache_gb:
+        if "--wiredTigerCacheSizeGB" in command:
+            index = command.index("--wiredTigerCacheSizeGB")
+            del command[index:index + 2]
+        command += ["--wiredTigerCacheSizeGB", str(cache_gb)]
+
+    test = ["CMD", "mongosh", "--quiet"] + (["--port", str(port)] if port else [])
+    test += ["--eval", MONGO_RS_STATUS if replica_set else MONGO_PING]
+    override = {**resource_limits(options), **healthcheck(test, health)}
+    if command:
+        override["command"] = command
+    return override
+
+
+def fuseki_override(service: dict, options: dict, health: dict) -> dict:
+    jvm_args = " ".join(arg for arg in [
+        f"-Xmx{options['jvm_heap']}" if options.get("jvm_heap") else "",
+        options.get("jvm_args", ""),
+    ] if arg)
+
+    environment = {"TDB": "2"}  # los datasets que crea la imagen son TDB2, igual que los de la sincronización
+    if jvm_args:
+        environment["JVM_ARGS"] = jvm_args
+
+    # $$: compose interpolaría '$/ping' como variable
+    test = ["CMD-SHELL", "wget -qO- http://localhost:3030/$$/ping || curl -fs http://localhost:3030/$$/ping || exit 1"]
+    return {"environment": environment, **resource_limits(options), **healthcheck(test, health)}
+
+
+def minio_override(service: dict, options: dict, health: dict) -> dict:
+    return {**resource_limits(options), **healthcheck(["CMD", "mc", "ready", "local"], health)}
+
+
+# Parámetros del servidor que se pasan como '-c clave=valor' (shared_buffers ~25% de la memoria del contenedor)
+POSTGRES_SETTINGS = ("shared_buffers", "effective_cache_size", "work_mem", "max_connections")
+
+
+def postgres_override(service: dict, options: dict, health: dict) -> dict:
+    command = ["postgres"]
+    for setting in POSTGRES_SETTINGS:
+        if options.get(setting):
+            command += ["-c", f"{setting}={options[setting]}"]
+
+    environment = service.get("environment") or {}
+    user = environment.get("POSTGRES_USER", "postgres") if isinstance(environment, dict) else "postgres"
+    test = ["CMD", "pg_isready", "-U", str(user)]
+    return {"command": command, **resource_limits(options), **healthcheck(test, health)}
+
+
+SERVICE_OVERRIDES = {
+    "mongo": mongo_override,
+    "fuseki": fuseki_override,
+    "minio": minio_override,
+    "postgres": postgres_override,
+}
+
+
+def render_compose_override(services_config: dict, compose_path: str = COMPOSE_PATH,
+                            override_path: str = OVERRIDE_PATH) -> dict:
+    """
+    Genera docker-compose.override.yaml con límites de CPU/memoria, ajustes de cada motor
+    y healthchecks a partir de la sección 'services' de config/*.json. El compose base no se toca.
+    """
+    compose = yaml.safe_load(read_file(compose_path)) or {}
+    health = services_config.get("healthcheck", {})
+
+    services = {}
+    for name, service in (compose.get("services") or {}).items():
+        key = service_key(name)
+        if key is None:
+            continue
+        services[name] = SERVICE_OVERRIDES[key](service or {}, services_config.get(key, {}), health)
+
+    header = "# Generado por laia a partir de la sección 'services' de config/*.json: no editar a mano.\n"
+    write_file(override_path, header + yaml.safe_dump({"services": services}, sort_keys=False))
+    return services
+
+
+def container_names(compose_path: str = COMPOSE_PATH) -> dict:
+    compose = yaml.safe_load(read_file(compose_path)) or {}
+    return {
+        name: (service or {}).get("container_name", name)
+        for name, service in (compose.get("services") or {}).items()
+    }
+
+
+def container_health(container: str) -> str:
+    """
+    'healthy', 'unhealthy', 'starting', o el estado del contenedor si no tiene healthcheck.
+    Los contenedores de un solo uso (mongo-rs-init) que terminan bien devuelven 'completed'.
+    """
+    result = subprocess.run(
+        ["docker", "inspect", "-f",
+         "{{if .State.Health}}{{.State.Health.Status}}{{else}}{{.State.Status}} {{.State.ExitCode}}{{end}}", container],
+        capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        return "missing"
+    status = result.stdout.strip()
+    if status == "exited 0":
+        return "completed"
+    return status.split(" ")[0]
+
+
+def last_health_output(container: str) -> str:
+    result = subprocess.run(
+        ["docker", "inspect", "-f", "{{if .State.Health}}{{range .State.Health.Log}}{{.Output}}{{end}}{{end}}", container],
+        capture_output=True, text=True,
+    )
+    return result.stdout.strip().splitlines()[-1] if result.stdout.strip() else ""
+
+
+def wait_for_services(timeout: float, compose_path: str = COMPOSE_PATH, interval: float = 2) -> bool:
+    """Espera a que todos los contenedores del compose estén 'healthy' (o 'running' si no tienen healthcheck)."""
+    pending = container_names(compose_path)
+    deadline = time.monotonic() + timeout
+    print(f"\n⏳ Waiting for {', '.join(sorted(pending))} to be healthy (timeout {timeout:.0f}s)...")
+
+    statuses = {}
+    while pending and time.monotonic() < deadline:
+        for service, container in list(pending.items()):
+            status = container_health(container)
+            if status != statuses.get(service):
+                statuses[service] = status
+                print(f"  {service}: {status}")
+            if status in ("healthy", "running", "completed"):
+                del pending[service]
+            elif status in ("exited", "dead", "missing"):
+                print(f"❌ {service} is {status}. Check 'docker compose logs {service}'.")
+                return False
+        if pending:
+            time.sleep(interval)
+
+    if pending:
+        for service, container in pending.items():
+            output = last_health_output(container)
+            print(f"❌ {service} not healthy after {timeout:.0f}s ({statuses.get(service)}){f': {output}' if output else ''}")
+        return False
+
+    print("✅ All services are healthy.")
+    return True
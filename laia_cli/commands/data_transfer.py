@@ -0,0 +1,361 @@
+import datetime
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import bson
+from bson import json_util
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+from pymongo import MongoClient, ReplaceOne
+
+from laia_cli.commands.seed import GEOMETRY_TYPES, SCHEMAS_DIR, find_schema, load_mongo_settings, load_schemas
+from laia_cli.generators.files_generator import write_file
+
+try:
+    import zstandard
+except ImportError:  # Solo hace falta con --compress zstd (pip install zstandard)
+    zstandard = None
+
+MANIFEST_NAME = "manifest.json"
+CHECKPOINTS_DIR = ".laia"
+FORMATS = ("ndjson", "bson")
+COMPRESSIONS = ("none", "zstd")
+JSON_OPTIONS = json_util.RELAXED_JSON_OPTIONS  # conserva ObjectId y fechas ({"$oid"}, {"$date"})
+READ_CHUNK = 1 << 20
+MAX_REJECTED_SAMPLES = 20
+
+JSON_TYPES = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "array": (list,),
+    "object": (dict,),
+}
+
+
+def data_file_name(collection: str, data_format: str, compression: str) -> str:
+    return f"{collection}.{data_format}" + (".zst" if compression == "zstd" else "")
+
+
+def require_zstd(compression: str):
+    if compression == "zstd" and zstandard is None:
+        raise RuntimeError("zstd compression needs the 'zstandard' package: pip install zstandard")
+
+
+def open_writer(path: str, compression: str):
+    raw = open(path, "wb")
+    if compression == "zstd":
+        # closefd: al cerrar el writer también se cierra el fichero
+        return zstandard.ZstdCompressor(level=3, threads=-1).stream_writer(raw, closefd=True)
+    return raw
+
+
+def open_reader(path: str):
+    raw = open(path, "rb")
+    if path.endswith(".zst"):
+        require_zstd("zstd")
+        return zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+    return raw
+
+
+def iter_ndjson(stream):
+    """Líneas de un stream binario (también descomprimiendo) sin cargar el fichero entero."""
+    pending = b""
+    while True:
+        chunk = stream.read(READ_CHUNK)
+        if not chunk:
+            break
+        pending += chunk
+        lines = pending.split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            if line.strip():
+                yield json_util.loads(line, json_options=JSON_OPTIONS)
+    if pending.strip():
+        yield json_util.loads(pending, json_options=JSON_OPTIONS)
+
+
+def iter_documents(path: str, data_format: str):
+    with open_reader(path) as stream:
+        if data_format == "bson":
+            # decode_file_iter lee documento a documento; con zstd envolvemos el stream en un fichero
+            yield from bson.decode_file_iter(stream)
+        else:
+            yield from iter_ndjson(stream)
+
+
+# --- Validación contra el schema YAML ---
+
+def validate_value(value, definition: dict, schemas: dict, path: str, errors: list, depth: int = 0):
+    if value is None or not isinstance(definition, dict) or depth > 5:
+        return
+    if "$ref" in definition:
+        ref_name = definition["$ref"].rsplit("/", 1)[-1]
+        base_type = ref_name[len("Geometry"):] if ref_name.startswith("Geometry") else ref_name
+        if base_type in GEOMETRY_TYPES or ref_name == "Geometry":
+            if not isinstance(value, dict) or "type" not in value:
+                errors.append(f"{path}: expected a GeoJSON object")
+        elif ref_name in schemas:
+            validate_value(value, schemas[ref_name], schemas, path, errors, depth + 1)
+        return
+
+    if "enum" in definition and value not in definition["enum"]:
+        errors.append(f"{path}: {value!r} not in enum")
+        return
+
+    expected = definition.get("type")
+    if expected in JSON_TYPES:
+        # Fechas: Mongo devuelve datetime donde el schema dice string/date-time; ObjectId en campos string
+        if expected == "string" and isinstance(value, (datetime.datetime, bson.ObjectId)):
+            return
+        if not isinstance(value, JSON_TYPES[expected]) or (expected in ("integer", "number") and isinstance(value, bool)):
+            errors.append(f"{path}: expected {expected}, got {type(value).__name__}")
+            return
+
+    if expected == "array" and isinstance(definition.get("items"), dict):
+        for i, item in enumerate(value):
+            validate_value(item, definition["items"], schemas, f"{path}[{i}]", errors, depth + 1)
+    elif expected == "object" or "properties" in definition:
+        if isinstance(value, dict):
+            validate_document(value, definition, schemas, errors, f"{path}.", depth + 1)
+
+
+def validate_document(document: dict, schema: dict, schemas: dict, errors: list = None, prefix: str = "", depth: int = 0) -> list:
+    """Errores de un documento frente al schema: required, tipos, enum y $ref (embebidos y GeoJSON)."""
+    errors = [] if errors is None else errors
+    for field in schema.get("required", []):
+        if document.get(field) is None:
+            errors.append(f"{prefix}{field}: required")
+    for field, definition in (schema.get("properties") or {}).items():
+        if field in document:
+            validate_value(document[field], definition, schemas, f"{prefix}{field}", errors, depth)
+    return errors
+
+
+# --- Export ---
+
+def export_collection(db, collection: str, output_dir: str, data_format: str, compression: str, batch_size: int) -> dict:
+    file_name = data_file_name(collection, data_format, compression)
+    path = os.path.join(output_dir, file_name)
+    partial_path = path + ".part"
+
+    documents = 0
+    start = time.perf_counter()
+    if data_format == "bson":
+        # RawBSONDocument: los bytes van de Mongo al fichero sin decodificar
+        source = db.get_collection(collection, codec_options=CodecOptions(document_class=RawBSONDocument))
+    else:
+        source = db[collection]
+
+    with open_writer(partial_path, compression) as writer:
+        cursor = source.find({}, sort=[("_id", 1)], batch_size=batch_size)
+        with cursor:
+            for document in cursor:
+                if data_format == "bson":
+                    writer.write(document.raw)
+                else:
+                    writer.write(json_util.dumps(document, json_options=JSON_OPTIONS).encode("utf-8") + b"\n")
+                documents += 1
+    os.replace(partial_path, path)
+
+    return {
+        "collection": collection,
+        "file": file_name,
+        "documents": documents,
+        "bytes": os.path.getsize(path),
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+
+
+def selected_models(schemas: dict, models_arg: str) -> dict:
+    """{colección: (nombre del schema, schema)} de --models o de todos los schemas del proyecto."""
+    if not models_arg:
+        return {name.lower(): (name, schema) for name, schema in schemas.items()}
+    selected = {}
+    for model in (m.strip() for m in models_arg.split(",") if m.strip()):
+        name, schema = find_schema(schemas, model)
+        if schema is None:
+            raise ValueError(f"Schema '{model}' not found in {SCHEMAS_DIR}")
+        selected[name.lower()] = (name, schema)
+    return selected
+
+
+def export_data(args):
+    require_zstd(args.compress)
+    schemas = load_schemas()
+    models = selected_models(schemas, args.models)
+    mongo_url, database = load_mongo_settings(args.env, args.mongo_url)
+    db = MongoClient(mongo_url)[database]
+
+    existing = set(db.list_collection_names())
+    collections = [c for c in sorted(models) if c in existing]
+    for missing in sorted(set(models) - existing):
+        print(f"  ⏭️  {missing}: no collection in {database}, skipped")
+
+    output_dir = args.output or os.path.join("exports", datetime.datetime.now().strftime("%Y%m%d-%H%M%S"))
+    os.makedirs(output_dir, exist_ok=True)
+    print(f"\n📤 Exporting {len(collections)} collections from {database} to {output_dir} ({args.format}, {args.compress})...")
+
+    results = []
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = {
+            executor.submit(export_collection, db, c, output_dir, args.format, args.compress, args.batch_size): c
+            for c in collections
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"  ❌ {futures[future]}: {e}")
+                continue
+            results.append(result)
+            print(f"  ✅ {result['collection']}: {result['documents']:,} docs, {result['bytes'] / 1e6:.1f} MB in {result['seconds']:.1f}s")
+
+    manifest = {
+        "database": database,
+        "format": args.format,
+        "compression": args.compress,
+        "exported_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "collections": {
+            r["collection"]: {"schema": models[r["collection"]][0], "file": r["file"], "documents": r["documents"]}
+            for r in sorted(results, key=lambda r: r["collection"])
+        },
+    }
+    write_file(os.path.join(output_dir, MANIFEST_NAME), json.dumps(manifest, indent=2))
+
+    elapsed = time.perf_counter() - start
+    total = sum(r["documents"] for r in results)
+    print(f"\n✅ {total:,} documents exported in {elapsed:.1f}s ({total / elapsed if elapsed else 0:,.0f} docs/s)")
+
+
+# --- Import ---
+
+class ImportCheckpoints:
+    """Documentos ya escritos por colección: al relanzar 'laia import' se salta lo ya importado."""
+
+    def __init__(self, path: str, restart: bool = False):
+        self.path = path
+        self.lock = threading.Lock()
+        self.data = {}
+        if not restart and os.path.exists(path):
+            with open(path, "r") as f:
+                self.data = json.load(f)
+
+    def get(self, collection: str) -> dict:
+        return self.data.get(collection, {})
+
+    def update(self, collection: str, **values):
+        with self.lock:
+            self.data.setdefault(collection, {}).update(values)
+            write_file(self.path, json.dumps(self.data, indent=2))
+
+
+def import_collection(db, collection: str, path: str, data_format: str, schema: dict, schemas: dict,
+                      checkpoints: ImportCheckpoints, batch_size: int, validate: bool, drop: bool) -> dict:
+    checkpoint = checkpoints.get(collection)
+    skip = checkpoint.get("offset", 0)
+    if drop and not skip:
+        db.drop_collection(collection)
+
+    stats = {"collection": collection, "written": 0, "rejected": 0, "resumed_at": skip, "samples": []}
+    start = time.perf_counter()
+    target = db[collection]
+    offset = 0
+    batch = []
+
+    def flush():
+        nonlocal batch
+        operations = []
+        for document in batch:
+            errors = validate_document(document, schema, schemas) if validate else []
+            if errors:
+                stats["rejected"] += 1
+                if len(stats["samples"]) < MAX_REJECTED_SAMPLES:
+                    stats["samples"].append({"_id": str(document.get("_id")), "errors": errors})
+                continue
+            # Reemplazo por _id con upsert: reimportar un lote ya escrito no duplica nada
+            operations.append(ReplaceOne({"_id": document["_id"]}, document, upsert=True))
+        if operations:
+            target.bulk_write(operations, ordered=False)
+            stats["written"] += len(operations)
+        checkpoints.update(collection, offset=offset, done=False)
+        batch = []
+
+    for document in iter_documents(path, data_format):
+        offset += 1
+        if offset <= skip:
+            continue
+        batch.append(document)
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+
+    checkpoints.update(collection, offset=offset, done=True)
+    stats["seconds"] = round(time.perf_counter() - start, 3)
+    return stats
+
+
+def import_data(args):
+    manifest_path = os.path.join(args.input, MANIFEST_NAME)
+    if not os.path.exists(manifest_path):
+        print(f"❌ {manifest_path} not found. Point 'laia import' at a directory created by 'laia export'.")
+        return
+    with open(manifest_path, "r") as f:
+        manifest = json.load(f)
+
+    schemas = load_schemas()
+    entries = manifest.get("collections", {})
+    if args.models:
+        wanted = {m.strip().lower() for m in args.models.split(",") if m.strip()}
+        entries = {c: e for c, e in entries.items() if c in wanted}
+
+    mongo_url, database = load_mongo_settings(args.env, args.mongo_url)
+    db = MongoClient(mongo_url)[database]
+    checkpoint_name = f"import_{os.path.basename(os.path.normpath(args.input))}.json"
+    checkpoints = ImportCheckpoints(os.path.join(CHECKPOINTS_DIR, checkpoint_name), restart=args.restart)
+
+    print(f"\n📥 Importing {len(entries)} collections from {args.input} into {database}...")
+    jobs = {}
+    for collection, entry in sorted(entries.items()):
+        if checkpoints.get(collection).get("done"):
+            print(f"  ⏭️  {collection}: already imported (use --restart to import it again)")
+            continue
+        _, schema = find_schema(schemas, entry.get("schema", collection))
+        if schema is None and not args.no_validate:
+            print(f"  ⚠️  {collection}: no schema in {SCHEMAS_DIR}, imported without validation")
+        jobs[collection] = (os.path.join(args.input, entry["file"]), schema)
+
+    total_written = total_rejected = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = {
+            executor.submit(
+                import_collection, db, collection, path, manifest.get("format", "ndjson"), schema or {}, schemas,
+                checkpoints, args.batch_size, not args.no_validate and schema is not None, args.drop,
+            ): collection
+            for collection, (path, schema) in jobs.items()
+        }
+        for future in as_completed(futures):
+            collection = futures[future]
+            try:
+                stats = future.result()
+            except Exception as e:
+                print(f"  ❌ {collection}: {e}. Run the command again to resume from the last written batch.")
+                continue
+            total_written += stats["written"]
+            total_rejected += stats["rejected"]
+            resumed = f", resumed at {stats['resumed_at']:,}" if stats["resumed_at"] else ""
+            print(f"  ✅ {collection}: {stats['written']:,} written, {stats['rejected']:,} rejected in {stats['seconds']:.1f}s{resumed}")
+            for sample in stats["samples"][:3]:
+                print(f"     ↳ {sample['_id']}: {'; '.join(sample['errors'][:3])}")
+
+    elapsed = time.perf_counter() - start
+    print(f"\n✅ {total_written:,} documents imported in {elapsed:.1f}s ({total_written / elapsed if elapsed else 0:,.0f} docs/s)")
+    if total_rejected:
+        print(f"⚠️  {total_rejected:,} documents did not match their schema and were not imported.")
@@ -0,0 +1,214 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import subprocess
+import sys
+import time
+
+from laia_cli.generators.backoffice.angular.auth.auth_component_ts import modify_auth_component_ts
+from laia_cli.generators.backoffice.angular.auth.new_user_html import modify_new_user_component_html
+from laia_cli.generators.backoffice.angular.models.model_generator import (
+    INTERFACES_DIR,
+    generate_model_components,
+    model_components_exist,
+    regenerate_model_artifacts,
+)
+from laia_cli.generators.backoffice.angular.models.models_component_ts import modify_models_component_ts
+from laia_cli.generators.backoffice.angular.route_to_app_routing import collect_routes
+from laia_cli.generators.files_generator import report_write_stats, reset_write_stats, virtual_file_tree
+from laia_cli.generators.generate_ts_interface import generate_ts_interface_from_yaml
+
+SCHEMAS_DIR = "backend/openapi/schemas"
+
+# Cambios seguidos (editores que guardan en varios pasos) se agrupan en una sola regeneración
+DEBOUNCE_SECONDS = 0.3
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+INOTIFY_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+INOTIFY_EVENT = struct.Struct("iIII")
+
+
+def is_schema_file(filename: str) -> bool:
+    return filename.endswith(".yaml") or filename.endswith(".yml")
+
+
+class InotifyWatcher:
+    """Watcher basado en inotify (Linux) usando libc vía ctypes, sin dependencias externas."""
+
+    def __init__(self, path: str):
+        libc_name = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or not libc_name:
+            raise OSError("inotify is not available on this platform")
+
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available on this platform")
+
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self.fd, os.fsencode(path), INOTIFY_MASK) < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path}")
+
+    def _read_names(self) -> set:
+        names = set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return names
+
+        offset = 0
+        while offset + INOTIFY_EVENT.size <= len(data):
+            _, _, _, name_len = INOTIFY_EVENT.unpack_from(data, offset)
+            offset += INOTIFY_EVENT.size
+            name = data[offset:offset + name_len].rstrip(b"\0").decode()
+            offset += name_len
+            if is_schema_file(name):
+                names.add(name)
+        return names
+
+    def wait(self, timeout: float = None) -> set:
+        """Bloquea hasta que haya cambios y devuelve los nombres de fichero afectados."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        names = self._read_names()
+        # Esperamos a que el editor termine de escribir antes de regenerar
+        while select.select([self.fd], [], [], DEBOUNCE_SECONDS)[0]:
+            names |= self._read_names()
+        return names
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Alternativa portable: compara (mtime, size) de los schemas cada 'interval' segundos."""
+
+    def __init__(self, path: str, interval: float = 1.0):
+        self.path = path
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self) -> dict:
+        snapshot = {}
+        for entry in os.scandir(self.path):
+            if entry.is_file() and is_schema_file(entry.name):
+                stat = entry.stat()
+                snapshot[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def wait(self, timeout: float = None) -> set:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            time.sleep(self.interval)
+            current = self._scan()
+            names = {
+                name for name in set(current) | set(self.snapshot)
+                if current.get(name) != self.snapshot.get(name)
+            }
+            self.snapshot = current
+            if names or (deadline is not None and time.monotonic() >= deadline):
+                return names
+
+    def close(self):
+        pass
+
+
+def create_watcher(path: str, force_polling: bool = False, interval: float = 1.0):
+    if not force_polling:
+        try:
+            watcher = InotifyWatcher(path)
+            print(f"👀 Watching {path} (inotify)")
+            return watcher
+        except OSError:
+            pass
+    print(f"👀 Watching {path} (polling every {interval}s)")
+    return PollingWatcher(path, interval)
+
+
+def regenerate_schema(filename: str, tree=None) -> bool:
+    """Regenera solo los artefactos del schema indicado. Devuelve True si cambia la lista de modelos."""
+    schema_path = os.path.join(SCHEMAS_DIR, filename)
+    model_name = os.path.splitext(filename)[0]
+
+    if not os.path.exists(schema_path):
+        print(f"🗑️  Schema {filename} eliminado: los componentes de {model_name} se mantienen, bórralos manualmente si ya no se usan.")
+        return True
+
+    if model_name == "User":
+        generate_ts_interface_from_yaml(schema_path, INTERFACES_DIR)
+        modify_auth_component_ts(schema_path)
+        modify_new_user_component_html(schema_path)
+        return False
+
+    if not model_components_exist(model_name):
+        if tree is not None:
+            # 'ng generate' trabaja sobre el disco: volcamos antes lo pendiente del ciclo
+            tree.flush()
+        generate_model_components(model_name, schema_path)
+        return True
+
+    regenerate_model_artifacts(model_name, schema_path)
+    return False
+
+
+def start_ng_serve():
+    env = os.environ.copy()
+    env["NG_CLI_ANALYTICS"] = "ci"
+    return subprocess.Popen(["ng", "serve"], cwd="backoffice", env=env)
+
+
+def dev_watch(args):
+    if not os.path.isdir(SCHEMAS_DIR):
+        print(f"❌ {SCHEMAS_DIR} not found. Run this command from the root of a LAIA project.")
+        return
+
+    if not os.path.exists(os.path.join("backoffice", "angular.json")):
+        print("❌ No Angular backoffice found. Create it first with 'laia start --backoffice'.")
+        return
+
+    server = start_ng_serve() if args.serve else None
+    watcher = create_watcher(SCHEMAS_DIR, force_polling=args.poll, interval=args.interval)
+
+    try:
+        while True:
+            changed = watcher.wait()
+            reset_write_stats()
+            models_changed = False
+            # Cada ciclo se genera en memoria y se vuelca de una vez: ng serve ve un único cambio
+            with virtual_file_tree() as tree:
+                for filename in sorted(changed):
+                    print(f"\n🔄 {filename} changed, regenerating...")
+                    start = time.perf_counter()
+                    snapshot = tree.snapshot()
+                    try:
+                        # Rutas por schema: solo llegan al árbol si su regeneración termina
+                        with collect_routes():
+                            models_changed |= regenerate_schema(filename, tree)
+                    except Exception as e:
+                        # Un YAML a medio editar no debe tumbar el watcher ni dejar su modelo a medias
+                        tree.restore(snapshot)
+                        print(f"❌ Error regenerating {filename}: {e}")
+                        continue
+                    print(f"✅ {filename} regenerated in {time.perf_counter() - start:.2f}s")
+
+                if models_changed:
+                    modify_models_component_ts()
+            tree.flush()
+            if changed:
+                report_write_stats()
+    except KeyboardInterrupt:
+        print("\nStopping watcher...")
+    finally:
+        watcher.close()
+        if server is not None:
+            server.terminate()
@@ -1,15 +1,58 @@
+import json
 import os
 import yaml
 
-from laia_cli.generators.files_generator import create_file
+from laia_cli.commands.answers import load_answers_file
+from laia_cli.generators.files_generator import report_write_stats, write_file
+from laia_cli.generators.schema_inference import infer_schemas_from_mongo
 
-def generate_schema():
-    print("\n📦 Generating new OpenAPI schema...")
+def parse_property_flag(value: str) -> tuple:
+    """Convierte 'name:type[:description]' en (name, {type, description})."""
+    parts = value.split(":", 2)
+    if len(parts) < 2 or not parts[0].strip() or not parts[1].strip():
+        raise ValueError(f"Invalid property '{value}', expected NAME:TYPE[:DESCRIPTION]")
+    description = parts[2].strip() if len(parts) == 3 else ""
+    return parts[0].strip(), {"type": parts[1].strip(), "description": description}
+
+def parse_property_answer(name: str, prop) -> dict:
+    """Propiedad del fichero de respuestas: {type, description} o solo el tipo ('title: string')."""
+    if isinstance(prop, str) and prop.strip():
+        return {"type": prop.strip(), "description": ""}
+    if isinstance(prop, dict):
+        return {"type": prop.get("type", "string"), "description": prop.get("description", "")}
+    raise ValueError(f"Invalid property '{name}': expected a type string or a mapping with 'type' and 'description'")
+
+def collect_schema_answers(args=None) -> dict:
+    """Resuelve nombre, auth y propiedades desde flags o fichero de respuestas; None si hay que preguntar."""
+    answers = {}
+    if args is not None and getattr(args, "answers", None):
+        answers.update(load_answers_file(args.answers))
+
+    if args is not None:
+        if getattr(args, "name", None):
+            answers["name"] = args.name
+        if getattr(args, "auth", None) is not None:
+            answers["auth"] = args.auth
+        if getattr(args, "property", None):
+            answers["properties"] = dict(parse_property_flag(p) for p in args.property)
+
+    if not answers.get("name"):
+        return None
+
+    properties = answers.get("properties") or {}
+    if isinstance(properties, list):
+        properties = dict(parse_property_flag(p) for p in properties)
 
+    return {
+        "name": str(answers["name"]).strip(),
+        "auth": bool(answers.get("auth", False)),
+        "properties": {name: parse_property_answer(name, prop) for name, prop in properties.items()},
+    }
+
+def prompt_schema_answers() -> dict:
     schema_name = input("Schema name (e.g. User): ").strip()
     if not schema_name:
-        print("❌ Schema name is required.")
-        return
+        return None
 
     use_auth = input("Require auth? [y/N]: ").strip().lower() == "y"
 
@@ -29,15 +72,61 @@ def generate_schema():
             "description": description
         }
 
+    return {"name": schema_name, "auth": use_auth, "properties": properties}
+
+def default_mongo_url() -> str:
+    """URL de Mongo de config/dev.json si estamos en un proyecto LAIA; localhost en otro caso."""
+    config_path = os.path.join("config", "dev.json")
+    if os.path.exists(config_path):
+        with open(config_path, "r") as f:
+            return json.load(f).get("mongo", {}).get("url", "mongodb://localhost:27017")
+    return "mongodb://localhost:27017"
+
+def generate_schemas_from_mongo(args):
+    mongo_url = args.mongo_url or default_mongo_url()
+    collections = [c.strip() for c in args.collections.split(",") if c.strip()] if args.collections else None
+
+    print(f"\n📦 Inferring schemas from {mongo_url} / {args.from_mongo} (sample size {args.sample_size})...")
+    results = infer_schemas_from_mongo(
+        mongo_url,
+        args.from_mongo,
+        os.path.join("backend", "openapi", "schemas"),
+        sample_size=args.sample_size,
+        workers=args.workers,
+        collections=collections,
+        force=args.force,
+    )
+
+    report_write_stats()
+    written = sum(1 for r in results if not r["skipped"])
+    print(f"\n✅ {written} schemas generated, {len(results) - written} skipped.")
+
+def generate_schema(args=None):
+    if args is not None and getattr(args, "from_mongo", None):
+        generate_schemas_from_mongo(args)
+        return
+
+    print("\n📦 Generating new OpenAPI schema...")
+
+    answers = collect_schema_answers(args)
+    if answers is None and not (args is not None and getattr(args, "non_interactive", False)):
+        answers = prompt_schema_answers()
+
+    if not answers:
+        print("❌ Schema name is required.")
+        return
+
+    schema_name = answers["name"]
+
     # Generar el contenido YAML
     schema = {
         schema_name: {
             "type": "object",
-            "properties": properties
+            "properties": answers["properties"]
         }
     }
 
-    if use_auth:
+    if answers["auth"]:
         schema[schema_name]["x-auth"] = True
 
     # Crear archivo en backend/openapi/schemas
@@ -46,7 +135,6 @@ def generate_schema():
 
     output_path = os.path.join(output_dir, f"{schema_name}.yaml")
 
-    with open(output_path, "w") as f:
-        yaml.dump(schema, f, sort_keys=False)
+    write_file(output_path, yaml.dump(schema, sort_keys=False))
 
-    print(f"\n✅ Schema {schema_name} created at {output_path}")
\ No newline at end of file
+    print(f"\n✅ Schema {schema_name} created at {output_path}")
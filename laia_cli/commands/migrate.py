@@ -0,0 +1,283 @@
+import datetime
+import hashlib
+import json
+import os
+import time
+
+from pymongo import MongoClient, UpdateMany
+
+from laia_cli.commands.seed import load_mongo_settings, load_schemas
+
+# Estado de las migraciones en la propia base de datos: cada entorno sabe qué se le ha aplicado
+MIGRATIONS_COLLECTION = "_laia_migrations"
+SNAPSHOT_ID = "snapshot"
+# Ritmo supuesto para la estimación del dry-run si aún no se ha aplicado ninguna migración
+ASSUMED_DOCS_PER_SECOND = 5000
+
+# Tipo del schema → (to de $convert, tipos BSON que ya lo cumplen)
+CONVERSIONS = {
+    "string": ("string", ["string"]),
+    "integer": ("long", ["int", "long"]),
+    "number": ("double", ["double", "int", "long", "decimal"]),
+    "boolean": ("bool", ["bool"]),
+    "date-time": ("date", ["date"]),
+    "date": ("date", ["date"]),
+}
+
+
+def property_type(definition: dict):
+    if not isinstance(definition, dict) or "$ref" in definition:
+        return None
+    if definition.get("type") == "string" and definition.get("format") in ("date", "date-time"):
+        return definition["format"]
+    return definition.get("type")
+
+
+def diff_schemas(applied: dict, current: dict, unset_removed: bool = False) -> list:
+    """
+    Pasos de migración entre el snapshot aplicado y los schemas actuales, por colección:
+      - rename:   propiedad nueva con 'x-renamed-from: <antigua>'
+      - default:  propiedad nueva con 'default' → se rellena donde falte
+      - convert:  cambio de tipo (string, integer, number, boolean, fechas) o de escalar a array
+      - unset:    propiedad eliminada (solo con --unset-removed)
+    Lo que no se puede rellenar solo (required sin default, modelos eliminados) va como 'warning'.
+    """
+    steps = []
+    applied_lower = {name.lower(): schema for name, schema in applied.items()}
+    current_lower = {name.lower(): schema for name, schema in current.items()}
+
+    for collection in sorted(set(applied_lower) - set(current_lower)):
+        steps.append({"collection": collection, "action": "warning", "message": "model removed, collection left untouched"})
+
+    for collection, schema in sorted(current_lower.items()):
+        previous = applied_lower.get(collection)
+        if previous is None:
+            continue
+        old_props = previous.get("properties") or {}
+        new_props = schema.get("properties") or {}
+        renamed_from = set()
+
+        for field, definition in new_props.items():
+            if not isinstance(definition, dict):
+                continue
+            old_name = definition.get("x-renamed-from")
+            if old_name and old_name in old_props and field not in old_props:
+                renamed_from.add(old_name)
+                steps.append({"collection": collection, "action": "rename", "field": old_name, "to": field})
+                old_definition = old_props[old_name]
+            elif field in old_props:
+                old_definition = old_props[field]
+            else:
+                if "default" in definition:
+                    steps.append({"collection": collection, "action": "default", "field": field, "value": definition["default"]})
+                elif field in (schema.get("required") or []):
+                    steps.append({"collection": collection, "action": "warning",
+                                  "message": f"'{field}' is required and has no default: existing documents will not have it"})
+                continue
+
+            old_type, new_type = property_type(old_definition), property_type(definition)
+            if old_type == new_type or new_type is None:
+                continue
+            if new_type == "array" and old_type in CONVERSIONS:
+                steps.append({"collection": collection, "action": "wrap", "field": field})
+            elif new_type in CONVERSIONS and (old_type in CONVERSIONS or old_type is None):
+                steps.append({"collection": collection, "action": "convert", "field": field, "from": old_type, "to": new_type})
+            else:
+                steps.append({"collection": collection, "action": "warning",
+                              "message": f"'{field}' changed from {old_type} to {new_type}: no automatic conversion"})
+
+        for field in old_props:
+            if field in new_props or field in renamed_from:
+                continue
+            if unset_removed:
+                steps.append({"collection": collection, "action": "unset", "field": field})
+            else:
+                steps.append({"collection": collection, "action": "warning",
+                              "message": f"'{field}' removed from the schema (use --unset-removed to delete it from documents)"})
+    return steps
+
+
+def step_operation(step: dict) -> tuple:
+    """(filtro, update) de un paso. Los updates con pipeline permiten convertir usando el valor actual."""
+    field = step.get("field")
+    action = step["action"]
+    if action == "rename":
+        return {field: {"$exists": True}}, {"$rename": {field: step["to"]}}
+    if action == "default":
+        return {field: {"$exists": False}}, {"$set": {field: step["value"]}}
+    if action == "unset":
+        return {field: {"$exists": True}}, {"$unset": {field: ""}}
+    if action == "wrap":
+        return {field: {"$exists": True, "$not": {"$type": "array"}}}, [{"$set": {field: {"$cond": [{"$eq": [f"${field}", None]}, [], [f"${field}"]]}}}]
+    if action == "convert":
+        target, accepted = CONVERSIONS[step["to"]]
+        # onError: si un valor no se puede convertir se deja como estaba
+        convert = {"$convert": {"input": f"${field}", "to": target, "onError": f"${field}", "onNull": None}}
+        return {field: {"$exists": True, "$ne": None, "$not": {"$type": accepted}}}, [{"$set": {field: convert}}]
+    raise ValueError(f"Unknown migration action {action}")
+
+
+def encode_schemas(schemas: dict) -> str:
+    # Como texto: los schemas tienen claves '$ref' que Mongo no admite bien como nombres de campo
+    return json.dumps(schemas, sort_keys=True, default=str)
+
+
+def plan_id(steps: list) -> str:
+    return hashlib.sha1(json.dumps(steps, sort_keys=True, default=str).encode()).hexdigest()[:12]
+
+
+def describe_step(step: dict) -> str:
+    action = step["action"]
+    if action == "rename":
+        return f"rename '{step['field']}' → '{step['to']}'"
+    if action == "default":
+        return f"set '{step['field']}' = {step['value']!r} where missing"
+    if action == "unset":
+        return f"remove '{step['field']}'"
+    if action == "wrap":
+        return f"wrap '{step['field']}' into an array"
+    if action == "convert":
+        return f"convert '{step['field']}' {step['from'] or '?'} → {step['to']}"
+    return f"⚠️  {step['message']}"
+
+
+def grouped_steps(steps: list) -> dict:
+    groups = {}
+    for step in steps:
+        if step["action"] != "warning":
+            groups.setdefault(step["collection"], []).append(step)
+    return groups
+
+
+def pending_filter(collection_steps: list) -> dict:
+    filters = [step_operation(step)[0] for step in collection_steps]
+    return filters[0] if len(filters) == 1 else {"$or": filters}
+
+
+def migrate_collection(db, state, collection: str, collection_steps: list, batch_size: int, max_rate: float) -> dict:
+    """
+    Recorre por _id los documentos afectados por algún paso y aplica, lote a lote, un bulk_write
+    ordenado con un UpdateMany por paso restringido a los _id del lote. Tras cada lote guarda el
+    último _id en _laia_migrations, así que una ejecución cortada continúa donde se quedó.
+    """
+    operations = [step_operation(step) for step in collection_steps]
+    progress = state.find_one({"_id": f"progress:{collection}"}) or {}
+    query = pending_filter(collection_steps)
+    if progress.get("last_id") is not None:
+        query = {"$and": [query, {"_id": {"$gt": progress["last_id"]}}]}
+        print(f"  ↪️  {collection}: resuming after {progress['last_id']}")
+
+    stats = {"documents": progress.get("documents", 0), "modified": progress.get("modified", 0)}
+    start = time.perf_counter()
+    ids = []
+
+    def flush():
+        nonlocal ids
+        batch_start = time.perf_counter()
+        requests = [UpdateMany({"$and": [{"_id": {"$in": ids}}, step_filter]}, update) for step_filter, update in operations]
+        result = db[collection].bulk_write(requests, ordered=True)
+        stats["documents"] += len(ids)
+        stats["modified"] += result.modified_count
+        state.update_one(
+            {"_id": f"progress:{collection}"},
+            {"$set": {"last_id": ids[-1], "documents": stats["documents"], "modified": stats["modified"]}},
+            upsert=True,
+        )
+        ids = []
+        if max_rate:
+            # Throttle: cada lote tarda al menos batch_size / max_rate segundos
+            remaining = batch_size / max_rate - (time.perf_counter() - batch_start)
+            if remaining > 0:
+                time.sleep(remaining)
+
+    cursor = db[collection].find(query, {"_id": 1}, sort=[("_id", 1)], batch_size=batch_size)
+    with cursor:
+        for document in cursor:
+            ids.append(document["_id"])
+            if len(ids) >= batch_size:
+                flush()
+    if ids:
+        flush()
+
+    stats["seconds"] = time.perf_counter() - start
+    return stats
+
+
+def migrate(args):
+    if os.path.exists("laia.json"):
+        with open("laia.json", "r", encoding="utf-8") as f:
+            database_engine = json.load(f).get("database", "MongoDB")
+        if database_engine != "MongoDB":
+            print(f"❌ 'laia migrate' runs MongoDB bulk writes, this project uses {database_engine}.")
+            return
+
+    current = load_schemas()
+    if args.models:
+        wanted = {m.strip().lower() for m in args.models.split(",") if m.strip()}
+        current = {name: schema for name, schema in current.items() if name.lower() in wanted}
+
+    mongo_url, database = load_mongo_settings(args.env, args.mongo_url)
+    db = MongoClient(mongo_url)[database]
+    state = db[MIGRATIONS_COLLECTION]
+
+    snapshot = state.find_one({"_id": SNAPSHOT_ID})
+    if snapshot is None:
+        if args.dry_run:
+            print("ℹ️  No applied snapshot yet: the first 'laia migrate' only records the current schemas.")
+            return
+        state.replace_one({"_id": SNAPSHOT_ID}, {"schemas": encode_schemas(current), "applied_at": datetime.datetime.now(datetime.timezone.utc)}, upsert=True)
+        print(f"✅ Baseline recorded for {len(current)} schemas in {database}.{MIGRATIONS_COLLECTION}. Nothing to migrate.")
+        return
+
+    applied = json.loads(snapshot.get("schemas") or "{}")
+    if args.models:
+        applied = {name: schema for name, schema in applied.items() if name.lower() in wanted}
+    steps = diff_schemas(applied, current, unset_removed=args.unset_removed)
+    if not steps:
+        print("✅ Schemas match the applied snapshot. Nothing to migrate.")
+        return
+
+    current_plan = plan_id(steps)
+    groups = grouped_steps(steps)
+    rate = args.max_rate or snapshot.get("docs_per_second") or ASSUMED_DOCS_PER_SECOND
+
+    print(f"\n🧭 Migration plan {current_plan} for {database}:")
+    total_estimate = 0
+    for collection in sorted({step["collection"] for step in steps}):
+        print(f"  {collection}")
+        for step in (s for s in steps if s["collection"] == collection):
+            print(f"    - {describe_step(step)}")
+        if args.dry_run and collection in groups:
+            count = db[collection].count_documents(pending_filter(groups[collection]))
+            total_estimate += count
+            print(f"    ≈ {count:,} documents, ~{count / rate:.1f}s")
+
+    if args.dry_run:
+        source = "--max-rate" if args.max_rate else ("last migration" if snapshot.get("docs_per_second") else "assumed")
+        print(f"\n📋 Dry run: {total_estimate:,} documents, ~{total_estimate / rate:.1f}s at {rate:,.0f} docs/s ({source}). Nothing written.")
+        return
+
+    # Un plan distinto al que se estaba aplicando invalida el progreso guardado
+    if snapshot.get("plan") != current_plan:
+        state.delete_many({"_id": {"$regex": "^progress:"}})
+        state.update_one({"_id": SNAPSHOT_ID}, {"$set": {"plan": current_plan}})
+
+    total_documents = 0
+    start = time.perf_counter()
+    for collection, collection_steps in sorted(groups.items()):
+        stats = migrate_collection(db, state, collection, collection_steps, args.batch_size, args.max_rate)
+        total_documents += stats["documents"]
+        print(f"  ✅ {collection}: {stats['documents']:,} documents, {stats['modified']:,} modified in {stats['seconds']:.1f}s")
+
+    elapsed = time.perf_counter() - start
+    docs_per_second = total_documents / elapsed if elapsed > 0 and total_documents else snapshot.get("docs_per_second")
+    state.delete_many({"_id": {"$regex": "^progress:"}})
+    # Con --models solo se actualizan en el snapshot los modelos migrados
+    schemas = {**json.loads(snapshot.get("schemas") or "{}"), **current} if args.models else current
+    state.replace_one(
+        {"_id": SNAPSHOT_ID},
+        {"schemas": encode_schemas(schemas), "applied_at": datetime.datetime.now(datetime.timezone.utc),
+         "plan": None, "docs_per_second": docs_per_second},
+        upsert=True,
+    )
+    print(f"\n✅ Migration {current_plan} applied: {total_documents:,} documents in {elapsed:.1f}s. Snapshot updated.")
@@ -0,0 +1,282 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+import yaml
+from bson import json_util
+from pymongo import MongoClient
+
+from laia_cli.generators.files_generator import write_file
+
+SCHEMAS_DIR = os.path.join("backend", "openapi", "schemas")
+CHECKPOINT_PATH = os.path.join(".laia", "ontology_sync_full.json")
+
+XSD = "http://www.w3.org/2001/XMLSchema#"
+# Caracteres de control (U+0000–U+001F, U+007F): \uXXXX, salvo los que tienen escape corto
+NT_ESCAPES = str.maketrans({
+    **{chr(code): f"\\u{code:04X}" for code in [*range(0x20), 0x7F]},
+    "\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r", "\t": "\\t",
+})
+
+
+def load_project_config(env: str) -> dict:
+    config_path = os.path.join("config", f"{env}.json")
+    if not os.path.exists(config_path):
+        raise FileNotFoundError(f"{config_path} not found. Run this command from the root of a LAIA project.")
+    with open(config_path, "r") as f:
+        return json.load(f)
+
+
+def load_ontology_contexts(schemas_dir: str = SCHEMAS_DIR) -> dict:
+    """{colección: {campo: IRI}} a partir de las propiedades x_ontology de los schemas."""
+    contexts = {}
+    for filename in sorted(os.listdir(schemas_dir)):
+        if not filename.endswith((".yaml", ".yml")):
+            continue
+        with open(os.path.join(schemas_dir, filename), "r") as f:
+            content = yaml.safe_load(f) or {}
+        for name, schema in content.items():
+            properties = schema.get("properties", {}) if isinstance(schema, dict) else {}
+            context = {
+                prop: definition["x_ontology"]
+                for prop, definition in properties.items()
+                if isinstance(definition, dict) and "x_ontology" in definition
+            }
+            if context:
+                contexts[name.lower()] = context
+    return contexts
+
+
+def nt_literal(value) -> str:
+    """Mismo criterio que laia_ontology_sync.rdf_mapper.to_literal, escrito directamente en N-Triples."""
+    if isinstance(value, bool):
+        return f'"{str(value).lower()}"^^<{XSD}boolean>'
+    if isinstance(value, int):
+        return f'"{value}"^^<{XSD}integer>'
+    if isinstance(value, float):
+        return f'"{value!r}"^^<{XSD}decimal>'
+    return f'"{str(value).translate(NT_ESCAPES)}"'
+
+
+def document_to_ntriples(document: dict, context: dict, base_uri: str) -> list:
+    subject = f"<{base_uri}{document['_id']}>"
+    lines = []
+    for field, iri in context.items():
+        if field not in document:
+            continue
+        value = document[field]
+        for item in (value if isinstance(value, list) else [value]):
+            lines.append(f"{subject} <{iri}> {nt_literal(item)} .\n")
+    return lines
+
+
+class FusekiClient:
+    def __init__(self, base_url: str, user: str, pwd: str):
+        self.base_url = base_url.rstrip("/")
+        self.session_auth = (user, pwd)
+        self.local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        # requests.Session no es seguro entre hilos: una por hilo del pool
+        if not hasattr(self.local, "session"):
+            self.local.session = requests.Session()
+            self.local.session.auth = self.session_auth
+        return self.local.session
+
+    def ensure_dataset(self, dataset: str):
+        if self.session.get(f"{self.base_url}/{dataset}").status_code == 200:
+            return
+        response = self.session.post(f"{self.base_url}/$/datasets", data={"dbName": dataset, "dbType": "tdb2"})
+        if response.status_code not in (200, 201):
+            raise RuntimeError(f"Fuseki dataset create failed [{response.status_code}]: {response.text}")
+
+    def clear(self, dataset: str):
+        response = self.session.post(
+            f"{self.base_url}/{dataset}/update",
+            data=b"CLEAR DEFAULT",
+            headers={"Content-Type": "application/sparql-update"},
+        )
+        response.raise_for_status()
+
+    def upload(self, dataset: str, data: bytes):
+        # Graph Store Protocol: las N-Triples se cargan tal cual, sin pasar por SPARQL
+        response = self.session.post(
+            f"{self.base_url}/{dataset}/data?default",
+            data=data,
+            headers={"Content-Type": "application/n-triples"},
+        )
+        if not (200 <= response.status_code < 300):
+            raise RuntimeError(f"Fuseki upload failed [{response.status_code}]: {response.text}")
+
+
+class Checkpoints:
+    """Progreso por colección ({done, last_id}) para poder relanzar el comando sin empezar de cero."""
+
+    def __init__(self, path: str, restart: bool = False):
+        self.path = path
+        self.lock = threading.Lock()
+        self.data = {}
+        if not restart and os.path.exists(path):
+            with open(path, "r") as f:
+                self.data = json.load(f)
+
+    def get(self, collection: str) -> dict:
+        return self.data.get(collection, {})
+
+    def update(self, collection: str, **values):
+        with self.lock:
+            self.data.setdefault(collection, {}).update(values)
+            write_file(self.path, json.dumps(self.data, indent=2))
+
+
+def sync_collection(db, fuseki: FusekiClient, checkpoints: Checkpoints, executor: ThreadPoolExecutor,
+                    collection: str, context: dict, base_uri_prefix: str, batch_size: int,
+                    chunk_size: int, max_in_flight: int, clear: bool) -> dict:
+    dataset = collection.lower()
+    base_uri = f"{base_uri_prefix.rstrip('/')}/{collection}/"
+    fuseki.ensure_dataset(dataset)
+
+    checkpoint = checkpoints.get(collection)
+    query = {}
+    if checkpoint.get("last_id") is not None:
+        # Extended JSON: conserva el tipo del _id (ObjectId, int, str...) entre ejecuciones
+        last_id = json_util.loads(json.dumps(checkpoint["last_id"]))
+        query = {"_id": {"$gt": last_id}}
+        print(f"  ↪️  {collection}: resuming after {last_id}")
+    elif clear:
+        fuseki.clear(dataset)
+
+    projection = {field: 1 for field in context}
+    cursor = db[collection].find(query, projection).sort("_id", 1).batch_size(batch_size)
+
+    # Los trozos se suben en paralelo pero el checkpoint solo avanza por trozos consecutivos terminados
+    slots = threading.BoundedSemaphore(max_in_flight)
+    progress_lock = threading.Lock()
+    finished = {}
+    next_to_commit = [0]
+    errors = []
+    totals = {"documents": 0, "triples": 0, "bytes": 0}
+
+    def upload(seq: int, data: bytes, last_id, documents: int, triples: int):
+        try:
+            fuseki.upload(dataset, data)
+            with progress_lock:
+                finished[seq] = last_id
+                totals["documents"] += documents
+                totals["triples"] += triples
+                totals["bytes"] += len(data)
+                while next_to_commit[0] in finished:
+                    checkpoints.update(collection, last_id=json.loads(json_util.dumps(finished.pop(next_to_commit[0]))), done=False)
+                    next_to_commit[0] += 1
+        except Exception as e:
+            errors.append(e)
+        finally:
+            slots.release()
+
+    seq = 0
+    lines = []
+    documents = 0
+    last_id = None
+    futures = []
+
+    def submit():
+        nonlocal seq, lines, documents
+        slots.acquire()
+        data = "".join(lines).encode("utf-8")
+        futures.append(executor.submit(upload, seq, data, last_id, documents, len(lines)))
+        seq += 1
+        lines = []
+        documents = 0
+
+    for document in cursor:
+        if errors:
+            break
+        lines.extend(document_to_ntriples(document, context, base_uri))
+        documents += 1
+        last_id = document["_id"]
+        if documents >= chunk_size:
+            submit()
+    if documents and not errors:
+        submit()
+
+    for future in futures:
+        future.result()
+
+    if errors:
+        raise errors[0]
+
+    checkpoints.update(collection, done=True)
+    return totals
+
+
+def format_rate(count: float, elapsed: float) -> str:
+    return f"{count / elapsed:,.0f}/s" if elapsed > 0 else "-"
+
+
+def ontology_sync_full(args):
+    config = load_project_config(args.env)
+    fuseki_config = config.get("fuseki")
+    if not fuseki_config:
+        print(f"❌ No 'fuseki' section in config/{args.env}.json. Is ontology enabled for this project?")
+        return
+
+    contexts = load_ontology_contexts()
+    if args.collections:
+        allowlist = {c.strip() for c in args.collections.split(",") if c.strip()}
+        contexts = {coll: ctx for coll, ctx in contexts.items() if coll in allowlist}
+    if not contexts:
+        print("ℹ️  No schema has x_ontology properties, nothing to sync.")
+        return
+
+    mongo_url = config.get("mongo", {}).get("url", "mongodb://localhost:27017")
+    db = MongoClient(mongo_url)[config.get("mongo", {}).get("database", "test")]
+    base_uri_prefix = config.get("server", {}).get("base_uri_prefix", "http://localhost:8005")
+    fuseki = FusekiClient(fuseki_config.get("base_url", "http://localhost:3030"), fuseki_config.get("user", ""), fuseki_config.get("password", ""))
+    checkpoints = Checkpoints(CHECKPOINT_PATH, restart=args.restart)
+
+    print(f"\n🔄 Full ontology sync of {len(contexts)} collections into {fuseki.base_url} ({args.workers} upload workers)...")
+    grand_total = {"documents": 0, "triples": 0, "bytes": 0}
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        for collection, context in sorted(contexts.items()):
+            if checkpoints.get(collection).get("done"):
+                print(f"  ⏭️  {collection}: already synced (use --restart to sync it again)")
+                continue
+
+            collection_start = time.perf_counter()
+            try:
+                totals = sync_collection(
+                    db, fuseki, checkpoints, executor, collection, context, base_uri_prefix,
+                    batch_size=args.batch_size, chunk_size=args.chunk_size,
+                    max_in_flight=args.workers * 2, clear=args.clear,
+                )
+            except Exception as e:
+                print(f"  ❌ {collection}: {e}. Run the command again to resume from the last uploaded chunk.")
+                continue
+
+            elapsed = time.perf_counter() - collection_start
+            for key in grand_total:
+                grand_total[key] += totals[key]
+            print(
+                f"  ✅ {collection}: {totals['documents']:,} docs, {totals['triples']:,} triples, "
+                f"{totals['bytes'] / 1e6:.1f} MB in {elapsed:.1f}s "
+                f"({format_rate(totals['documents'], elapsed)} docs, {format_rate(totals['triples'], elapsed)} triples)"
+            )
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"\n✅ {grand_total['documents']:,} docs / {grand_total['triples']:,} triples in {elapsed:.1f}s "
+        f"({format_rate(grand_total['triples'], elapsed)} triples, {grand_total['bytes'] / 1e6 / elapsed if elapsed else 0:.1f} MB/s)"
+    )
+
+
+def ontology_sync(args):
+    if not args.full:
+        print("⚠️  Incremental sync runs inside the backend. Use 'laia ontology sync --full' for a bulk load.")
+        return
+    ontology_sync_full(args)
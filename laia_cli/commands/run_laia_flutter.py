@@ -27,7 +27,7 @@ async def run_command(command, cwd=None):
     return await process.wait()
 
 
-async def run_laia_flutter(openapi_path, backend_folder_name, frontend_folder_name):
+def find_flutter():
     flutter_bin = os.path.expandvars("$HOME/flutter/bin/flutter")
     flutter_path = shutil.which("flutter")
 
@@ -38,8 +38,11 @@ async def run_laia_flutter(openapi_path, backend_folder_name, frontend_folder_na
 
     if flutter_path is None:
         print("❌ Flutter no está instalado ni disponible en $HOME/flutter/bin/flutter")
-        return
+    return flutter_path
+
 
+async def generate_laia_flutter(flutter_path, openapi_path, backend_folder_name, frontend_folder_name) -> bool:
+    """Genera la app Flutter desde el OpenAPI y ejecuta build_runner."""
     laia_config_path = os.path.join(os.getcwd(), "laia.json")
     with open(laia_config_path, "r", encoding="utf-8") as f:
         laia_config = json.load(f)
@@ -53,7 +56,37 @@ async def run_laia_flutter(openapi_path, backend_folder_name, frontend_folder_na
     )
     if code != 0:
         print("❌ Error en build_runner")
+        return False
+    return True
+
+
+async def run_laia_flutter(openapi_path, backend_folder_name, frontend_folder_name):
+    flutter_path = find_flutter()
+    if flutter_path is None:
+        return
+
+    if not await generate_laia_flutter(flutter_path, openapi_path, backend_folder_name, frontend_folder_name):
         return
 
     print("Ejecutando flutter run...")
     await run_command([flutter_path, "run", "-d", "chrome"], cwd=frontend_folder_name)
+
+
+async def build_laia_flutter_web(openapi_path, backend_folder_name, frontend_folder_name, base_href: str, generate: bool = True) -> bool:
+    """Build web de release: iconos con tree-shaking y dart2js -O4 (los imports 'deferred as' van en ficheros .part.js)."""
+    flutter_path = find_flutter()
+    if flutter_path is None:
+        return False
+
+    if generate and not await generate_laia_flutter(flutter_path, openapi_path, backend_folder_name, frontend_folder_name):
+        return False
+
+    print("Ejecutando flutter build web...")
+    code = await run_command(
+        [flutter_path, "build", "web", "--release", "--tree-shake-icons", "--dart2js-optimization=O4", f"--base-href={base_href}"],
+        cwd=frontend_folder_name
+    )
+    if code != 0:
+        print("❌ Error en flutter build web")
+        return False
+    return True
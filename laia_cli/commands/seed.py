@@ -0,0 +1,334 @@
+import datetime
+import json
+import os
+import random
+import string
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import yaml
+from bson import ObjectId
+from pymongo import MongoClient
+from pymongo.errors import BulkWriteError
+
+SCHEMAS_DIR = os.path.join("backend", "openapi", "schemas")
+
+GEOMETRY_TYPES = {"Point", "LineString", "Polygon", "MultiPoint", "MultiLineString", "MultiPolygon"}
+# Bounding box de los puntos generados (lon/lat): península ibérica
+LON_RANGE = (-9.3, 3.3)
+LAT_RANGE = (36.0, 43.8)
+DATE_START = datetime.datetime(2022, 1, 1)
+DATE_SPAN_MINUTES = 3 * 365 * 24 * 60
+MAX_DEPTH = 3
+DUPLICATE_KEY = 11000
+SEED_PASSWORD = "laia-seed"
+
+WORDS = [
+    "madrid", "barcelona", "valencia", "sevilla", "bilbao", "report", "active", "pending", "library",
+    "station", "sensor", "reading", "north", "south", "center", "building", "river", "street", "garden",
+    "market", "school", "museum", "bridge", "tower", "harbour", "forest", "valley", "square",
+]
+FIRST_NAMES = ["Ana", "Luis", "Marta", "Jordi", "Lucía", "Pablo", "Carmen", "Iker", "Sara", "Pau", "Elena", "Hugo"]
+LAST_NAMES = ["García", "Martínez", "López", "Puig", "Sánchez", "Pérez", "Gómez", "Ruiz", "Serra", "Díaz"]
+
+
+def load_schemas(schemas_dir: str = SCHEMAS_DIR) -> dict:
+    schemas = {}
+    for filename in sorted(os.listdir(schemas_dir)):
+        if filename.endswith((".yaml", ".yml")):
+            with open(os.path.join(schemas_dir, filename), "r") as f:
+                content = yaml.safe_load(f) or {}
+            schemas.update({name: schema for name, schema in content.items() if isinstance(schema, dict)})
+    return schemas
+
+
+def find_schema(schemas: dict, model: str):
+    for name, schema in schemas.items():
+        if name.lower() == model.lower():
+            return name, schema
+    return None, None
+
+
+def random_object_id(rng: random.Random) -> ObjectId:
+    return ObjectId(rng.getrandbits(96).to_bytes(12, "big"))
+
+
+def random_position(rng: random.Random) -> list:
+    return [round(rng.uniform(*LON_RANGE), 6), round(rng.uniform(*LAT_RANGE), 6)]
+
+
+def random_ring(rng: random.Random) -> list:
+    """Anillo cerrado (primer punto = último) alrededor de un centro aleatorio, válido para índices 2dsphere."""
+    lon, lat = random_position(rng)
+    size = rng.uniform(0.001, 0.05)
+    ring = [[round(lon + dx * size, 6), round(lat + dy * size, 6)] for dx, dy in ((0, 0), (1, 0), (1, 1), (0, 1))]
+    return ring + [ring[0]]
+
+
+def random_geometry(rng: random.Random, geometry_type: str) -> dict:
+    if geometry_type == "Point":
+        coordinates = random_position(rng)
+    elif geometry_type == "LineString":
+        coordinates = [random_position(rng) for _ in range(rng.randint(2, 5))]
+    elif geometry_type == "Polygon":
+        coordinates = [random_ring(rng)]
+    elif geometry_type == "MultiPoint":
+        coordinates = [random_position(rng) for _ in range(rng.randint(2, 4))]
+    elif geometry_type == "MultiLineString":
+        coordinates = [[random_position(rng) for _ in range(rng.randint(2, 4))] for _ in range(rng.randint(1, 3))]
+    else:
+        coordinates = [[random_ring(rng)] for _ in range(rng.randint(1, 3))]
+    return {"type": geometry_type, "coordinates": coordinates}
+
+
+def geometry_for_ref(rng: random.Random, ref_name: str):
+    """Valor de un $ref a los modelos GeoJSON de laiagenlib: Point (Feature) o GeometryPoint (geometría)."""
+    if ref_name == "Geometry":
+        return random_geometry(rng, rng.choice(sorted(GEOMETRY_TYPES)))
+    if ref_name.startswith("Geometry") and ref_name[len("Geometry"):] in GEOMETRY_TYPES:
+        return random_geometry(rng, ref_name[len("Geometry"):])
+    if ref_name in GEOMETRY_TYPES:
+        return {"type": "Feature", "properties": {}, "geometry": random_geometry(rng, ref_name)}
+    return None
+
+
+class DocumentFactory:
+    """Genera documentos de un schema a partir de los tipos de sus propiedades, con un Random por lote."""
+
+    def __init__(self, schemas: dict, schema: dict, relation_ids: dict, password_hash: str = None):
+        self.schemas = schemas
+        self.schema = schema
+        self.relation_ids = relation_ids
+        self.password_hash = password_hash
+
+    def document(self, rng: random.Random, index: int) -> dict:
+        document = {"_id": random_object_id(rng)}
+        required = set(self.schema.get("required", []))
+        for name, definition in (self.schema.get("properties") or {}).items():
+            if name in ("id", "_id") or not isinstance(definition, dict):
+                continue
+            # Los opcionales a veces no vienen, como en los datos reales
+            if name not in required and rng.random() < 0.1:
+                continue
+            document[name] = self.value(rng, name, definition, index, 0)
+        return document
+
+    def value(self, rng: random.Random, name: str, definition: dict, index: int, depth: int):
+        if "$ref" in definition:
+            ref_name = definition["$ref"].rsplit("/", 1)[-1]
+            geometry = geometry_for_ref(rng, ref_name)
+            if geometry is not None:
+                return geometry
+            embedded = self.schemas.get(ref_name)
+            if embedded is None or depth >= MAX_DEPTH:
+                return {}
+            return self.object(rng, embedded, index, depth + 1)
+
+        for key in ("anyOf", "oneOf"):
+            if definition.get(key):
+                options = [option for option in definition[key] if option.get("type") != "null"]
+                if options:
+                    return self.value(rng, name, rng.choice(options), index, depth)
+
+        relation = definition.get("x_frontend_relation")
+        if relation:
+            ids = self.relation_ids.get(relation)
+            if definition.get("type") == "array":
+                return [rng.choice(ids) if ids else str(random_object_id(rng)) for _ in range(rng.randint(1, 3))]
+            return rng.choice(ids) if ids else str(random_object_id(rng))
+
+        if "enum" in definition:
+            return rng.choice(definition["enum"])
+
+        value_type = definition.get("type", "string")
+        if value_type == "integer":
+            return rng.randint(int(definition.get("minimum", 0)), int(definition.get("maximum", 10000)))
+        if value_type == "number":
+            return round(rng.uniform(float(definition.get("minimum", 0)), float(definition.get("maximum", 10000))), 4)
+        if value_type == "boolean":
+            return rng.random() < 0.5
+        if value_type == "array":
+            items = definition.get("items") or {"type": "string"}
+            low = int(definition.get("minItems", 1))
+            high = max(int(definition.get("maxItems", 3)), low)
+            return [self.value(rng, name, items, index, depth + 1) for _ in range(rng.randint(low, high))]
+        if value_type == "object":
+            if definition.get("properties") and depth < MAX_DEPTH:
+                return self.object(rng, definition, index, depth + 1)
+            return {}
+        return self.string(rng, name, definition, index)
+
+    def object(self, rng: random.Random, schema: dict, index: int, depth: int) -> dict:
+        return {
+            name: self.value(rng, name, definition, index, depth)
+            for name, definition in (schema.get("properties") or {}).items()
+            if isinstance(definition, dict)
+        }
+
+    def string(self, rng: random.Random, name: str, definition: dict, index: int):
+        value_format = definition.get("format")
+        lowered = name.lower()
+        if value_format in ("date-time", "date"):
+            # Mongo no guarda fechas sin hora: 'date' también es datetime (a medianoche)
+            value = DATE_START + datetime.timedelta(minutes=rng.randrange(DATE_SPAN_MINUTES))
+            return value.replace(hour=0, minute=0) if value_format == "date" else value
+        if value_format == "email" or "email" in lowered:
+            # El índice del documento hace únicos los emails (login)
+            return f"user{index}@example.com"
+        if lowered == "password" and self.password_hash:
+            return self.password_hash
+        if value_format == "uri" or lowered in ("url", "website", "image", "avatar"):
+            return f"https://example.com/{lowered}/{index}"
+        if lowered in ("name", "first_name", "firstname"):
+            return rng.choice(FIRST_NAMES)
+        if lowered in ("surname", "surnames", "last_name", "lastname"):
+            return f"{rng.choice(LAST_NAMES)} {rng.choice(LAST_NAMES)}"
+        if definition.get("pattern") or value_format == "password":
+            return "".join(rng.choice(string.ascii_letters + string.digits) for _ in range(16))
+
+        min_length = int(definition.get("minLength", 0))
+        max_length = int(definition.get("maxLength", 60))
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 6)))
+        while len(text) < min_length:
+            text += " " + rng.choice(WORDS)
+        return text[:max_length]
+
+
+# --- Workers (procesos): cada uno con su propio MongoClient ---
+
+_worker = {}
+
+
+def init_seed_worker(mongo_url: str, database: str, collection: str, factory: DocumentFactory, write_concern: int):
+    client = MongoClient(mongo_url, w=write_concern)
+    _worker["collection"] = client[database][collection]
+    _worker["factory"] = factory
+
+
+def seed_batch(seed: int, batch_index: int, start: int, size: int) -> tuple:
+    """Genera e inserta un lote. (insertados, duplicados): relanzar con la misma semilla no duplica datos."""
+    # Random por lote: el resultado no depende del número de workers ni del orden en que terminen
+    rng = random.Random(f"{seed}:{batch_index}")
+    factory = _worker["factory"]
+    documents = [factory.document(rng, start + i) for i in range(size)]
+    try:
+        result = _worker["collection"].insert_many(documents, ordered=False)
+        return len(result.inserted_ids), 0
+    except BulkWriteError as e:
+        details = e.details
+        duplicates = sum(1 for error in details.get("writeErrors", []) if error.get("code") == DUPLICATE_KEY)
+        if duplicates != len(details.get("writeErrors", [])):
+            raise
+        return details.get("nInserted", 0), duplicates
+
+
+def load_mongo_settings(env: str, mongo_url: str = None) -> tuple:
+    config_path = os.path.join("config", f"{env}.json")
+    mongo_config = {}
+    if os.path.exists(config_path):
+        with open(config_path, "r") as f:
+            mongo_config = json.load(f).get("mongo", {})
+    return mongo_url or mongo_config.get("url", "mongodb://localhost:27017"), mongo_config.get("database", "test")
+
+
+def relation_ids(db, schema: dict, limit: int = 1000) -> dict:
+    """Ids existentes de los modelos relacionados (x_frontend_relation), para que las referencias sean válidas."""
+    related = set()
+    for definition in (schema.get("properties") or {}).values():
+        if isinstance(definition, dict) and definition.get("x_frontend_relation"):
+            related.add(definition["x_frontend_relation"])
+    return {
+        model: [str(doc["_id"]) for doc in db[model.lower()].find({}, {"_id": 1}).limit(limit)]
+        for model in related
+    }
+
+
+def seed_password_hash(schema: dict):
+    if not schema.get("x-auth"):
+        return None
+    try:
+        import bcrypt
+    except ImportError:
+        return None
+    # Un solo hash para todo el lote: bcrypt por documento limitaría el ritmo a unos pocos cientos por segundo
+    return bcrypt.hashpw(SEED_PASSWORD.encode(), bcrypt.gensalt()).decode()
+
+
+def seed(args):
+    laia_config = {}
+    if os.path.exists("laia.json"):
+        with open("laia.json", "r", encoding="utf-8") as f:
+            laia_config = json.load(f)
+    if laia_config.get("database", "MongoDB") != "MongoDB":
+        print(f"❌ 'laia seed' writes to MongoDB, this project uses {laia_config['database']}.")
+        return
+
+    if not os.path.isdir(SCHEMAS_DIR):
+        print(f"❌ {SCHEMAS_DIR} not found. Run this command from the root of a LAIA project.")
+        return
+
+    schemas = load_schemas()
+    model_name, schema = find_schema(schemas, args.model)
+    if schema is None:
+        print(f"❌ Schema '{args.model}' not found in {SCHEMAS_DIR}. Available: {', '.join(sorted(schemas))}")
+        return
+
+    mongo_url, database = load_mongo_settings(args.env, args.mongo_url)
+    collection_name = model_name.lower()
+    client = MongoClient(mongo_url)
+    db = client[database]
+    if args.drop:
+        db.drop_collection(collection_name)
+        print(f"🗑️  Dropped {database}.{collection_name}")
+
+    password_hash = seed_password_hash(schema)
+    factory = DocumentFactory(schemas, schema, relation_ids(db, schema), password_hash)
+    client.close()
+
+    batches = [
+        (index, start, min(args.batch_size, args.count - start))
+        for index, start in enumerate(range(0, args.count, args.batch_size))
+    ]
+    print(
+        f"\n🌱 Seeding {args.count:,} {model_name} documents into {database}.{collection_name} "
+        f"({len(batches)} batches of {args.batch_size}, {args.workers} workers, seed {args.seed})..."
+    )
+    if password_hash:
+        print(f"🔑 Every seeded user has the password '{SEED_PASSWORD}'")
+
+    inserted = duplicates = 0
+    start_time = time.perf_counter()
+    last_report = start_time
+    with ProcessPoolExecutor(
+        max_workers=args.workers,
+        initializer=init_seed_worker,
+        initargs=(mongo_url, database, collection_name, factory, args.write_concern),
+    ) as executor:
+        pending = set()
+        queue = iter(batches)
+        # Como mucho dos lotes en vuelo por worker: la memoria no crece con --count
+        for batch in queue:
+            pending.add(executor.submit(seed_batch, args.seed, *batch))
+            if len(pending) < args.workers * 2:
+                continue
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                batch_inserted, batch_duplicates = future.result()
+                inserted += batch_inserted
+                duplicates += batch_duplicates
+
+            now = time.perf_counter()
+            if now - last_report >= 2:
+                last_report = now
+                print(f"  {inserted + duplicates:,}/{args.count:,} ({inserted / (now - start_time):,.0f} docs/s)")
+
+        for future in pending:
+            batch_inserted, batch_duplicates = future.result()
+            inserted += batch_inserted
+            duplicates += batch_duplicates
+
+    elapsed = time.perf_counter() - start_time
+    rate = inserted / elapsed if elapsed > 0 else 0
+    print(f"\n✅ {inserted:,} documents inserted in {elapsed:.1f}s ({rate:,.0f} docs/s)")
+    if duplicates:
+        print(f"ℹ️  {duplicates:,} documents already existed (same --seed as a previous run): skipped")
@@ -2,22 +2,75 @@ import asyncio
 import subprocess
 import os
 
+from laia_cli.commands.compose_services import load_services_config, render_compose_override, wait_for_services
 from laia_cli.commands.run_laia_flutter import run_laia_flutter
-from laia_cli.generators.backoffice.angular.models.model_component_files import modify_model_component_files
+from laia_cli.generators.backoffice.angular.models.model_generator import (
+    generate_model_components,
+    model_components_exist,
+    regenerate_model_artifacts,
+)
 from laia_cli.generators.backoffice.angular.models.models_component_ts import modify_models_component_ts
-from laia_cli.generators.backoffice.angular.route_to_app_routing import add_new_route
-from laia_cli.generators.generate_service_ts import generate_ts_service
+from laia_cli.generators.backoffice.angular.route_to_app_routing import collect_routes
+from laia_cli.generators.backoffice.angular.services.comm_service import add_comm_service
+from laia_cli.generators.backoffice.angular.services.paginator_intl import add_paginator_intl
+from laia_cli.generators.files_generator import (
+    print_tree_changes,
+    report_write_stats,
+    reset_write_stats,
+    virtual_file_tree,
+)
 from laia_cli.generators.generate_ts_interface import generate_all_interfaces_from_schemas
-from laia_cli.generators.kebab_case_converter import to_kebab_case
 
-def run_command(command, cwd=None):
+def run_command(command, cwd=None, env=None):
     try:
-        subprocess.run(command, shell=True, check=True, cwd=cwd)
+        subprocess.run(command, shell=True, check=True, cwd=cwd, env=env)
     except subprocess.CalledProcessError as e:
         print(f"❌ Error while running: {command}")
         print(f"{e}")
         exit(1)
 
+def generate_backoffice(dry_run: bool = False, show_diff: bool = False) -> bool:
+    """Regenera interfaces, componentes y rutas del backoffice. Con dry_run solo muestra los cambios (devuelve False)."""
+    reset_write_stats()
+
+    with virtual_file_tree() as tree, collect_routes():
+        modify_models_component_ts()
+        # Los componentes de modelos nuevos leen el total de la búsqueda y usan el paginador aproximado
+        add_comm_service()
+        add_paginator_intl()
+        generate_all_interfaces_from_schemas("backend/openapi/schemas", "backoffice/src/app/interfaces")
+
+        schemas_dir = "backend/openapi/schemas"
+
+        for filename in os.listdir(schemas_dir):
+            if not (filename.endswith(".yaml") or filename.endswith(".yml")):
+                continue
+
+            model_name = os.path.splitext(filename)[0]
+            if model_name == "User":
+                continue
+
+            if not model_components_exist(model_name):
+                schema_path = os.path.join(schemas_dir, filename)
+                if dry_run:
+                    # Sin 'ng generate': solo se previsualizan los ficheros que rellena el generador
+                    regenerate_model_artifacts(model_name, schema_path)
+                    continue
+                # 'ng generate' escribe en disco y lee app.module.ts: volcamos antes lo pendiente
+                tree.flush()
+                try:
+                    generate_model_components(model_name, schema_path)
+                except subprocess.CalledProcessError as e:
+                    print(f"❌ Error generando componentes para {model_name}: {e}")
+
+    if dry_run:
+        print_tree_changes(tree, show_diff=show_diff)
+        return False
+
+    tree.flush()
+    report_write_stats()
+    return True
+
 def start_project(args):
     if args.backend:
         print("🚀 Starting backend...")
@@ -29,8 +82,15 @@ def start_project(args):
 
         # Step 2: Docker Compose up
         if os.path.exists("docker-compose.yaml"):
+            services_config = load_services_config(args.env)
+            render_compose_override(services_config)
+
             print("\nStarting Docker containers...")
             run_command("docker compose up -d")
+
+            # Step 2.1: Wait for healthchecks before launching the app
+            if not wait_for_services(services_config.get("wait_timeout", 120)):
+                exit(1)
         else:
             print("⚠️  docker-compose.yaml not found, skipping Docker step.")
 
@@ -40,7 +100,7 @@ def start_project(args):
             print("\n🚀 Launching application...")
             env = os.environ.copy()
             env["APP_ENV"] = args.env 
-            run_command(f"python {main_file}")
+            run_command(f"python {main_file}", env=env)
         else:
             print("⚠️  backendpp/main.py not found, cannot start the application.")
 
@@ -50,56 +110,9 @@ def start_project(args):
 
     if args.backoffice:
         print("🚀 Starting backoffice...")
-        modify_models_component_ts()
-        generate_all_interfaces_from_schemas("backend/openapi/schemas", "backoffice/src/app/interfaces")
-
-        schemas_dir = "backend/openapi/schemas"
-        pages_dir = "backoffice/src/app/pages/models"
-
-        for filename in os.listdir(schemas_dir):
-            if not (filename.endswith(".yaml") or filename.endswith(".yml")):
-                continue
-
-            model_name = os.path.splitext(filename)[0]
-            if model_name == "User":
-                continue
-
-            kebab_name = to_kebab_case(model_name)
-            model_folder = os.path.join(pages_dir, kebab_name)
-
-            if not os.path.exists(model_folder):
-                print(f"🆕 Generando componentes para modelo: {model_name} → {kebab_name}")
-                try:
-                    subprocess.run(
-                        ["ng", "generate", "component", f"pages/models/{kebab_name}"],
-                        cwd="backoffice",
-                        check=True
-                    )
-                    add_new_route(
-                        path=f"models/{kebab_name}",
-                        component=f"{model_name}Component",
-                        import_path=f"./pages/models/{kebab_name}/{kebab_name}.component",
-                        guard=True
-                    )
-                    generate_ts_service(model_name)
-                    schema_path = os.path.join(schemas_dir, filename)
-                    modify_model_component_files(
-                        yaml_path=schema_path,
-                        component_base_path=f"models/{kebab_name}"
-                    )
-                    subprocess.run(
-                        ["ng", "generate", "component", f"pages/models/{kebab_name}/new-{kebab_name}"],
-                        cwd="backoffice",
-                        check=True
-                    )
-                    add_new_route(
-                        path=f"models/{kebab_name}/new-{kebab_name}",
-                        component=f"New{model_name}Component",
-                        import_path=f"./pages/models/{kebab_name}/new-{kebab_name}/new-{kebab_name}.component",
-                        guard=True
-                    )
-                except subprocess.CalledProcessError as e:
-                    print(f"❌ Error generando componentes para {model_name}: {e}")
+        dry_run = getattr(args, "dry_run", False) or getattr(args, "diff", False)
+        if not generate_backoffice(dry_run=dry_run, show_diff=getattr(args, "diff", False)):
+            return
 
         backoffice_path = "backoffice"
         env = os.environ.copy()
@@ -1,4 +1,5 @@
 import importlib
+import os
 from pathlib import Path
 import subprocess
 import shutil
@@ -15,6 +16,7 @@ from laia_cli.generators.backoffice.angular.auth.auth_component_ts import modify
 from laia_cli.generators.backoffice.angular.auth.new_user_html import modify_new_user_component_html
 from laia_cli.generators.backoffice.angular.auth.new_user_scss import modify_new_user_component_scss
 from laia_cli.generators.backoffice.angular.auth.new_user_ts import modify_new_user_component_ts
+from laia_cli.generators.backoffice.angular.change_detection import NG_GENERATE_ARGS
 from laia_cli.generators.backoffice.angular.kebab_pipe_creator import create_kebab_pipe
 from laia_cli.generators.backoffice.angular.services.auth_guard import add_auth_guard
 from laia_cli.generators.backoffice.angular.services.auth_service import add_auth_service
@@ -24,46 +26,68 @@ from laia_cli.generators.backoffice.angular.home.home_component_html import modi
 from laia_cli.generators.backoffice.angular.home.home_component_scss import modify_home_component_scss
 from laia_cli.generators.backoffice.angular.home.home_component_ts import modify_home_component_ts
 from laia_cli.generators.backoffice.angular.services.intercept_service import add_intercept_service
+from laia_cli.generators.backoffice.angular.services.paginator_intl import add_paginator_intl
+from laia_cli.generators.backoffice.angular.services.storage_service import add_storage_service
 from laia_cli.generators.backoffice.angular.login.login_component_html import modify_login_component_html
 from laia_cli.generators.backoffice.angular.login.login_component_scss import modify_login_component_scss
 from laia_cli.generators.backoffice.angular.login.login_component_ts import modify_login_component_ts
 from laia_cli.generators.backoffice.angular.models.models_component_html import modify_models_component_html
 from laia_cli.generators.backoffice.angular.models.models_component_scss import modify_models_component_scss
 from laia_cli.generators.backoffice.angular.models.models_component_ts import modify_models_component_ts
-from laia_cli.generators.backoffice.angular.route_to_app_routing import add_new_route, add_route_to_app_routing
+from laia_cli.generators.backoffice.angular.route_to_app_routing import add_new_route, add_route_to_app_routing, collect_routes
+from laia_cli.generators.backoffice.angular.skeleton_cache import ANGULAR_CLI_VERSION, MATERIAL_ANSWERS, NG_NEW_ARGS, materialize_skeleton
+from laia_cli.generators.backoffice.angular.storage.storage_component_html import modify_storage_component_html
+from laia_cli.generators.backoffice.angular.storage.storage_component_scss import modify_storage_component_scss
+from laia_cli.generators.backoffice.angular.storage.storage_component_ts import modify_storage_component_ts
 from laia_cli.generators.backoffice.angular.table.table_component_html import modify_table_component_html
 from laia_cli.generators.backoffice.angular.table.table_component_scss import modify_table_component_scss
 from laia_cli.generators.backoffice.angular.table.table_component_ts import modify_table_component_ts
-from laia_cli.generators.files_generator import create_directory
+from laia_cli.generators.files_generator import create_directory, report_write_stats, virtual_file_tree
 from laia_cli.generators.generate_service_ts import generate_ts_service
 from laia_cli.generators.generate_ts_interface import generate_all_interfaces_from_schemas
 
+COMPONENTS = [
+  "pages/home",
+  "pages/login",
+  "pages/auth",
+  "pages/schemas",
+  "pages/models",
+  "pages/storage",
+  "pages/settings",
+  "/components/table",
+  "/pages/auth/new-user",
+]
+
 def generate_angular_project(project_name: str):
-  # Verificar si Angular CLI está instalado
-  if shutil.which("ng") is None:
-      print("🔧 Angular CLI (ng) is not installed. Installing it globally with npm...")
-      try:
-          subprocess.run(["npm", "install", "-g", "@angular/cli@19"], check=True)
-      except subprocess.CalledProcessError:
-          print("❌ Failed to install Angular CLI. Please install it manually with:")
-          print("   npm install -g @angular/cli")
-          return
-
-  print("🚀 Creating Angular backoffice project...")
-
-  subprocess.run([
-      "ng", "new", "backoffice", "--routing", "--style=scss",
-      "--no-standalone", "--strict", "--skip-tests", "--defaults"
-  ], check=True)
-
-  subprocess.run(
-      ["npx", "-p", "@angular/cli", "ng", "add", "@angular/material", "--skip-confirmation"],
-      cwd="backoffice",
-      check=True,
-      input=b'azure-blue\nn\n',
-      stdout=subprocess.PIPE,
-      stderr=subprocess.PIPE
-  )
+  # Con el esqueleto en caché ('laia cache warm') no hace falta red ni Angular CLI global
+  if materialize_skeleton("backoffice"):
+    # El 'ng' local del proyecto sirve para los 'ng generate' de este proceso
+    local_bin = os.path.abspath(os.path.join("backoffice", "node_modules", ".bin"))
+    os.environ["PATH"] = local_bin + os.pathsep + os.environ.get("PATH", "")
+  else:
+    # Verificar si Angular CLI está instalado
+    if shutil.which("ng") is None:
+        print("🔧 Angular CLI (ng) is not installed. Installing it globally with npm...")
+        try:
+            subprocess.run(["npm", "install", "-g", f"@angular/cli@{ANGULAR_CLI_VERSION}"], check=True)
+        except subprocess.CalledProcessError:
+            print("❌ Failed to install Angular CLI. Please install it manually with:")
+            print("   npm install -g @angular/cli")
+            return
+
+    print("🚀 Creating Angular backoffice project...")
+    print("ℹ️  'laia cache warm' keeps a ready-made project in the user cache for offline, faster creation.")
+
+    subprocess.run(["ng", "new", "backoffice", *NG_NEW_ARGS], check=True)
+
+    subprocess.run(
+        ["npx", "-p", "@angular/cli", "ng", "add", "@angular/material", "--skip-confirmation"],
+        cwd="backoffice",
+        check=True,
+        input=MATERIAL_ANSWERS,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE
+    )
 
   # Crear carpetas
   create_directory("backoffice/src/app/pages")
@@ -71,108 +95,74 @@ def generate_angular_project(project_name: str):
   create_directory("backoffice/src/app/services")
   create_directory("backoffice/src/app/pipes")
 
-  modify_global_page_style()
-  modify_app_component_module()
-  modify_app_component_ts()
-  modify_app_component_html()
-  modify_app_component_scss()
-
-  subprocess.run(
-    ["ng", "generate", "component", "pages/home"],
-    cwd="backoffice",
-    check=True
-  )
-
-  subprocess.run(
-    ["ng", "generate", "component", "pages/login"],
-    cwd="backoffice",
-    check=True
-  )
-
-  subprocess.run(
-    ["ng", "generate", "component", "pages/auth"],
-    cwd="backoffice",
-    check=True
-  )
-
-  subprocess.run(
-    ["ng", "generate", "component", "pages/schemas"],
-    cwd="backoffice",
-    check=True
-  )
-
-  subprocess.run(
-    ["ng", "generate", "component", "pages/models"],
-    cwd="backoffice",
-    check=True
-  )
-
-  subprocess.run(
-    ["ng", "generate", "component", "pages/storage"],
-    cwd="backoffice",
-    check=True
-  )
-
-  subprocess.run(
-    ["ng", "generate", "component", "pages/settings"],
-    cwd="backoffice",
-    check=True
-  )
-  
-  create_kebab_pipe()
-
-  add_route_to_app_routing()
-
-  modify_home_component_ts(project_name)
-  modify_home_component_scss()
-  modify_home_component_html()
-
-  add_comm_service()
-  add_intercept_service()
-  add_auth_service()
-  add_auth_guard()
-
-  subprocess.run(
-    ["ng", "generate", "component", "/components/table"],
-    cwd="backoffice",
-    check=True
-  )
-
-  modify_table_component_ts()
-  modify_table_component_html()
-  modify_table_component_scss()
-
-  modify_login_component_html()
-  modify_login_component_scss()
-  modify_login_component_ts(project_name)
-
-  generate_all_interfaces_from_schemas("backend/openapi/schemas", "backoffice/src/app/interfaces")
-
-  generate_ts_service("User")
-
-  modify_auth_component_ts("backend/openapi/schemas/User.yaml")
-  modify_auth_component_html()
-  modify_auth_component_scss()
-
-  subprocess.run(
-    ["ng", "generate", "component", "/pages/auth/new-user"],
-    cwd="backoffice",
-    check=True
-  )
-
-  modify_new_user_component_html("backend/openapi/schemas/User.yaml")
-  modify_new_user_component_ts()
-  modify_new_user_component_scss()
-
-  add_new_route(
-    path="auth/new-user",
-    component="NewUserComponent",
-    import_path="./pages/auth/new-user/new-user.component",
-    guard=True
-  )
-
-  modify_models_component_html()
-  modify_models_component_scss()
-  modify_models_component_ts()
+  # Primer lote: ficheros base que 'ng generate' modifica después (app.module.ts), así que se vuelcan ya
+  with virtual_file_tree() as tree:
+    modify_global_page_style()
+    modify_app_component_module()
+    modify_app_component_ts()
+    modify_app_component_html()
+    modify_app_component_scss()
+  tree.flush()
+
+  # Todos los 'ng generate' juntos; el resto de ficheros se generan en memoria y se vuelcan en un solo lote
+  for component in COMPONENTS:
+    subprocess.run(
+      ["ng", "generate", "component", component, *NG_GENERATE_ARGS],
+      cwd="backoffice",
+      check=True
+    )
+
+  with virtual_file_tree() as tree, collect_routes():
+    create_kebab_pipe()
+
+    add_route_to_app_routing()
+
+    modify_home_component_ts(project_name)
+    modify_home_component_scss()
+    modify_home_component_html()
+
+    add_comm_service()
+    add_intercept_service()
+    add_auth_service()
+    add_auth_guard()
+    add_storage_service()
+    add_paginator_intl()
+
+    modify_table_component_ts()
+    modify_table_component_html()
+    modify_table_component_scss()
+
+    modify_login_component_html()
+    modify_login_component_scss()
+    modify_login_component_ts(project_name)
+
+    generate_all_interfaces_from_schemas("backend/openapi/schemas", "backoffice/src/app/interfaces")
+
+    generate_ts_service("User")
+
+    modify_auth_component_ts("backend/openapi/schemas/User.yaml")
+    modify_auth_component_html()
+    modify_auth_component_scss()
+
+    modify_new_user_component_html("backend/openapi/schemas/User.yaml")
+    modify_new_user_component_ts()
+    modify_new_user_component_scss()
+
+    add_new_route(
+      path="auth/new-user",
+      component="NewUserComponent",
+      import_path="./pages/auth/new-user/new-user.component",
+      guard=True
+    )
+
+    modify_models_component_html()
+    modify_models_component_scss()
+    modify_models_component_ts()
+
+    modify_storage_component_ts()
+    modify_storage_component_html()
+    modify_storage_component_scss()
+  tree.flush()
 
+  report_write_stats()
   print("✅ Angular backoffice created successfully.")
\ No newline at end of file
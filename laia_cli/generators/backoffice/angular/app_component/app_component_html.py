@@ -1,6 +1,8 @@
+from laia_cli.generators.files_generator import write_file
+
+
 def modify_app_component_html():
-    with open("backoffice/src/app/app.component.html", "w") as f:
-        f.write("""
+    write_file("backoffice/src/app/app.component.html", """
 <mat-toolbar *ngIf="!isLogin()">
     <img src="/favicon.ico" />
     <span>{{ title }}</span>
@@ -1,7 +1,8 @@
+from laia_cli.generators.files_generator import write_file
+
 def modify_app_component_module():
     app_module_ts = "backoffice/src/app/app.module.ts"
-    with open(app_module_ts, "w") as f:
-        f.write("""import { NgModule } from '@angular/core';
+    write_file(app_module_ts, """import { NgModule } from '@angular/core';
 import { BrowserModule } from '@angular/platform-browser';
 
 import { AppRoutingModule } from './app-routing.module';
@@ -22,6 +23,7 @@ import { MatInputModule } from '@angular/material/input';
 import { HTTP_INTERCEPTORS } from '@angular/common/http';
 import { JwtInterceptor } from './services/jwt.interceptor';
 import { MatPaginatorModule } from '@angular/material/paginator';
+import { MatProgressBarModule } from '@angular/material/progress-bar';
                 
 import { KebabCasePipe } from './pipes/kebab-case.pipe';
 
@@ -46,7 +48,8 @@ import { KebabCasePipe } from './pipes/kebab-case.pipe';
     MatFormFieldModule,
     MatInputModule,
     ReactiveFormsModule,
-    MatPaginatorModule
+    MatPaginatorModule,
+    MatProgressBarModule
   ],
   providers: [
     { provide: HTTP_INTERCEPTORS, useClass: JwtInterceptor, multi: true }
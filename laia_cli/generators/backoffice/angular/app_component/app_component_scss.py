@@ -1,6 +1,8 @@
+from laia_cli.generators.files_generator import write_file
+
+
 def modify_app_component_scss():
-    with open("backoffice/src/app/app.component.scss", "w") as f:
-        f.write(""".example-spacer {
+    write_file("backoffice/src/app/app.component.scss", """.example-spacer {
   flex: 1 1 auto;
 }
 
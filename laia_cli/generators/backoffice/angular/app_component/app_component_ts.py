@@ -1,7 +1,8 @@
+from laia_cli.generators.files_generator import write_file
+
 def modify_app_component_ts():
     app_component_ts = "backoffice/src/app/app.component.ts"
-    with open(app_component_ts, "w") as f:
-        f.write(f"""import {{ Component }} from '@angular/core';
+    write_file(app_component_ts, f"""import {{ Component }} from '@angular/core';
 import {{ Router }} from '@angular/router';
 import {{ AuthService }} from './services/auth.service';
 
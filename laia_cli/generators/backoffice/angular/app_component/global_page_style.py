@@ -1,13 +1,12 @@
-import os
+from laia_cli.generators.files_generator import file_exists, read_file, write_file
 
 
 def modify_global_page_style():
     path = "backoffice/src/styles.scss"
-    if not os.path.exists(path):
+    if not file_exists(path):
         return
 
-    with open(path, "r") as f:
-        content = f.read()
+    content = read_file(path)
 
     additions = []
 
@@ -30,5 +29,4 @@ def modify_global_page_style():
         additions.append("\nmat-card-header {\n    margin-bottom: 20px;\n}")
 
     if additions:
-        with open(path, "a") as f:
-            f.write("\n".join(additions) + "\n")
\ No newline at end of file
+        write_file(path, content + "\n".join(additions) + "\n")
\ No newline at end of file
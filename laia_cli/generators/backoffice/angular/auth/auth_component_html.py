@@ -1,9 +1,9 @@
-import os
+from laia_cli.generators.files_generator import file_exists, write_file
 
 
 def modify_auth_component_html():
     routing_path = "backoffice/src/app/pages/auth/auth.component.html"
-    if not os.path.exists(routing_path):
+    if not file_exists(routing_path):
         return
 
     content = """<div class="page">
@@ -15,25 +15,26 @@ def modify_auth_component_html():
             <mat-card-title>Users</mat-card-title>
           </mat-card-title-group>
         </mat-card-header>
-        <mat-card-content>
-            <mat-form-field appearance="outline" class="full-width">
-                <mat-label>Search...</mat-label>
-                <input matInput type="text" [(ngModel)]="searchQuery">
-                <mat-icon matSuffix>search</mat-icon>
-            </mat-form-field>
-            <app-table
-            [headers]="headers"
-            [data]="users">
-            </app-table>
-        </mat-card-content>
-        <mat-paginator
-          [length]="total"
-          [pageSize]="pageSize"
-          [pageSizeOptions]="[10, 25, 50]"
-          (page)="onPageChange($event)">
-        </mat-paginator>
+        <ng-container *ngIf="{ current: page$ | async } as view">
+          <mat-card-content>
+              <mat-form-field appearance="outline" class="full-width">
+                  <mat-label>Search...</mat-label>
+                  <input matInput type="text" [(ngModel)]="searchQuery">
+                  <mat-icon matSuffix>search</mat-icon>
+              </mat-form-field>
+              <app-table
+              [headers]="headers"
+              [data]="view.current?.users ?? []">
+              </app-table>
+          </mat-card-content>
+          <mat-paginator
+            [length]="view.current?.total ?? 0"
+            [pageSize]="pageSize"
+            [pageSizeOptions]="[10, 25, 50]"
+            (page)="onPageChange($event)">
+          </mat-paginator>
+        </ng-container>
     </mat-card>
 </div>
 """
-    with open(routing_path, "w") as f:
-        f.write(content)
\ No newline at end of file
+    write_file(routing_path, content)
\ No newline at end of file
@@ -1,9 +1,9 @@
-import os
+from laia_cli.generators.files_generator import file_exists, write_file
 
 
 def modify_auth_component_scss():
     routing_path = "backoffice/src/app/pages/auth/auth.component.scss"
-    if not os.path.exists(routing_path):
+    if not file_exists(routing_path):
         return
 
     content = """.full-width {
@@ -26,5 +26,4 @@ mat-icon {
   }
 }
 """
-    with open(routing_path, "w") as f:
-        f.write(content)
\ No newline at end of file
+    write_file(routing_path, content)
\ No newline at end of file
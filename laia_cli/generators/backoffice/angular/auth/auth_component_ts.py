@@ -1,14 +1,14 @@
-import os
 import yaml
 
+from laia_cli.generators.files_generator import file_exists, read_file, write_file
+
 def modify_auth_component_ts(yaml_path: str):
     ts_path = "backoffice/src/app/pages/auth/auth.component.ts"
-    if not os.path.exists(ts_path):
+    if not file_exists(ts_path):
         print(f"⚠️  No existe {ts_path}")
         return
 
-    with open(yaml_path, "r") as f:
-        schema = yaml.safe_load(f)
+    schema = yaml.safe_load(read_file(yaml_path))
 
     # Asumimos que el nombre del modelo es la clave raíz
     model_name, definition = next(iter(schema.items()))
@@ -19,61 +19,69 @@ def modify_auth_component_ts(yaml_path: str):
         return
 
     # Generar línea headers
-    headers_line = f"  headers: string[] = {default_fields};"
+    headers_line = f"  readonly headers: readonly string[] = {default_fields};"
 
-    # Generar mapping dinámico para user
-    map_fields = ",\n        ".join([f"{field}: user.{field}" for field in default_fields])
-    map_block = f"""this.users = response['items'].map((user: {{ name: any; surnames: any; email: any; }}) => ({{
-        {map_fields}
-      }}));"""
+    # Generar mapping dinámico para user (con el id, que usa el trackBy de la tabla)
+    map_fields = ",\n            ".join(["id: user.id"] + [f"{field}: user.{field}" for field in default_fields])
 
     # Crear contenido del componente con sustituciones
-    content = f"""import {{ Component, OnInit }} from '@angular/core';
+    content = f"""import {{ ChangeDetectionStrategy, Component }} from '@angular/core';
+import {{ BehaviorSubject, Observable, catchError, map, of, switchMap, tap }} from 'rxjs';
 import {{ UserService }} from '../../services/user.service';
+import {{ ApproximatePaginatorIntl, paginatorLength }} from '../../services/approximate-paginator-intl';
 import {{ User }} from '../../interfaces/user';
-import {{ PageEvent }} from '@angular/material/paginator';
+import {{ MatPaginatorIntl, PageEvent }} from '@angular/material/paginator';
+
+interface UserPage {{
+  users: readonly User[];
+  total: number;
+}}
 
 @Component({{
   selector: 'app-auth',
   standalone: false,
   templateUrl: './auth.component.html',
-  styleUrl: './auth.component.scss'
+  styleUrl: './auth.component.scss',
+  changeDetection: ChangeDetectionStrategy.OnPush,
+  providers: [ApproximatePaginatorIntl, {{ provide: MatPaginatorIntl, useExisting: ApproximatePaginatorIntl }}],
 }})
-export class AuthComponent implements OnInit {{
+export class AuthComponent {{
   
   searchQuery = '';
-  users: User[] = [];
 {headers_line}
 
-  total = 0;
   pageSize = 10;
   currentPage = 0;
 
-  constructor( 
-    private userService: UserService
-  ) {{}}
-
-  ngOnInit() {{
-    this.fetchData(this.currentPage, this.pageSize);
-  }}
+  private readonly pageRequest$ = new BehaviorSubject({{ skip: 0, limit: this.pageSize }});
+  readonly page$: Observable<UserPage>;
 
-  fetchData(skip: number, limit: number) {{
-    this.userService.getAll(0, 10).subscribe(response => {{
-      {map_block}
-      this.total = response['max_pages'];
-    }});
+  constructor(
+    private userService: UserService,
+    private paginatorIntl: ApproximatePaginatorIntl
+  ) {{
+    this.page$ = this.pageRequest$.pipe(
+      switchMap(({{ skip, limit }}) => this.userService.getAll(skip, limit).pipe(
+        tap(response => this.paginatorIntl.update(response.count?.mode === 'estimated', response.count?.mode === 'none')),
+        map(response => ({{
+          users: response['items'].map((user: any) => ({{
+            {map_fields}
+          }})),
+          total: paginatorLength(response, skip, limit),
+        }})),
+        catchError(() => of({{ users: [], total: 0 }})),
+      )),
+    );
   }}
 
   onPageChange(event: PageEvent) {{
     this.currentPage = event.pageIndex;
     this.pageSize = event.pageSize;
-    const skip = this.currentPage * this.pageSize;
-    this.fetchData(skip, this.pageSize);
+    this.pageRequest$.next({{ skip: this.currentPage * this.pageSize, limit: this.pageSize }});
   }}
 
 }}
 """
 
-    with open(ts_path, "w") as f:
-        f.write(content)
+    write_file(ts_path, content)
     print(f"✅ auth.component.ts actualizado con campos: {default_fields}")
@@ -1,10 +1,10 @@
 import yaml
-import os
+
+from laia_cli.generators.files_generator import read_file, write_file
 
 def modify_new_user_component_html(yaml_path: str):
     html_path = "backoffice/src/app/pages/auth/new-user/new-user.component.html"
-    with open(yaml_path, "r") as f:
-        schema = yaml.safe_load(f)
+    schema = yaml.safe_load(read_file(yaml_path))
 
     model_name, definition = next(iter(schema.items()))
     properties = definition.get("properties", {})
@@ -37,7 +37,6 @@ def modify_new_user_component_html(yaml_path: str):
 </div>
 """
 
-    with open(html_path, "w") as f:
-        f.write(html_content)
+    write_file(html_path, html_content)
 
     print(f"✅ HTML generado en {html_path}")
\ No newline at end of file
@@ -1,3 +1,6 @@
+from laia_cli.generators.files_generator import write_file
+
+
 def modify_new_user_component_scss():
     scss_path = "backoffice/src/app/pages/auth/new-user/new-user.component.scss"
     content = """.form {
@@ -12,6 +15,5 @@ button {
   align-self: flex-start;
 }
 """
-    with open(scss_path, "w") as f:
-        f.write(content)
+    write_file(scss_path, content)
     print(f"✅ SCSS generado en {scss_path}")
@@ -1,6 +1,8 @@
+from laia_cli.generators.files_generator import write_file
+
 def modify_new_user_component_ts():
     ts_path = "backoffice/src/app/pages/auth/new-user/new-user.component.ts"
-    content = """import { Component } from '@angular/core';
+    content = """import { ChangeDetectionStrategy, Component } from '@angular/core';
 import { UserService } from '../../../services/user.service';
 import { Router } from '@angular/router';
 
@@ -8,7 +10,8 @@ import { Router } from '@angular/router';
   selector: 'app-new-user',
   standalone: false,
   templateUrl: './new-user.component.html',
-  styleUrl: './new-user.component.scss'
+  styleUrl: './new-user.component.scss',
+  changeDetection: ChangeDetectionStrategy.OnPush,
 })
 export class NewUserComponent {
 
@@ -27,6 +30,5 @@ export class NewUserComponent {
 
 }
 """
-    with open(ts_path, "w") as f:
-        f.write(content)
+    write_file(ts_path, content)
     print(f"✅ TS generado en {ts_path}")
\ No newline at end of file
@@ -0,0 +1,23 @@
+import re
+
+# Los componentes del backoffice usan OnPush: solo se revisan cuando cambia una @Input (por referencia),
+# llega un evento de su plantilla o emite un async pipe. Los datos se sustituyen, nunca se mutan.
+NG_GENERATE_ARGS = ["--change-detection", "OnPush"]
+
+COMPONENT_DECORATOR = re.compile(r"@Component\(\{\n")
+CORE_IMPORT = re.compile(r"import \{([^}]*)\} from '@angular/core';")
+
+
+def ensure_on_push(source: str) -> str:
+    """Añade changeDetection: OnPush a un componente generado por 'ng generate' si aún no lo tiene."""
+    if "ChangeDetectionStrategy.OnPush" in source:
+        return source
+    source = COMPONENT_DECORATOR.sub("@Component({\n  changeDetection: ChangeDetectionStrategy.OnPush,\n", source, count=1)
+
+    match = CORE_IMPORT.search(source)
+    if match is None:
+        return "import { ChangeDetectionStrategy } from '@angular/core';\n" + source
+    names = [name.strip() for name in match.group(1).split(",") if name.strip()]
+    if "ChangeDetectionStrategy" not in names:
+        names.insert(0, "ChangeDetectionStrategy")
+    return source[:match.start()] + f"import {{ {', '.join(names)} }} from '@angular/core';" + source[match.end():]
@@ -1,9 +1,9 @@
-import os
+from laia_cli.generators.files_generator import file_exists, write_file
 
 
 def modify_home_component_html():
     routing_path = "backoffice/src/app/pages/home/home.component.html"
-    if not os.path.exists(routing_path):
+    if not file_exists(routing_path):
         return
 
     content = """<div class="page">
@@ -67,5 +67,4 @@ def modify_home_component_html():
     </div>
 </div>
 """
-    with open(routing_path, "w") as f:
-        f.write(content)
\ No newline at end of file
+    write_file(routing_path, content)
\ No newline at end of file
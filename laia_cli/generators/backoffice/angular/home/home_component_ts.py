@@ -1,13 +1,13 @@
-import os
+from laia_cli.generators.backoffice.angular.change_detection import ensure_on_push
+from laia_cli.generators.files_generator import file_exists, read_file, write_file
 
 
 def modify_home_component_ts(project_name: str):
     ts_path = "backoffice/src/app/pages/home/home.component.ts"
-    if not os.path.exists(ts_path):
+    if not file_exists(ts_path):
         return
 
-    with open(ts_path, "r") as f:
-        lines = f.readlines()
+    lines = read_file(ts_path).splitlines(keepends=True)
 
     new_lines = []
     added = False
@@ -18,5 +18,4 @@ def modify_home_component_ts(project_name: str):
             new_lines.append(f"  projectName = '{project_name}';\n")
             added = True
 
-    with open(ts_path, "w") as f:
-        f.writelines(new_lines)
\ No newline at end of file
+    write_file(ts_path, ensure_on_push("".join(new_lines)))
\ No newline at end of file
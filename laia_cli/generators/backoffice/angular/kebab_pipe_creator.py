@@ -1,6 +1,7 @@
+from laia_cli.generators.files_generator import write_file
+
 def create_kebab_pipe():
-    with open("backoffice/src/app/pipes/kebab-case.pipe.ts", "w") as f:
-        f.write("""
+    write_file("backoffice/src/app/pipes/kebab-case.pipe.ts", """
 import { Pipe, PipeTransform } from '@angular/core';
 
 @Pipe({ name: 'kebabCase', standalone: false })
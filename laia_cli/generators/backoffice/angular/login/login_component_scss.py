@@ -1,9 +1,9 @@
-import os
+from laia_cli.generators.files_generator import file_exists, write_file
 
 
 def modify_login_component_scss():
     routing_path = "backoffice/src/app/pages/login/login.component.scss"
-    if not os.path.exists(routing_path):
+    if not file_exists(routing_path):
         return
 
     content = """html, body {
@@ -55,5 +55,4 @@ def modify_login_component_scss():
   top: 0;
 }
 """
-    with open(routing_path, "w") as f:
-        f.write(content)
\ No newline at end of file
+    write_file(routing_path, content)
\ No newline at end of file
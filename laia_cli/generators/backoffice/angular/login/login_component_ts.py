@@ -1,12 +1,12 @@
-import os
+from laia_cli.generators.files_generator import file_exists, write_file
 
 
 def modify_login_component_ts(projectName: str):
     routing_path = "backoffice/src/app/pages/login/login.component.ts"
-    if not os.path.exists(routing_path):
+    if not file_exists(routing_path):
         return
 
-    content = f"""import {{ Component }} from '@angular/core';
+    content = f"""import {{ ChangeDetectionStrategy, Component }} from '@angular/core';
 import {{ FormBuilder, FormGroup, Validators }} from '@angular/forms';
 import {{ AuthService }} from '../../services/auth.service';
 import {{ Router }} from '@angular/router';
@@ -15,7 +15,8 @@ import {{ Router }} from '@angular/router';
   selector: 'app-login',
   standalone: false,
   templateUrl: './login.component.html',
-  styleUrls: ['./login.component.scss']
+  styleUrls: ['./login.component.scss'],
+  changeDetection: ChangeDetectionStrategy.OnPush,
 }})
 export class LoginComponent {{
 
@@ -52,5 +53,4 @@ export class LoginComponent {{
 
 }}
 """
-    with open(routing_path, "w") as f:
-        f.write(content)
\ No newline at end of file
+    write_file(routing_path, content)
\ No newline at end of file
@@ -1,17 +1,16 @@
-import os
 import yaml
 from pathlib import Path
 
 from laia_cli.generators.kebab_case_converter import to_kebab_case
+from laia_cli.generators.files_generator import file_exists, read_file, write_file
 
 
 def modify_model_component_files(yaml_path: str, component_base_path: str):
-    if not os.path.exists(yaml_path):
+    if not file_exists(yaml_path):
         print(f"⚠️  No existe el YAML: {yaml_path}")
         return
 
-    with open(yaml_path, "r") as f:
-        schema = yaml.safe_load(f)
+    schema = yaml.safe_load(read_file(yaml_path))
 
     model_name, definition = next(iter(schema.items()))
     default_fields = definition.get("x-frontend-defaultFields", [])
@@ -26,59 +25,66 @@ def modify_model_component_files(yaml_path: str, component_base_path: str):
     html_path = f"{model_component_path}.html"
     scss_path = f"{model_component_path}.scss"
 
-    os.makedirs(os.path.dirname(ts_path), exist_ok=True)
 
     # === TS FILE ===
-    headers_line = f"  headers: string[] = {default_fields};"
-    map_fields = ",\n        ".join([f"{field}: item.{field}" for field in default_fields])
-    map_block = f"""this.items = response['items'].map((item: any) => ({{
-        {map_fields}
-      }}));"""
-
-    ts_content = f"""import {{ Component, OnInit }} from '@angular/core';
-import {{ PageEvent }} from '@angular/material/paginator';
+    headers_line = f"  readonly headers: readonly string[] = {default_fields};"
+    map_fields = ",\n            ".join(["id: item.id"] + [f"{field}: item.{field}" for field in default_fields])
+
+    ts_content = f"""import {{ ChangeDetectionStrategy, Component }} from '@angular/core';
+import {{ MatPaginatorIntl, PageEvent }} from '@angular/material/paginator';
+import {{ BehaviorSubject, Observable, catchError, map, of, switchMap, tap }} from 'rxjs';
 import {{ {model_name}Service }} from '../../../services/{kebab_model}.service';
+import {{ ApproximatePaginatorIntl, paginatorLength }} from '../../../services/approximate-paginator-intl';
 import {{ {model_name} }} from '../../../interfaces/{kebab_model}';
 
+interface {model_name}Page {{
+  items: readonly {model_name}[];
+  total: number;
+}}
+
 @Component({{
   selector: 'app-{kebab_model}',
   standalone: false,
   templateUrl: './{kebab_model}.component.html',
-  styleUrl: './{kebab_model}.component.scss'
+  styleUrl: './{kebab_model}.component.scss',
+  changeDetection: ChangeDetectionStrategy.OnPush,
+  providers: [ApproximatePaginatorIntl, {{ provide: MatPaginatorIntl, useExisting: ApproximatePaginatorIntl }}],
 }})
-export class {model_name}Component implements OnInit {{
+export class {model_name}Component {{
 
   searchQuery = '';
-  items: {model_name}[] = [];
 {headers_line}
 
-  total = 0;
   pageSize = 10;
   currentPage = 0;
 
-  constructor(private service: {model_name}Service) {{}}
-
-  ngOnInit() {{
-    this.fetchData(this.currentPage, this.pageSize);
-  }}
-
-  fetchData(skip: number, limit: number) {{
-    this.service.getAll(skip, limit).subscribe(response => {{
-      {map_block}
-      this.total = response['max_pages'];
-    }});
+  // Cada página es un array nuevo que llega por el async pipe: OnPush solo repinta cuando cambia
+  private readonly pageRequest$ = new BehaviorSubject({{ skip: 0, limit: this.pageSize }});
+  readonly page$: Observable<{model_name}Page>;
+
+  constructor(private service: {model_name}Service, private paginatorIntl: ApproximatePaginatorIntl) {{
+    this.page$ = this.pageRequest$.pipe(
+      switchMap(({{ skip, limit }}) => this.service.getAll(skip, limit).pipe(
+        tap(response => this.paginatorIntl.update(response.count?.mode === 'estimated', response.count?.mode === 'none')),
+        map(response => ({{
+          items: response['items'].map((item: any) => ({{
+            {map_fields}
+          }})),
+          total: paginatorLength(response, skip, limit),
+        }})),
+        catchError(() => of({{ items: [], total: 0 }})),
+      )),
+    );
   }}
 
   onPageChange(event: PageEvent) {{
     this.currentPage = event.pageIndex;
     this.pageSize = event.pageSize;
-    const skip = this.currentPage * this.pageSize;
-    this.fetchData(skip, this.pageSize);
+    this.pageRequest$.next({{ skip: this.currentPage * this.pageSize, limit: this.pageSize }});
   }}
 }}
 """
-    with open(ts_path, "w") as f:
-        f.write(ts_content)
+    write_file(ts_path, ts_content)
 
     # === HTML FILE ===
     html_content = f"""<div class="page">
@@ -90,25 +96,26 @@ export class {model_name}Component implements OnInit {{
         <mat-card-title>{model_name}s</mat-card-title>
       </mat-card-title-group>
     </mat-card-header>
-    <mat-card-content>
-      <mat-form-field appearance="outline" class="full-width">
-        <mat-label>Search...</mat-label>
-        <input matInput type="text" [(ngModel)]="searchQuery">
-        <mat-icon matSuffix>search</mat-icon>
-      </mat-form-field>
-      <app-table [headers]="headers" [data]="items"></app-table>
-    </mat-card-content>
-    <mat-paginator
-      [length]="total"
-      [pageSize]="pageSize"
-      [pageSizeOptions]="[10, 25, 50]"
-      (page)="onPageChange($event)">
-    </mat-paginator>
+    <ng-container *ngIf="{{ current: page$ | async }} as view">
+      <mat-card-content>
+        <mat-form-field appearance="outline" class="full-width">
+          <mat-label>Search...</mat-label>
+          <input matInput type="text" [(ngModel)]="searchQuery">
+          <mat-icon matSuffix>search</mat-icon>
+        </mat-form-field>
+        <app-table [headers]="headers" [data]="view.current?.items ?? []"></app-table>
+      </mat-card-content>
+      <mat-paginator
+        [length]="view.current?.total ?? 0"
+        [pageSize]="pageSize"
+        [pageSizeOptions]="[10, 25, 50]"
+        (page)="onPageChange($event)">
+      </mat-paginator>
+    </ng-container>
   </mat-card>
 </div>
 """
-    with open(html_path, "w") as f:
-        f.write(html_content)
+    write_file(html_path, html_content)
 
     # === SCSS FILE ===
     scss_content = """.full-width {
@@ -131,7 +138,6 @@ mat-icon {
   }
 }
 """
-    with open(scss_path, "w") as f:
-        f.write(scss_content)
+    write_file(scss_path, scss_content)
 
     print(f"✅ Componente {model_name} modificado correctamente")
\ No newline at end of file
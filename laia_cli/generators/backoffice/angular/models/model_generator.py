@@ -0,0 +1,64 @@
+import os
+import subprocess
+
+from laia_cli.generators.backoffice.angular.change_detection import NG_GENERATE_ARGS
+from laia_cli.generators.backoffice.angular.models.model_component_files import modify_model_component_files
+from laia_cli.generators.backoffice.angular.models.new_model_component_files import modify_new_model_component_files
+from laia_cli.generators.backoffice.angular.route_to_app_routing import add_new_route, collect_routes
+from laia_cli.generators.generate_service_ts import generate_ts_service
+from laia_cli.generators.generate_ts_interface import generate_ts_interface_from_yaml
+from laia_cli.generators.kebab_case_converter import to_kebab_case
+
+INTERFACES_DIR = "backoffice/src/app/interfaces"
+MODELS_PAGES_DIR = "backoffice/src/app/pages/models"
+
+
+def model_components_exist(model_name: str) -> bool:
+    return os.path.exists(os.path.join(MODELS_PAGES_DIR, to_kebab_case(model_name)))
+
+
+def regenerate_model_artifacts(model_name: str, schema_path: str):
+    """Regenera interfaz, servicio, componentes de listado y alta y rutas de un único modelo."""
+    kebab_name = to_kebab_case(model_name)
+
+    generate_ts_interface_from_yaml(schema_path, INTERFACES_DIR)
+    generate_ts_service(model_name)
+    modify_model_component_files(
+        yaml_path=schema_path,
+        component_base_path=f"models/{kebab_name}"
+    )
+    modify_new_model_component_files(
+        yaml_path=schema_path,
+        component_base_path=f"models/{kebab_name}"
+    )
+    with collect_routes():
+        add_new_route(
+            path=f"models/{kebab_name}",
+            component=f"{model_name}Component",
+            import_path=f"./pages/models/{kebab_name}/{kebab_name}.component",
+            guard=True
+        )
+        add_new_route(
+            path=f"models/{kebab_name}/new-{kebab_name}",
+            component=f"New{model_name}Component",
+            import_path=f"./pages/models/{kebab_name}/new-{kebab_name}/new-{kebab_name}.component",
+            guard=True
+        )
+
+
+def generate_model_components(model_name: str, schema_path: str):
+    """Crea con 'ng generate' los componentes de un modelo nuevo (para que queden declarados) y los rellena."""
+    kebab_name = to_kebab_case(model_name)
+    print(f"🆕 Generando componentes para modelo: {model_name} → {kebab_name}")
+
+    subprocess.run(
+        ["ng", "generate", "component", f"pages/models/{kebab_name}", *NG_GENERATE_ARGS],
+        cwd="backoffice",
+        check=True
+    )
+    subprocess.run(
+        ["ng", "generate", "component", f"pages/models/{kebab_name}/new-{kebab_name}", *NG_GENERATE_ARGS],
+        cwd="backoffice",
+        check=True
+    )
+    regenerate_model_artifacts(model_name, schema_path)
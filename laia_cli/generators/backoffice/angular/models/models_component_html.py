@@ -1,9 +1,9 @@
-import os
+from laia_cli.generators.files_generator import file_exists, write_file
 
 
 def modify_models_component_html():
     routing_path = "backoffice/src/app/pages/models/models.component.html"
-    if not os.path.exists(routing_path):
+    if not file_exists(routing_path):
         return
 
     content = """<div class="page">
@@ -17,7 +17,7 @@ def modify_models_component_html():
     <mat-card
       class="example-card"
       appearance="outlined"
-      *ngFor="let model of models"
+      *ngFor="let model of models; trackBy: trackByName"
       [routerLink]="['/models', model | kebabCase]"
     >
       <mat-card-header>
@@ -31,5 +31,4 @@ def modify_models_component_html():
   </div>
 </div>
 """
-    with open(routing_path, "w") as f:
-        f.write(content)
\ No newline at end of file
+    write_file(routing_path, content)
\ No newline at end of file
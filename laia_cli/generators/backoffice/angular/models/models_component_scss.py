@@ -1,9 +1,9 @@
-import os
+from laia_cli.generators.files_generator import file_exists, write_file
 
 
 def modify_models_component_scss():
     routing_path = "backoffice/src/app/pages/models/models.component.scss"
-    if not os.path.exists(routing_path):
+    if not file_exists(routing_path):
         return
 
     content = """mat-card {
@@ -32,5 +32,4 @@ mat-card-header {
   margin-bottom: 0px;
 }
 """
-    with open(routing_path, "w") as f:
-        f.write(content)
\ No newline at end of file
+    write_file(routing_path, content)
\ No newline at end of file
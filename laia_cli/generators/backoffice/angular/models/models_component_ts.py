@@ -1,16 +1,18 @@
 import os
 
+from laia_cli.generators.files_generator import file_exists, list_dir, write_file
+
 def modify_models_component_ts():
     routing_path = "backoffice/src/app/pages/models/models.component.ts"
     schemas_dir = "backend/openapi/schemas"
 
-    if not os.path.exists(routing_path) or not os.path.isdir(schemas_dir):
+    if not file_exists(routing_path) or not file_exists(schemas_dir):
         return
 
     # Obtener todos los nombres de archivo sin extensión .yaml o .yml
     model_files = [
         os.path.splitext(f)[0]
-        for f in os.listdir(schemas_dir)
+        for f in list_dir(schemas_dir)
         if (f.endswith(".yaml") or f.endswith(".yml")) and os.path.splitext(f)[0] != "User"
     ]
 
@@ -18,25 +20,25 @@ def modify_models_component_ts():
     models_array_str = ", ".join([f"'{name}'" for name in model_files])
 
     # Código TypeScript con los modelos ya cargados
-    content = f"""import {{ Component }} from '@angular/core';
+    content = f"""import {{ ChangeDetectionStrategy, Component }} from '@angular/core';
 
 @Component({{
   selector: 'app-models',
   standalone: false,
   templateUrl: './models.component.html',
   styleUrl: './models.component.scss',
+  changeDetection: ChangeDetectionStrategy.OnPush,
 }})
 export class ModelsComponent {{
 
-  models: string[] = [{models_array_str}];
-
-  constructor() {{}}
+  readonly models: readonly string[] = [{models_array_str}];
 
-  ngOnInit(): void {{}}
+  trackByName(index: number, model: string): string {{
+    return model;
+  }}
 }}
 """
 
-    with open(routing_path, "w") as f:
-        f.write(content)
+    write_file(routing_path, content)
 
     print(f"✅ ModelsComponent actualizado con: {model_files}")
@@ -0,0 +1,108 @@
+import yaml
+
+from laia_cli.generators.kebab_case_converter import to_kebab_case
+from laia_cli.generators.files_generator import file_exists, read_file, write_file
+
+
+def build_form_field(prop: str, config: dict, required_fields: list) -> str:
+    placeholder = config.get("x_frontend_placeholder", "")
+    label = config.get("x_frontend_fieldName", prop.capitalize())
+    is_required = "required" if prop in required_fields else ""
+
+    if config.get("type") == "boolean":
+        return f"""
+<div class="full-width">
+  <label><input type="checkbox" [(ngModel)]="item.{prop}" name="{prop}"> {label}</label>
+</div>
+"""
+
+    input_type = "number" if config.get("type") in ("integer", "number") else "text"
+    return f"""
+<mat-form-field appearance="outline" class="full-width">
+  <mat-label>{label}</mat-label>
+  <input matInput type="{input_type}" placeholder="{placeholder}" [(ngModel)]="item.{prop}" name="{prop}" {is_required}>
+</mat-form-field>
+"""
+
+
+def modify_new_model_component_files(yaml_path: str, component_base_path: str):
+    if not file_exists(yaml_path):
+        print(f"⚠️  No existe el YAML: {yaml_path}")
+        return
+
+    schema = yaml.safe_load(read_file(yaml_path))
+
+    model_name, definition = next(iter(schema.items()))
+    properties = definition.get("properties", {})
+    required_fields = definition.get("required", [])
+
+    kebab_model = to_kebab_case(model_name)
+    service_file = model_name.lower()
+    component_path = f"backoffice/src/app/pages/{component_base_path}/new-{kebab_model}/new-{kebab_model}.component"
+
+
+    # === HTML FILE ===
+    form_fields = [
+        build_form_field(prop, config or {}, required_fields)
+        for prop, config in properties.items()
+        if (config or {}).get("x_frontend_editable", True)
+    ]
+
+    html_content = f"""
+<div class="page">
+  <h1>Create New {model_name}</h1>
+  <form (ngSubmit)="create()">
+    {''.join(form_fields)}
+    <button mat-raised-button color="primary" type="submit">Create</button>
+  </form>
+</div>
+"""
+    write_file(f"{component_path}.html", html_content)
+
+    # === TS FILE ===
+    ts_content = f"""import {{ ChangeDetectionStrategy, Component }} from '@angular/core';
+import {{ Router }} from '@angular/router';
+import {{ {model_name}Service }} from '../../../../services/{service_file}.service';
+
+@Component({{
+  selector: 'app-new-{kebab_model}',
+  standalone: false,
+  templateUrl: './new-{kebab_model}.component.html',
+  styleUrl: './new-{kebab_model}.component.scss',
+  changeDetection: ChangeDetectionStrategy.OnPush,
+}})
+export class New{model_name}Component {{
+
+  item: any = {{}};
+
+  constructor(
+    private service: {model_name}Service,
+    private router: Router
+  ) {{}}
+
+  create(): void {{
+    this.service.create(this.item).subscribe(() => {{
+      this.router.navigate(['/{component_base_path}']);
+    }});
+  }}
+
+}}
+"""
+    write_file(f"{component_path}.ts", ts_content)
+
+    # === SCSS FILE ===
+    scss_content = """.form {
+  display: flex;
+  flex-direction: column;
+  gap: 16px;
+  max-width: 500px;
+  margin: auto;
+}
+
+button {
+  align-self: flex-start;
+}
+"""
+    write_file(f"{component_path}.scss", scss_content)
+
+    print(f"✅ Componente New{model_name} modificado correctamente")
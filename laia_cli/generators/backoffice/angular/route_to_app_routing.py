@@ -1,10 +1,19 @@
-import os
 import re
+from contextlib import contextmanager
+
+from laia_cli.generators.files_generator import file_exists, read_file, write_file
+
+ROUTING_PATH = "backoffice/src/app/app-routing.module.ts"
+
+ROUTES_START = re.compile(r"const routes\s*:\s*Routes\s*=\s*\[")
+ROUTE_PATH = re.compile(r"path\s*:\s*['\"]([^'\"]*)['\"]")
+IMPORT_LINE = re.compile(r"^import\b.*?;[ \t]*$", re.MULTILINE | re.DOTALL)
+IMPORT_NAMES = re.compile(r"import\s*{([^}]*)}")
 
 
 def add_route_to_app_routing():
-    routing_path = "backoffice/src/app/app-routing.module.ts"
-    if not os.path.exists(routing_path):
+    routing_path = ROUTING_PATH
+    if not file_exists(routing_path):
         return  # No routing module
 
     content = """import { NgModule } from '@angular/core';
@@ -35,45 +44,278 @@ const routes: Routes = [
 })
 export class AppRoutingModule { }
 """
-    with open(routing_path, "w") as f:
-        f.write(content)
+    write_file(routing_path, content)
 
-def add_new_route(path: str, component: str, import_path: str, guard: bool = True):
-    routing_path = "backoffice/src/app/app-routing.module.ts"
-    if not os.path.exists(routing_path):
-        print("⚠️ No se encontró app-routing.module.ts")
-        return
+    # Si hay una recolección de rutas en curso, debe partir del fichero recién escrito
+    if _active_routes is not None:
+        _active_routes.model = None
 
-    with open(routing_path, "r") as f:
-        content = f.read()
+def _skip_string(content: str, i: int) -> int:
+    """Devuelve la posición siguiente al literal de cadena que empieza en content[i]."""
+    quote = content[i]
+    i += 1
+    while i < len(content) and content[i] != quote:
+        i += 2 if content[i] == "\\" else 1
+    return i + 1
 
-    # 1. Agregar import si no existe
-    import_statement = f"import {{ {component} }} from '{import_path}';"
-    if import_statement not in content:
-        # Insertar el import antes de 'const routes'
-        content = content.replace("const routes:", f"{import_statement}\n\nconst routes:")
 
-    # 2. Verificar si la ruta ya existe
-    route_line = f"path: '{path}'"
-    if route_line in content:
-        print(f"ℹ️ Ruta '/{path}' ya existe.")
-        return
+def _skip_comment(content: str, i: int) -> int:
+    """Devuelve la posición siguiente al comentario '//' o '/* */' que empieza en content[i]."""
+    if content.startswith("//", i):
+        end = content.find("\n", i)
+        return len(content) if end == -1 else end
+    end = content.find("*/", i + 2)
+    return len(content) if end == -1 else end + 2
+
+
+def _is_comment(entry: str) -> bool:
+    return entry.startswith(("//", "/*"))
+
+
+def _split_routes(body: str) -> list:
+    """
+    Separa el contenido del array de rutas por las comas de primer nivel, sin ellas. Los comentarios
+    sueltos son entradas propias; un comentario '//' al final de la línea de una entrada (antes o después
+    de su coma) se queda en la entrada; lo demás ('{...}', '...adminRoutes', etc.) se conserva tal cual.
+    """
+    entries = []
+    current = ""
+    after_comma = False
+    i, depth = 0, 0
+    while i < len(body):
+        char = body[i]
+        if char in "'\"`":
+            end = _skip_string(body, i)
+            current += body[i:end]
+            i = end
+            continue
+        if body.startswith(("//", "/*"), i):
+            end = _skip_comment(body, i)
+            comment = body[i:end].rstrip()
+            if depth == 0 and not current.strip():
+                if after_comma and "\n" not in current and comment.startswith("//"):
+                    # '{ ... }, // comentario': sigue siendo de la entrada anterior
+                    entries[-1] = f"{entries[-1]} {comment}"
+                else:
+                    entries.append(comment)
+                after_comma = False
+                current = ""
+            else:
+                current += body[i:end]
+            i = end
+            continue
+        if char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+        elif char == "," and depth == 0:
+            if current.strip():
+                entries.append(current.strip())
+                after_comma = True
+            current = ""
+            i += 1
+            continue
+        current += char
+        i += 1
+    if current.strip():
+        entries.append(current.strip())
+    return entries
+
+
+def _trailing_comment_start(entry: str) -> int:
+    """Posición del comentario '//' de primer nivel con el que termina la entrada, o -1."""
+    i, depth = 0, 0
+    while i < len(entry):
+        if entry[i] in "'\"`":
+            i = _skip_string(entry, i)
+            continue
+        if entry.startswith(("//", "/*"), i):
+            end = _skip_comment(entry, i)
+            if depth == 0 and entry.startswith("//", i) and end >= len(entry):
+                return i
+            i = end
+            continue
+        if entry[i] in "([{":
+            depth += 1
+        elif entry[i] in ")]}":
+            depth -= 1
+        i += 1
+    return -1
+
+
+def _render_entry(entry: str) -> str:
+    if _is_comment(entry):
+        return f"  {entry}"
+    # La coma va antes del comentario final, no dentro de él
+    comment = _trailing_comment_start(entry)
+    if comment == -1:
+        return f"  {entry},"
+    return f"  {entry[:comment].rstrip()}, {entry[comment:]}"
+
+
+class RoutingModel:
+    """
+    app-routing.module.ts parseado una sola vez: cabecera (imports), entradas del array 'routes'
+    y resto del fichero. Las rutas añadidas a mano se conservan tal cual al volver a renderizar.
+    """
+
+    def __init__(self, header: str, routes_open: str, routes: list, footer: str):
+        self.header = header
+        self.routes_open = routes_open
+        self.routes = routes
+        self.footer = footer
+        self.new_imports = []
+        self.paths = {self.route_path(route) for route in routes}
+        self.imported = {
+            name.strip().split(" as ")[-1].strip()
+            for names in IMPORT_NAMES.findall(header)
+            for name in names.split(",")
+        }
+
+    @staticmethod
+    def route_path(route: str):
+        match = ROUTE_PATH.search(route)
+        return match.group(1) if match else None
+
+    @classmethod
+    def parse(cls, content: str):
+        match = ROUTES_START.search(content)
+        if not match:
+            return None
+
+        # Buscar el ']' que cierra el array, ignorando corchetes dentro de cadenas y comentarios
+        i, depth = match.end(), 1
+        while i < len(content):
+            if content[i] in "'\"`":
+                i = _skip_string(content, i)
+                continue
+            if content.startswith(("//", "/*"), i):
+                i = _skip_comment(content, i)
+                continue
+            if content[i] == "[":
+                depth += 1
+            elif content[i] == "]":
+                depth -= 1
+                if depth == 0:
+                    break
+            i += 1
 
-    # 3. Construir la ruta
-    route_entry = f" {{ path: '{path}', component: {component}"
-    if guard:
-        route_entry += ", canActivate: [AuthGuard]"
-    route_entry += " },"
+        if depth != 0:
+            return None
 
-    # 4. Insertar la ruta antes de la línea con '**'
-    pattern = re.compile(r"(\{ path: '\*\*'.*?})", re.DOTALL)
-    match = pattern.search(content)
-    if match:
-        full_match = match.group(1)
-        content = content.replace(full_match, f"{route_entry}\n  {full_match}")
+        return cls(
+            header=content[:match.start()],
+            routes_open=match.group(0),
+            routes=_split_routes(content[match.end():i]),
+            footer=content[i:],
+        )
 
-    # 5. Guardar cambios
-    with open(routing_path, "w") as f:
-        f.write(content)
+    def wildcard_index(self) -> int:
+        """Posición de la ruta comodín '**' (se buscan desde el final: suele ser la última)."""
+        for i in range(len(self.routes) - 1, -1, -1):
+            if self.route_path(self.routes[i]) == "**":
+                return i
+        return len(self.routes)
 
-    print(f"✅ Ruta '/{path}' → {component} añadida correctamente.")
\ No newline at end of file
+    def add(self, path: str, component: str, import_path: str, guard: bool = True) -> bool:
+        """Añade import y ruta (antes de la ruta comodín '**'). Devuelve False si la ruta ya existía."""
+        if component not in self.imported:
+            self.new_imports.append(f"import {{ {component} }} from '{import_path}';")
+            self.imported.add(component)
+
+        if path in self.paths:
+            return False
+
+        route_entry = f"{{ path: '{path}', component: {component}"
+        if guard:
+            route_entry += ", canActivate: [AuthGuard]"
+        route_entry += " }"
+
+        self.routes.insert(self.wildcard_index(), route_entry)
+        self.paths.add(path)
+        return True
+
+    def render(self) -> str:
+        header = self.header
+        if self.new_imports:
+            imports = "\n".join(self.new_imports)
+            last_import = None
+            for last_import in IMPORT_LINE.finditer(header):
+                pass
+            if last_import is not None:
+                header = f"{header[:last_import.end()]}\n{imports}{header[last_import.end():]}"
+            else:
+                header = f"{imports}\n\n{header}"
+
+        lines = [_render_entry(route) for route in self.routes]
+        return f"{header}{self.routes_open}\n" + "".join(f"{line}\n" for line in lines) + self.footer
+
+
+class RouteCollector:
+    """Acumula las rutas de una generación y escribe app-routing.module.ts una única vez en flush()."""
+
+    def __init__(self, routing_path: str = ROUTING_PATH):
+        self.routing_path = routing_path
+        self.model = None
+        self.dirty = False
+
+    def load(self):
+        if self.model is None:
+            if not file_exists(self.routing_path):
+                return None
+            self.model = RoutingModel.parse(read_file(self.routing_path))
+            self.dirty = False
+            if self.model is None:
+                print(f"⚠️ No se encontró 'const routes' en {self.routing_path}")
+        return self.model
+
+    def add(self, path: str, component: str, import_path: str, guard: bool = True) -> bool:
+        model = self.load()
+        if model is None:
+            print("⚠️ No se encontró app-routing.module.ts")
+            return False
+
+        imports_before = len(model.new_imports)
+        added = model.add(path, component, import_path, guard)
+        self.dirty |= added or len(model.new_imports) != imports_before
+        if added:
+            print(f"✅ Ruta '/{path}' → {component} añadida correctamente.")
+        else:
+            print(f"ℹ️ Ruta '/{path}' ya existe.")
+        return added
+
+    def flush(self):
+        if self.model is not None and self.dirty:
+            rendered = self.model.render()
+            # Comprobación de ida y vuelta: si el fichero renderizado no se lee igual, no se sobrescribe
+            reparsed = RoutingModel.parse(rendered)
+            if reparsed is None or reparsed.routes != self.model.routes:
+                print(f"⚠️ No se pudo reescribir {self.routing_path} sin perder rutas: añádelas a mano.")
+            else:
+                write_file(self.routing_path, rendered)
+            self.model = None
+            self.dirty = False
+
+
+_active_routes = None
+
+@contextmanager
+def collect_routes():
+    """Agrupa todas las llamadas a add_new_route del bloque 'with' en una sola escritura del routing."""
+    global _active_routes
+    if _active_routes is not None:
+        # Ya hay una recolección en curso (p. ej. start → regenerate_model_artifacts): se reutiliza
+        yield _active_routes
+        return
+
+    _active_routes = RouteCollector()
+    try:
+        yield _active_routes
+        _active_routes.flush()
+    finally:
+        _active_routes = None
+
+
+def add_new_route(path: str, component: str, import_path: str, guard: bool = True):
+    with collect_routes() as routes:
+        routes.add(path, component, import_path, guard)
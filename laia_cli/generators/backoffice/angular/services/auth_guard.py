@@ -1,7 +1,8 @@
+from laia_cli.generators.files_generator import write_file
+
 def add_auth_guard():
     app_component_ts = "backoffice/src/app/services/auth.guard.ts"
-    with open(app_component_ts, "w") as f:
-        f.write("""import { Injectable } from '@angular/core';
+    write_file(app_component_ts, """import { Injectable } from '@angular/core';
 import { CanActivate, Router } from '@angular/router';
 import { AuthService } from '../services/auth.service';
 
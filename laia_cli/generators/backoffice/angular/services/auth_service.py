@@ -1,7 +1,8 @@
+from laia_cli.generators.files_generator import write_file
+
 def add_auth_service():
     app_component_ts = "backoffice/src/app/services/auth.service.ts"
-    with open(app_component_ts, "w") as f:
-        f.write("""import { Injectable } from '@angular/core';
+    write_file(app_component_ts, """import { Injectable } from '@angular/core';
 import { CommunicationService } from './communication.service';
 import { Observable, BehaviorSubject } from 'rxjs';
 import { tap } from 'rxjs/operators';
@@ -1,9 +1,25 @@
+from laia_cli.generators.files_generator import write_file
+
 def add_comm_service():
     app_component_ts = "backoffice/src/app/services/communication.service.ts"
-    with open(app_component_ts, "w") as f:
-        f.write("""import { HttpClient, HttpHeaders, HttpParams } from '@angular/common/http';
+    write_file(app_component_ts, """import { HttpClient, HttpErrorResponse, HttpHeaders, HttpParams, HttpResponse } from '@angular/common/http';
 import { Injectable } from '@angular/core';
-import { Observable } from 'rxjs';
+import { Observable, defer, of, throwError } from 'rxjs';
+import { catchError, finalize, map, shareReplay } from 'rxjs/operators';
+
+export type CountMode = 'exact' | 'estimated' | 'none';
+
+// Total de una búsqueda, leído de las cabeceras X-Total-Count, X-Total-Count-Mode y X-Has-More
+export interface PageCount {
+  total: number | null;
+  mode: CountMode;
+  hasMore: boolean | null;
+}
+
+interface CachedResponse {
+  etag: string;
+  body: any;
+}
 
 @Injectable({
   providedIn: 'root',
@@ -11,10 +27,28 @@ import { Observable } from 'rxjs';
 export class CommunicationService {
   private baseUrl = 'http://localhost:8005';
 
+  // Última respuesta con ETag de cada lectura/búsqueda, para revalidar con If-None-Match
+  private cache = new Map<string, CachedResponse>();
+  private maxCacheEntries = 200;
+
+  // Peticiones idénticas en curso: se comparten en lugar de repetirse
+  private inFlight = new Map<string, Observable<any>>();
+
   constructor(private http: HttpClient) {}
 
   get<T>(url: string): Observable<T> {
-    return this.http.get<T>(`${this.baseUrl}${url}`);
+    return this.conditional<T>(`GET ${url}`, (headers) =>
+      this.http.get<T>(`${this.baseUrl}${url}`, { headers, observe: 'response' })
+    );
+  }
+
+  search<T>(url: string, data: any): Observable<T> {
+    return this.conditional<T>(`POST ${url} ${JSON.stringify(data)}`, (headers) =>
+      this.http.post<T>(`${this.baseUrl}${url}`, data, { headers, observe: 'response' }).pipe(
+        // El total va en cabeceras: se añade al cuerpo como 'count' para que la caché por ETag lo conserve
+        map((response) => response.clone({ body: { ...(response.body as any), count: this.readCount(response.headers) } as T }))
+      )
+    );
   }
 
   post<T>(url: string, data: any, options?: {
@@ -31,5 +65,66 @@ export class CommunicationService {
   delete<T>(url: string): Observable<T> {
     return this.http.delete<T>(`${this.baseUrl}${url}`);
   }
+
+  private conditional<T>(key: string, send: (headers: HttpHeaders) => Observable<HttpResponse<T>>): Observable<T> {
+    // defer: la petición solo se registra como en curso cuando alguien se suscribe
+    return defer(() => {
+      const pending = this.inFlight.get(key);
+      if (pending) {
+        return pending as Observable<T>;
+      }
+
+      const cached = this.cache.get(key);
+      let headers = new HttpHeaders();
+      if (cached) {
+        headers = headers.set('If-None-Match', cached.etag);
+      }
+
+      const request$: Observable<T> = send(headers).pipe(
+        map((response) => {
+          const etag = response.headers.get('ETag');
+          if (etag) {
+            this.remember(key, { etag, body: response.body });
+          }
+          return response.body as T;
+        }),
+        catchError((error: HttpErrorResponse) => {
+          // 304: el servidor confirma que lo que tenemos sigue siendo válido
+          if (error.status === 304 && cached) {
+            return of(cached.body as T);
+          }
+          return throwError(() => error);
+        }),
+        // También al cancelarse (todos los suscriptores se van antes de la respuesta)
+        finalize(() => {
+          if (this.inFlight.get(key) === request$) {
+            this.inFlight.delete(key);
+          }
+        }),
+        shareReplay({ bufferSize: 1, refCount: true })
+      );
+
+      this.inFlight.set(key, request$);
+      return request$;
+    });
+  }
+
+  private readCount(headers: HttpHeaders): PageCount {
+    const total = headers.get('X-Total-Count');
+    const hasMore = headers.get('X-Has-More');
+    return {
+      total: total === null ? null : Number(total),
+      mode: (headers.get('X-Total-Count-Mode') ?? 'exact') as CountMode,
+      hasMore: hasMore === null ? null : hasMore === 'true',
+    };
+  }
+
+  private remember(key: string, entry: CachedResponse): void {
+    this.cache.delete(key);
+    this.cache.set(key, entry);
+    if (this.cache.size > this.maxCacheEntries) {
+      this.cache.delete(this.cache.keys().next().value as string);
+    }
+  }
 }
 """)
\ No newline at end of file
@@ -1,8 +1,10 @@
+from laia_cli.generators.files_generator import write_file
+
 def add_intercept_service():
     app_component_ts = "backoffice/src/app/services/jwt.interceptor.ts"
-    with open(app_component_ts, "w") as f:
-        f.write("""import { Injectable } from '@angular/core';
+    write_file(app_component_ts, """import { Injectable } from '@angular/core';
 import {
+
   HttpInterceptor,
   HttpRequest,
   HttpHandler,
@@ -0,0 +1,45 @@
+from laia_cli.generators.files_generator import write_file
+
+def add_paginator_intl():
+    paginator_intl_ts = "backoffice/src/app/services/approximate-paginator-intl.ts"
+    write_file(paginator_intl_ts, """import { Injectable } from '@angular/core';
+import { MatPaginatorIntl } from '@angular/material/paginator';
+import { PageCount } from './communication.service';
+
+// Longitud para el paginador: el total de la búsqueda o, sin total, lo visto más uno si hay otra página
+export function paginatorLength(response: { items: any[]; max_pages: number; count?: PageCount }, skip: number, limit: number): number {
+  const count = response.count;
+  if (count?.mode === 'none') {
+    return skip + response.items.length + (count.hasMore ? 1 : 0);
+  }
+  return count?.total ?? response.max_pages * limit;
+}
+
+// Etiqueta del paginador según el modo del total: 'of about N' si es estimado, sin total si no se cuenta
+@Injectable()
+export class ApproximatePaginatorIntl extends MatPaginatorIntl {
+  private approximate = false;
+  private unknownTotal = false;
+
+  update(approximate: boolean, unknownTotal: boolean): void {
+    if (approximate === this.approximate && unknownTotal === this.unknownTotal) {
+      return;
+    }
+    this.approximate = approximate;
+    this.unknownTotal = unknownTotal;
+    this.changes.next();
+  }
+
+  override getRangeLabel = (page: number, pageSize: number, length: number): string => {
+    const start = page * pageSize;
+    if (length === 0 || pageSize === 0) {
+      return `0 of ${length}`;
+    }
+    if (this.unknownTotal) {
+      return `${start + 1} – ${start + pageSize}`;
+    }
+    const end = Math.min(start + pageSize, length);
+    return this.approximate ? `${start + 1} – ${end} of about ${length}` : `${start + 1} – ${end} of ${length}`;
+  };
+}
+""")
@@ -0,0 +1,145 @@
+from laia_cli.generators.files_generator import write_file
+
+def add_storage_service():
+    storage_service_ts = "backoffice/src/app/services/storage.service.ts"
+    write_file(storage_service_ts, """import { HttpBackend, HttpClient, HttpEventType, HttpHeaders } from '@angular/common/http';
+import { Injectable } from '@angular/core';
+import { Observable, concat, defer, from, of, throwError } from 'rxjs';
+import { catchError, distinctUntilChanged, filter, map, mergeMap, switchMap } from 'rxjs/operators';
+import { CommunicationService } from './communication.service';
+
+export interface StorageObject {
+  key: string;
+  size: number;
+  last_modified: string;
+}
+
+export interface StorageUploadSettings {
+  bucket: string;
+  part_size: number;
+  multipart_threshold: number;
+  max_parallel_parts: number;
+}
+
+interface PresignedUpload {
+  url: string;
+  headers: { [name: string]: string };
+}
+
+interface MultipartUpload {
+  upload_id: string;
+  key: string;
+  part_size: number;
+  parts: { part_number: number; url: string }[];
+}
+
+@Injectable({
+  providedIn: 'root',
+})
+export class StorageService {
+  // Cliente sin interceptores: MinIO rechaza las URLs firmadas si llevan además el Authorization del backend
+  private direct: HttpClient;
+
+  constructor(private comm: CommunicationService, httpBackend: HttpBackend) {
+    this.direct = new HttpClient(httpBackend);
+  }
+
+  settings(): Observable<StorageUploadSettings> {
+    return this.comm.get<StorageUploadSettings>('/storage-uploads/settings');
+  }
+
+  list(bucket: string): Observable<StorageObject[]> {
+    return this.comm.get<StorageObject[]>(`/storage/${bucket}`);
+  }
+
+  remove(bucket: string, key: string): Observable<any> {
+    return this.comm.delete(`/storage/${bucket}/${this.encodeKey(key)}`);
+  }
+
+  downloadUrl(bucket: string, key: string): Observable<string> {
+    return this.comm.post<{ url: string }>(`/storage/${bucket}/presigned-download`, { key }).pipe(
+      map((response) => response.url)
+    );
+  }
+
+  /** Sube el fichero directamente a MinIO y emite el porcentaje de progreso (0-100). */
+  upload(bucket: string, file: File, settings: StorageUploadSettings): Observable<number> {
+    const progress$ = file.size >= settings.multipart_threshold
+      ? this.uploadMultipart(bucket, file, settings)
+      : this.uploadSingle(bucket, file);
+    return progress$.pipe(distinctUntilChanged());
+  }
+
+  private uploadSingle(bucket: string, file: File): Observable<number> {
+    const contentType = file.type || 'application/octet-stream';
+
+    return this.comm.post<PresignedUpload>(`/storage/${bucket}/presigned-upload`, { key: file.name, content_type: contentType }).pipe(
+      switchMap((presigned) => this.direct.put(presigned.url, file, {
+        headers: new HttpHeaders(presigned.headers),
+        reportProgress: true,
+        observe: 'events',
+      })),
+      filter((event) => event.type === HttpEventType.UploadProgress || event.type === HttpEventType.Response),
+      map((event) => event.type === HttpEventType.UploadProgress
+        ? Math.min(99, Math.round(100 * event.loaded / (event.total || file.size)))
+        : 100)
+    );
+  }
+
+  private uploadMultipart(bucket: string, file: File, settings: StorageUploadSettings): Observable<number> {
+    const contentType = file.type || 'application/octet-stream';
+
+    return this.comm.post<MultipartUpload>(`/storage/${bucket}/multipart-uploads`, {
+      key: file.name,
+      content_type: contentType,
+      size: file.size,
+    }).pipe(
+      switchMap((upload) => {
+        const loaded = new Map<number, number>();
+        const uploaded: { part_number: number; etag: string }[] = [];
+        const percent = () => {
+          let total = 0;
+          loaded.forEach((bytes) => total += bytes);
+          return Math.min(99, Math.round(100 * total / file.size));
+        };
+
+        // Las partes se suben en paralelo (hasta max_parallel_parts a la vez), cada una con su propio PUT
+        const parts$ = from(upload.parts).pipe(
+          mergeMap((part) => {
+            const start = (part.part_number - 1) * upload.part_size;
+            const chunk = file.slice(start, start + upload.part_size);
+
+            return this.direct.put(part.url, chunk, { reportProgress: true, observe: 'events' }).pipe(
+              map((event) => {
+                if (event.type === HttpEventType.UploadProgress) {
+                  loaded.set(part.part_number, event.loaded);
+                } else if (event.type === HttpEventType.Response) {
+                  loaded.set(part.part_number, chunk.size);
+                  uploaded.push({ part_number: part.part_number, etag: event.headers.get('ETag') || '' });
+                }
+                return percent();
+              })
+            );
+          }, settings.max_parallel_parts)
+        );
+
+        const complete$ = defer(() => this.comm.post(`/storage/${bucket}/multipart-uploads/${upload.upload_id}/complete`, {
+          key: upload.key,
+          parts: uploaded,
+        })).pipe(map(() => 100));
+
+        return concat(parts$, complete$).pipe(
+          catchError((error) => this.comm.post(`/storage/${bucket}/multipart-uploads/${upload.upload_id}/abort`, { key: upload.key }).pipe(
+            catchError(() => of(null)),
+            switchMap(() => throwError(() => error))
+          ))
+        );
+      })
+    );
+  }
+
+  private encodeKey(key: string): string {
+    return key.split('/').map(encodeURIComponent).join('/');
+  }
+}
+""")
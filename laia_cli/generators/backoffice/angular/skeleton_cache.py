@@ -0,0 +1,160 @@
+import datetime
+import hashlib
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import time
+
+ANGULAR_CLI_VERSION = "19"
+# Subir si cambia cómo se genera el esqueleto: las entradas anteriores dejan de usarse
+SKELETON_VERSION = 1
+NG_NEW_ARGS = ["--routing", "--style=scss", "--no-standalone", "--strict", "--skip-tests", "--defaults"]
+MATERIAL_ANSWERS = b"azure-blue\nn\n"
+# Se regeneran en cada proyecto, no se copian
+SKIP_DIRS = (".angular",)
+
+
+def cache_root() -> str:
+    """Directorio de caché del usuario: LAIA_CACHE_DIR, o el estándar de cada sistema."""
+    if os.environ.get("LAIA_CACHE_DIR"):
+        return os.environ["LAIA_CACHE_DIR"]
+    if sys.platform == "win32":
+        return os.path.join(os.environ.get("LOCALAPPDATA", os.path.expanduser("~")), "laia", "Cache")
+    if sys.platform == "darwin":
+        return os.path.join(os.path.expanduser("~"), "Library", "Caches", "laia")
+    return os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")), "laia")
+
+
+def skeleton_key() -> str:
+    """
+    Versión del esqueleto: Angular CLI, flags de 'ng new', tema de Material y plataforma
+    (node_modules lleva binarios nativos como esbuild, que no sirven en otro sistema).
+    """
+    recipe = json.dumps([SKELETON_VERSION, NG_NEW_ARGS, MATERIAL_ANSWERS.decode()])
+    digest = hashlib.sha1(recipe.encode()).hexdigest()[:8]
+    return f"angular-{ANGULAR_CLI_VERSION}-{sys.platform}-{platform.machine().lower()}-{digest}"
+
+
+def skeleton_dir() -> str:
+    return os.path.join(cache_root(), "skeletons", skeleton_key())
+
+
+def skeleton_ready() -> bool:
+    return os.path.isfile(os.path.join(skeleton_dir(), "manifest.json"))
+
+
+def node_version() -> str:
+    try:
+        return subprocess.run(["node", "--version"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def warm_angular_skeleton(force: bool = False) -> bool:
+    """
+    Genera en la caché un proyecto Angular recién creado ('ng new' + '@angular/material') con su
+    node_modules. Se construye en un directorio temporal y se publica con un rename, así que una
+    ejecución cortada no deja un esqueleto a medias.
+    """
+    target = skeleton_dir()
+    if skeleton_ready() and not force:
+        print(f"✅ Angular skeleton already cached at {target}")
+        return True
+    if shutil.which("npx") is None:
+        print("❌ npx not found. Install Node.js to warm the Angular skeleton.")
+        return False
+
+    staging = f"{target}.tmp-{os.getpid()}"
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+    env = os.environ.copy()
+    env["NG_CLI_ANALYTICS"] = "false"
+
+    print(f"🔥 Warming Angular {ANGULAR_CLI_VERSION} skeleton (ng new + @angular/material)...")
+    start = time.perf_counter()
+    try:
+        subprocess.run(
+            ["npx", "-y", "-p", f"@angular/cli@{ANGULAR_CLI_VERSION}", "ng", "new", "backoffice", *NG_NEW_ARGS],
+            cwd=staging, env=env, check=True,
+        )
+        project = os.path.join(staging, "backoffice")
+        subprocess.run(
+            [os.path.join(project, "node_modules", ".bin", "ng"), "add", "@angular/material", "--skip-confirmation"],
+            cwd=project, env=env, check=True, input=MATERIAL_ANSWERS,
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        shutil.rmtree(staging, ignore_errors=True)
+        print(f"❌ Failed to warm the Angular skeleton: {e}")
+        return False
+
+    with open(os.path.join(project, "package.json"), "r", encoding="utf-8") as f:
+        package = json.load(f)
+    manifest = {
+        "key": skeleton_key(),
+        "angular_cli": ANGULAR_CLI_VERSION,
+        "node": node_version(),
+        "dependencies": package.get("dependencies", {}),
+        "dev_dependencies": package.get("devDependencies", {}),
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+    with open(os.path.join(staging, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    shutil.rmtree(target, ignore_errors=True)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    os.replace(staging, target)
+    print(f"✅ Angular skeleton cached in {time.perf_counter() - start:.0f}s at {target}")
+    return True
+
+
+def materialize_skeleton(target: str) -> bool:
+    """
+    Crea 'target' a partir del esqueleto de la caché, sin red. node_modules se enlaza con hardlinks
+    (npm sustituye ficheros, no los edita); el código del proyecto se copia porque 'ng generate'
+    lo modifica en el sitio. Si no se pueden crear hardlinks (otro disco) se copia todo.
+    """
+    source = skeleton_dir()
+    if not skeleton_ready():
+        return False
+    with open(os.path.join(source, "manifest.json"), "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    current_node = node_version()
+    if manifest.get("node") and current_node and manifest["node"].split(".")[0] != current_node.split(".")[0]:
+        print(f"⚠️  Angular skeleton was cached with Node {manifest['node']}, running {current_node}. Run 'laia cache warm --force' if the build fails.")
+
+    stats = {"linked": 0, "copied": 0}
+
+    def link_or_copy(src, dst):
+        try:
+            os.link(src, dst)
+            stats["linked"] += 1
+        except OSError:
+            shutil.copy2(src, dst)
+            stats["copied"] += 1
+        return dst
+
+    start = time.perf_counter()
+    project = os.path.join(source, "backoffice")
+    shutil.copytree(project, target, symlinks=True, dirs_exist_ok=True,
+                    ignore=shutil.ignore_patterns("node_modules", *SKIP_DIRS))
+    shutil.copytree(os.path.join(project, "node_modules"), os.path.join(target, "node_modules"),
+                    symlinks=True, dirs_exist_ok=True, copy_function=link_or_copy)
+    print(f"📦 Angular project restored from cache in {time.perf_counter() - start:.1f}s "
+          f"({stats['linked']} files hardlinked, {stats['copied']} copied)")
+    return True
+
+
+def cache_size(directory: str) -> int:
+    total = 0
+    seen = set()
+    for root, _, files in os.walk(directory):
+        for name in files:
+            stat_result = os.lstat(os.path.join(root, name))
+            if (stat_result.st_dev, stat_result.st_ino) not in seen:
+                seen.add((stat_result.st_dev, stat_result.st_ino))
+                total += stat_result.st_size
+    return total
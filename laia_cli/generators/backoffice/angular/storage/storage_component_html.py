@@ -0,0 +1,64 @@
+from laia_cli.generators.files_generator import file_exists, write_file
+
+
+def modify_storage_component_html():
+    html_path = "backoffice/src/app/pages/storage/storage.component.html"
+    if not file_exists(html_path):
+        return
+
+    content = """<div class="page">
+  <h1>Storage</h1>
+
+  <div *ngIf="error" class="no-data">{{ error }}</div>
+
+  <mat-card appearance="outlined" *ngIf="settings">
+    <mat-card-header>
+      <mat-card-title-group>
+        <mat-card-title>{{ bucket }}</mat-card-title>
+        <button mat-flat-button (click)="fileInput.click()">
+          <mat-icon>upload</mat-icon>
+          Upload
+        </button>
+      </mat-card-title-group>
+      <input #fileInput type="file" multiple hidden (change)="onFilesSelected($event)">
+    </mat-card-header>
+
+    <mat-card-content>
+      <div class="uploads" *ngIf="uploads.length > 0">
+        <div class="upload" *ngFor="let upload of uploads; trackBy: trackUpload">
+          <div class="upload-info">
+            <span class="upload-name">{{ upload.name }}</span>
+            <span class="upload-status">
+              <ng-container *ngIf="upload.error">{{ upload.error }}</ng-container>
+              <ng-container *ngIf="!upload.error">{{ formatSize(upload.size) }} · {{ upload.progress }}%</ng-container>
+            </span>
+          </div>
+          <mat-progress-bar
+            [mode]="upload.progress === 0 && !upload.error ? 'indeterminate' : 'determinate'"
+            [value]="upload.progress"
+            [color]="upload.error ? 'warn' : 'primary'">
+          </mat-progress-bar>
+        </div>
+        <button mat-button (click)="clearFinished()">Clear finished</button>
+      </div>
+
+      <div *ngIf="!loading && objects.length === 0" class="no-data">
+        There is no data yet ...
+      </div>
+
+      <mat-list *ngIf="objects.length > 0">
+        <mat-list-item *ngFor="let object of objects; trackBy: trackObject">
+          <mat-icon matListItemIcon>description</mat-icon>
+          <span matListItemTitle>{{ object.key }}</span>
+          <span matListItemLine>{{ formatSize(object.size) }} · {{ object.last_modified | date: 'short' }}</span>
+          <div matListItemMeta class="actions">
+            <button mat-icon-button (click)="download(object)"><mat-icon>download</mat-icon></button>
+            <button mat-icon-button (click)="remove(object)"><mat-icon>delete</mat-icon></button>
+          </div>
+        </mat-list-item>
+      </mat-list>
+    </mat-card-content>
+  </mat-card>
+</div>
+"""
+    write_file(html_path, content)
@@ -0,0 +1,50 @@
+from laia_cli.generators.files_generator import file_exists, write_file
+
+
+def modify_storage_component_scss():
+    scss_path = "backoffice/src/app/pages/storage/storage.component.scss"
+    if not file_exists(scss_path):
+        return
+
+    content = """mat-card-title-group {
+  align-items: center;
+}
+
+.no-data {
+  text-align: center;
+  padding: 1rem;
+  color: #888;
+  font-style: italic;
+}
+
+.uploads {
+  display: flex;
+  flex-direction: column;
+  gap: 12px;
+  margin-bottom: 1rem;
+}
+
+.upload-info {
+  display: flex;
+  justify-content: space-between;
+  gap: 1rem;
+  margin-bottom: 4px;
+  font-size: 0.9rem;
+}
+
+.upload-name {
+  overflow: hidden;
+  text-overflow: ellipsis;
+  white-space: nowrap;
+}
+
+.upload-status {
+  color: #888;
+  white-space: nowrap;
+}
+
+.actions {
+  display: flex;
+}
+"""
+    write_file(scss_path, content)
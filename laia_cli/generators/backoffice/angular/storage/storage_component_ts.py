@@ -0,0 +1,135 @@
+from laia_cli.generators.files_generator import file_exists, write_file
+
+
+def modify_storage_component_ts():
+    ts_path = "backoffice/src/app/pages/storage/storage.component.ts"
+    if not file_exists(ts_path):
+        return
+
+    content = """import { ChangeDetectionStrategy, ChangeDetectorRef, Component, OnInit } from '@angular/core';
+import { StorageObject, StorageService, StorageUploadSettings } from '../../services/storage.service';
+
+interface UploadState {
+  id: number;
+  name: string;
+  size: number;
+  progress: number;
+  done: boolean;
+  error?: string;
+}
+
+@Component({
+  selector: 'app-storage',
+  standalone: false,
+  templateUrl: './storage.component.html',
+  styleUrl: './storage.component.scss',
+  changeDetection: ChangeDetectionStrategy.OnPush,
+})
+export class StorageComponent implements OnInit {
+  settings?: StorageUploadSettings;
+  bucket = '';
+  objects: readonly StorageObject[] = [];
+  uploads: readonly UploadState[] = [];
+  loading = false;
+  error = '';
+  private nextUploadId = 0;
+
+  // OnPush: las respuestas llegan fuera de los eventos de la plantilla, así que cada una marca la vista
+  constructor(
+    private storageService: StorageService,
+    private changeDetector: ChangeDetectorRef
+  ) {}
+
+  ngOnInit(): void {
+    this.storageService.settings().subscribe({
+      next: (settings) => {
+        this.settings = settings;
+        this.bucket = settings.bucket;
+        this.refresh();
+      },
+      error: () => {
+        this.error = 'Storage is not enabled in the backend.';
+        this.changeDetector.markForCheck();
+      },
+    });
+  }
+
+  refresh(): void {
+    this.loading = true;
+    this.storageService.list(this.bucket).subscribe({
+      next: (objects) => {
+        this.objects = objects;
+        this.loading = false;
+        this.changeDetector.markForCheck();
+      },
+      error: () => {
+        this.objects = [];
+        this.loading = false;
+        this.changeDetector.markForCheck();
+      },
+    });
+  }
+
+  onFilesSelected(event: Event): void {
+    const input = event.target as HTMLInputElement;
+    Array.from(input.files || []).forEach((file) => this.upload(file));
+    input.value = '';
+  }
+
+  upload(file: File): void {
+    if (!this.settings) {
+      return;
+    }
+
+    const id = this.nextUploadId++;
+    this.uploads = [{ id, name: file.name, size: file.size, progress: 0, done: false }, ...this.uploads];
+
+    this.storageService.upload(this.bucket, file, this.settings).subscribe({
+      next: (progress) => this.updateUpload(id, { progress }),
+      error: (error) => this.updateUpload(id, { error: error?.message || 'Upload failed' }),
+      complete: () => {
+        this.updateUpload(id, { done: true });
+        this.refresh();
+      },
+    });
+  }
+
+  // Cada cambio crea un UploadState nuevo: solo se repinta la fila de esa subida
+  private updateUpload(id: number, changes: Partial<UploadState>): void {
+    this.uploads = this.uploads.map((upload) => upload.id === id ? { ...upload, ...changes } : upload);
+    this.changeDetector.markForCheck();
+  }
+
+  trackUpload(index: number, upload: UploadState): number {
+    return upload.id;
+  }
+
+  trackObject(index: number, object: StorageObject): string {
+    return object.key;
+  }
+
+  download(object: StorageObject): void {
+    this.storageService.downloadUrl(this.bucket, object.key).subscribe((url) => window.open(url, '_blank'));
+  }
+
+  remove(object: StorageObject): void {
+    this.storageService.remove(this.bucket, object.key).subscribe(() => this.refresh());
+  }
+
+  clearFinished(): void {
+    this.uploads = this.uploads.filter((upload) => !upload.done && !upload.error);
+  }
+
+  formatSize(bytes: number): string {
+    const units = ['B', 'KB', 'MB', 'GB', 'TB'];
+    let value = bytes;
+    let unit = 0;
+    while (value >= 1024 && unit < units.length - 1) {
+      value /= 1024;
+      unit++;
+    }
+    return `${value.toFixed(unit === 0 ? 0 : 1)} ${units[unit]}`;
+  }
+}
+"""
+    write_file(ts_path, content)
@@ -1,26 +1,26 @@
-import os
+from laia_cli.generators.files_generator import file_exists, write_file
 
 
 def modify_table_component_html():
     routing_path = "backoffice/src/app/components/table/table.component.html"
-    if not os.path.exists(routing_path):
+    if not file_exists(routing_path):
         return
 
     content = """<table class="table" *ngIf="data && data.length > 0; else noData">
     <thead>
       <tr>
-        <th *ngFor="let header of headers">{{ header }}</th>
+        <th *ngFor="let header of headers; trackBy: trackColumn">{{ header }}</th>
       </tr>
     </thead>
     <tbody>
       @if (fields.length == 0) {
-        <tr *ngFor="let row of data">
-          <td *ngFor="let header of headers">{{ row[header] }}</td>
+        <tr *ngFor="let row of data; trackBy: trackRow">
+          <td *ngFor="let header of headers; trackBy: trackColumn">{{ row[header] }}</td>
         </tr>
       }
       @else {
-        <tr *ngFor="let row of data">
-          <td *ngFor="let field of fields">{{ row[field] }}</td>
+        <tr *ngFor="let row of data; trackBy: trackRow">
+          <td *ngFor="let field of fields; trackBy: trackColumn">{{ row[field] }}</td>
         </tr>
       }
     </tbody>
@@ -30,5 +30,4 @@ def modify_table_component_html():
     <div class="no-data">There is no data yet ...</div>
 </ng-template>
 """
-    with open(routing_path, "w") as f:
-        f.write(content)
\ No newline at end of file
+    write_file(routing_path, content)
\ No newline at end of file
@@ -1,9 +1,9 @@
-import os
+from laia_cli.generators.files_generator import file_exists, write_file
 
 
 def modify_table_component_scss():
     routing_path = "backoffice/src/app/components/table/table.component.scss"
-    if not os.path.exists(routing_path):
+    if not file_exists(routing_path):
         return
 
     content = """.table {
@@ -28,5 +28,4 @@ def modify_table_component_scss():
   font-style: italic;
 }
 """
-    with open(routing_path, "w") as f:
-        f.write(content)
\ No newline at end of file
+    write_file(routing_path, content)
\ No newline at end of file
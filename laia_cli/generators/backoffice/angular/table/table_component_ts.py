@@ -1,29 +1,32 @@
-import os
+from laia_cli.generators.files_generator import file_exists, write_file
 
 
 def modify_table_component_ts():
   ts_path = "backoffice/src/app/components/table/table.component.ts"
-  if not os.path.exists(ts_path):
+  if not file_exists(ts_path):
       return
 
-  with open(ts_path, "r") as f:
-      lines = f.readlines()
-
-  new_lines = []
-  added = False
-
-  for line in lines:
-    if line.strip().startswith("import { Component") and "Input" not in line:
-        new_lines.append("import { Component, Input } from '@angular/core';\n")
-        continue
-
-    new_lines.append(line)
-
-    if not added and "export class TableComponent" in line:
-        new_lines.append("  @Input() headers: string[] = [];\n")
-        new_lines.append("  @Input() fields: string[] = [];\n")
-        new_lines.append("  @Input() data: any[] = [];\n")
-        added = True
-
-  with open(ts_path, "w") as f:
-      f.writelines(new_lines)
\ No newline at end of file
+  # OnPush: la tabla solo se vuelve a pintar cuando le llega otro array (los padres nunca lo mutan)
+  write_file(ts_path, """import { ChangeDetectionStrategy, Component, Input } from '@angular/core';
+
+@Component({
+  selector: 'app-table',
+  standalone: false,
+  templateUrl: './table.component.html',
+  styleUrl: './table.component.scss',
+  changeDetection: ChangeDetectionStrategy.OnPush,
+})
+export class TableComponent {
+  @Input() headers: readonly string[] = [];
+  @Input() fields: readonly string[] = [];
+  @Input() data: readonly any[] = [];
+  // Propiedad que identifica cada fila: al paginar solo se recrean las filas que cambian
+  @Input() trackKey = 'id';
+
+  trackRow = (index: number, row: any): unknown => row?.[this.trackKey] ?? index;
+
+  trackColumn(index: number, column: string): string {
+    return column;
+  }
+}
+""")
@@ -1,15 +1,209 @@
+import difflib
 import os
 import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+
+# Contadores de escritura de la ejecución actual (ficheros escritos / sin cambios)
+WRITE_STATS = {"written": 0, "skipped": 0}
+_stats_lock = threading.Lock()
 
 def create_directory(path):
-    os.makedirs(path, exist_ok=True)
+    # Con un árbol virtual activo los directorios se crean al hacer flush()
+    if _active_tree is None:
+        os.makedirs(path, exist_ok=True)
+
+def _current_umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+# Se lee una sola vez: os.umask() no es seguro entre hilos
+_UMASK = _current_umask()
+
+def _count(key: str):
+    with _stats_lock:
+        WRITE_STATS[key] += 1
+
+def _write_to_disk(path: str, data: bytes) -> bool:
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                _count("skipped")
+                return False
+    except FileNotFoundError:
+        pass
+
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        else:
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    _count("written")
+    return True
+
+class VirtualFileTree:
+    """
+    Árbol de ficheros en memoria. Mientras está activo (ver virtual_file_tree) los generadores
+    escriben aquí en lugar de en disco; las lecturas ven primero lo escrito en el árbol y si no
+    el disco. flush() vuelca todos los cambios de una vez; changes()/diff() permiten previsualizarlos.
+    """
+
+    def __init__(self):
+        self.files = {}
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.normpath(path)
+
+    def write(self, path: str, data: bytes):
+        self.files[self._key(path)] = data
+
+    def read(self, path: str):
+        key = self._key(path)
+        if key in self.files:
+            return self.files[key]
+        try:
+            with open(key, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def exists(self, path: str) -> bool:
+        return self._key(path) in self.files or os.path.exists(path)
+
+    def list_dir(self, directory: str) -> list:
+        directory = self._key(directory)
+        names = set(os.listdir(directory)) if os.path.isdir(directory) else set()
+        for key in self.files:
+            if os.path.dirname(key) == directory:
+                names.add(os.path.basename(key))
+        return sorted(names)
+
+    def changes(self) -> list:
+        """Lista de (path, contenido_en_disco_o_None, contenido_nuevo) de los ficheros que cambian."""
+        result = []
+        for path in sorted(self.files):
+            try:
+                with open(path, "rb") as f:
+                    current = f.read()
+            except FileNotFoundError:
+                current = None
+            if current != self.files[path]:
+                result.append((path, current, self.files[path]))
+        return result
+
+    def diff(self) -> str:
+        chunks = []
+        for path, old, new in self.changes():
+            old_lines = old.decode("utf-8", "replace").splitlines(keepends=True) if old is not None else []
+            new_lines = new.decode("utf-8", "replace").splitlines(keepends=True)
+            chunks.extend(difflib.unified_diff(
+                old_lines, new_lines,
+                fromfile="/dev/null" if old is None else f"a/{path}",
+                tofile=f"b/{path}",
+            ))
+        return "".join(chunk if chunk.endswith("\n") else chunk + "\n" for chunk in chunks)
+
+    def snapshot(self) -> dict:
+        return dict(self.files)
+
+    def restore(self, snapshot: dict):
+        """Descarta lo escrito desde snapshot() (p. ej. una regeneración que ha fallado a medias)."""
+        self.files = dict(snapshot)
+
+    def flush(self):
+        for path in sorted(self.files):
+            _write_to_disk(path, self.files[path])
+        self.files.clear()
+
+_active_tree = None
+
+@contextmanager
+def virtual_file_tree(tree: VirtualFileTree = None):
+    """Redirige write_file/read_file/file_exists al árbol en memoria durante el bloque 'with'."""
+    global _active_tree
+    previous = _active_tree
+    _active_tree = tree if tree is not None else VirtualFileTree()
+    try:
+        yield _active_tree
+    finally:
+        _active_tree = previous
+
+def print_tree_changes(tree: VirtualFileTree, show_diff: bool = False):
+    changes = tree.changes()
+    for path, old, _ in changes:
+        print(f"{'+' if old is None else '~'} {path}")
+    print(f"📝 {len(changes)} files would change, {len(tree.files) - len(changes)} unchanged (dry run).")
+    if show_diff and changes:
+        print()
+        print(tree.diff(), end="")
+
+def write_file(path: str, content, encoding: str = "utf-8") -> bool:
+    """
+    Escribe 'content' en 'path' solo si cambia algo, a través de un fichero temporal
+    y un rename atómico. Así no se tocan mtimes (ng serve / build_runner no recompilan)
+    y nunca queda un fichero a medio escribir. Devuelve True si se ha escrito.
+    Con un VirtualFileTree activo la escritura queda en memoria hasta su flush().
+    """
+    data = content.encode(encoding) if isinstance(content, str) else content
+
+    if _active_tree is not None:
+        changed = _active_tree.read(path) != data
+        _active_tree.write(path, data)
+        return changed
+
+    return _write_to_disk(path, data)
+
+def read_file(path: str, encoding: str = "utf-8") -> str:
+    if _active_tree is not None:
+        data = _active_tree.read(path)
+        if data is None:
+            raise FileNotFoundError(path)
+        return data.decode(encoding)
+    with open(path, "r", encoding=encoding) as f:
+        return f.read()
+
+def file_exists(path: str) -> bool:
+    if _active_tree is not None:
+        return _active_tree.exists(path)
+    return os.path.exists(path)
+
+def list_dir(directory: str) -> list:
+    if _active_tree is not None:
+        return _active_tree.list_dir(directory)
+    return os.listdir(directory)
+
+def reset_write_stats():
+    with _stats_lock:
+        WRITE_STATS["written"] = 0
+        WRITE_STATS["skipped"] = 0
+
+def report_write_stats():
+    print(f"📝 {WRITE_STATS['written']} files written, {WRITE_STATS['skipped']} unchanged.")
 
 def create_file(path, content=""):
-    with open(path, "w") as f:
-        f.write(content)
+    write_file(path, content)
 
 def copy_template(template_path: str, target_path: str):
     if os.path.isdir(template_path):
-        shutil.copytree(template_path, target_path, dirs_exist_ok=True)
+        for root, _, files in os.walk(template_path):
+            for name in files:
+                source = os.path.join(root, name)
+                copy_template(source, os.path.join(target_path, os.path.relpath(source, template_path)))
     else:
-        shutil.copy2(template_path, target_path)
\ No newline at end of file
+        with open(template_path, "rb") as f:
+            write_file(target_path, f.read())
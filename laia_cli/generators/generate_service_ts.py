@@ -1,4 +1,4 @@
-import os
+from laia_cli.generators.files_generator import write_file
 
 
 def generate_ts_service(model_name: str):
@@ -6,7 +6,7 @@ def generate_ts_service(model_name: str):
     pascal = model_name[0].upper() + model_name[1:]
 
     service_code = f"""import {{ Injectable }} from '@angular/core';
-import {{ CommunicationService }} from './communication.service';
+import {{ CommunicationService, CountMode }} from './communication.service';
 import {{ Observable }} from 'rxjs';
 import {{ {pascal} }} from '../interfaces/{camel}';
 
@@ -18,8 +18,10 @@ export class {pascal}Service {{
 
   constructor(private api: CommunicationService) {{}}
 
-  getAll(skip: number, limit: number, filters: any = {{}}, orders: any = {{}}): Observable<any> {{
-    return this.api.post<{pascal}[]>(`${{this.base}}s/?skip=${{skip}}&limit=${{limit}}`, {{ filters, orders }});
+  // count: exact, estimated o none; sin él, el modo configurado en el backend para el modelo
+  getAll(skip: number, limit: number, filters: any = {{}}, orders: any = {{}}, count?: CountMode): Observable<any> {{
+    const countParam = count ? `&count=${{count}}` : '';
+    return this.api.search<{pascal}[]>(`${{this.base}}s/?skip=${{skip}}&limit=${{limit}}${{countParam}}`, {{ filters, orders }});
   }}
 
   getById(id: string): Observable<{pascal}> {{
@@ -42,7 +44,5 @@ export class {pascal}Service {{
     
     service_path = f"backoffice/src/app/services/{camel}.service.ts"
 
-    os.makedirs(os.path.dirname(service_path), exist_ok=True)
 
-    with open(service_path, "w") as f:
-        f.write(service_code)
\ No newline at end of file
+    write_file(service_path, service_code)
\ No newline at end of file
@@ -1,6 +1,8 @@
 import os
 import yaml
 
+from laia_cli.generators.files_generator import file_exists, list_dir, read_file, write_file
+
 def convert_openapi_type(openapi_type: str, format: str = None) -> str:
     type_map = {
         "string": "string",
@@ -15,8 +17,7 @@ def convert_openapi_type(openapi_type: str, format: str = None) -> str:
     return type_map.get(openapi_type, "any")
 
 def generate_ts_interface_from_yaml(yaml_path: str, output_dir: str):
-    with open(yaml_path, "r") as f:
-        content = yaml.safe_load(f)
+    content = yaml.safe_load(read_file(yaml_path))
 
     if not isinstance(content, dict):
         print(f"⚠️  {yaml_path} is not a valid schema file.")
@@ -42,14 +43,11 @@ def generate_ts_interface_from_yaml(yaml_path: str, output_dir: str):
 
         ts_lines.append("}")
 
-        os.makedirs(output_dir, exist_ok=True)
         filename = f"{output_dir}/{model_name[0].lower() + model_name[1:]}.ts"
-        with open(filename, "w") as f:
-            f.write("\n".join(ts_lines))
+        write_file(filename, "\n".join(ts_lines))
         print(f"✅ Interface written to {filename}")
 
 def generate_base_interfaces(output_dir: str):
-    os.makedirs(output_dir, exist_ok=True)
 
     base_model = """export interface LaiaBaseModel {
   id: string;
@@ -62,23 +60,21 @@ def generate_base_interfaces(output_dir: str):
   roles: string[];
 }
 """
-    with open(os.path.join(output_dir, "laiaBaseModel.ts"), "w") as f:
-        f.write(base_model)
+    write_file(os.path.join(output_dir, "laiaBaseModel.ts"), base_model)
 
-    with open(os.path.join(output_dir, "laiaUser.ts"), "w") as f:
-        f.write(laia_user)
+    write_file(os.path.join(output_dir, "laiaUser.ts"), laia_user)
 
     print("✅ Base interfaces (LaiaBaseModel, LaiaUser) generated.")
 
 def generate_all_interfaces_from_schemas(schemas_dir: str, output_dir: str):
     generate_base_interfaces(output_dir)
 
-    for filename in os.listdir(schemas_dir):
+    for filename in list_dir(schemas_dir):
         if filename.endswith(".yaml") or filename.endswith(".yml"):
             model_name = os.path.splitext(filename)[0]
             output_ts = os.path.join(output_dir, f"{model_name[0].lower() + model_name[1:]}.ts")
 
-            if not os.path.exists(output_ts):
+            if not file_exists(output_ts):
                 yaml_path = os.path.join(schemas_dir, filename)
                 generate_ts_interface_from_yaml(yaml_path, output_dir)
             else:
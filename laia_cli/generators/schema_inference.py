@@ -0,0 +1,209 @@
+import datetime
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import yaml
+from pymongo import MongoClient
+
+from laia_cli.generators.files_generator import write_file
+
+GEOJSON_TYPES = {"Point", "LineString", "Polygon", "MultiPoint", "MultiLineString", "MultiPolygon"}
+
+# Límite de propiedades de primer nivel por colección: mantiene la memoria acotada
+# aunque una colección tenga documentos con claves dinámicas.
+MAX_FIELDS = 500
+MAX_DEFAULT_FIELDS = 3
+DEFAULT_FIELD_MAX_LENGTH = 64
+
+
+def infer_openapi_type(value) -> tuple:
+    """Devuelve (type, format) OpenAPI para un valor BSON ya decodificado."""
+    # bool es subclase de int: debe comprobarse antes
+    if isinstance(value, bool):
+        return "boolean", None
+    if isinstance(value, int):
+        return "integer", None
+    if isinstance(value, float):
+        return "number", None
+    if isinstance(value, str):
+        return "string", None
+    if isinstance(value, datetime.datetime):
+        return "string", "date-time"
+    if isinstance(value, list):
+        return "array", None
+    if isinstance(value, dict):
+        if value.get("type") in GEOJSON_TYPES and "coordinates" in value:
+            return "object", f"geojson-{value['type']}"
+        return "object", None
+
+    if type(value).__name__ == "Decimal128":
+        return "number", None
+    # ObjectId, UUID, Binary... se exponen como string
+    return "string", None
+
+
+class FieldStats:
+    """Contadores de un campo: nunca guarda los valores, solo su tipo y longitud."""
+
+    __slots__ = ("present", "types", "item_types", "string_count", "string_length")
+
+    def __init__(self):
+        self.present = 0
+        self.types = Counter()
+        self.item_types = Counter()
+        self.string_count = 0
+        self.string_length = 0
+
+    def add(self, value):
+        self.present += 1
+        if value is None:
+            return
+        self.types[infer_openapi_type(value)] += 1
+        if isinstance(value, str):
+            self.string_count += 1
+            self.string_length += len(value)
+        elif isinstance(value, list) and value:
+            self.item_types[infer_openapi_type(value[0])] += 1
+
+
+def collect_collection_stats(collection, sample_size: int, batch_size: int = 500) -> tuple:
+    """Recorre una muestra acotada ($sample) de la colección en streaming y acumula contadores por campo."""
+    fields = {}
+    total = 0
+
+    cursor = collection.aggregate(
+        [{"$sample": {"size": sample_size}}],
+        batchSize=batch_size,
+        allowDiskUse=True,
+    )
+    with cursor:
+        for doc in cursor:
+            total += 1
+            for key, value in doc.items():
+                if key == "_id":
+                    continue
+                stats = fields.get(key)
+                if stats is None:
+                    if len(fields) >= MAX_FIELDS:
+                        continue
+                    stats = fields[key] = FieldStats()
+                stats.add(value)
+
+    return fields, total
+
+
+def build_property(name: str, stats: FieldStats) -> dict:
+    if stats.types:
+        prop_type, prop_format = stats.types.most_common(1)[0][0]
+    else:
+        prop_type, prop_format = "string", None
+
+    prop = {"type": prop_type}
+    if prop_format == "date-time":
+        prop["format"] = "date-time"
+    elif prop_format and prop_format.startswith("geojson-"):
+        prop["description"] = f"GeoJSON {prop_format[len('geojson-'):]}"
+
+    if prop_type == "array" and stats.item_types:
+        (item_type, item_format), _ = stats.item_types.most_common(1)[0]
+        prop["items"] = {"type": item_type}
+        if item_format == "date-time":
+            prop["items"]["format"] = "date-time"
+
+    label = name.replace("_", " ").strip().capitalize()
+    prop.setdefault("description", f"The {name}")
+    prop["x_frontend_fieldName"] = label
+    prop["x_frontend_editable"] = True
+    prop["x_frontend_placeholder"] = f"Write the {label}"
+    return prop
+
+
+def pick_default_fields(fields: dict, total: int) -> list:
+    """Candidatos a x-frontend-defaultFields: strings cortos presentes en casi todos los documentos."""
+    candidates = []
+    for position, (name, stats) in enumerate(fields.items()):
+        if not stats.string_count or stats.present < 0.9 * total:
+            continue
+        avg_length = stats.string_length / stats.string_count
+        if avg_length > DEFAULT_FIELD_MAX_LENGTH:
+            continue
+        candidates.append((-stats.present, position, name))
+
+    return [name for _, _, name in sorted(candidates)[:MAX_DEFAULT_FIELDS]]
+
+
+def infer_schema(schema_name: str, fields: dict, total: int) -> dict:
+    properties = {name: build_property(name, stats) for name, stats in fields.items()}
+    required = [name for name, stats in fields.items() if total and stats.present == total]
+
+    definition = {"type": "object", "properties": properties}
+    if required:
+        definition["required"] = required
+
+    default_fields = pick_default_fields(fields, total)
+    if default_fields:
+        definition["x-frontend-defaultFields"] = default_fields
+
+    return {schema_name: definition}
+
+
+def collection_to_schema_name(collection_name: str) -> str:
+    return "".join(part[:1].upper() + part[1:] for part in collection_name.replace("-", "_").split("_"))
+
+
+def infer_collection_schema(db, collection_name: str, output_dir: str, sample_size: int, force: bool = False) -> dict:
+    schema_name = collection_to_schema_name(collection_name)
+    output_path = os.path.join(output_dir, f"{schema_name}.yaml")
+
+    if os.path.exists(output_path) and not force:
+        return {"collection": collection_name, "path": output_path, "documents": 0, "skipped": True}
+
+    fields, total = collect_collection_stats(db[collection_name], sample_size)
+    schema = infer_schema(schema_name, fields, total)
+
+    write_file(output_path, yaml.dump(schema, sort_keys=False))
+
+    return {"collection": collection_name, "path": output_path, "documents": total, "skipped": False}
+
+
+def infer_schemas_from_mongo(
+    mongo_url: str,
+    db_name: str,
+    output_dir: str,
+    sample_size: int = 1000,
+    workers: int = 4,
+    collections: list = None,
+    force: bool = False,
+) -> list:
+    """Genera un YAML por colección procesando las colecciones en paralelo (un hilo por colección)."""
+    client = MongoClient(mongo_url)
+    try:
+        db = client[db_name]
+        names = collections or [
+            name for name in db.list_collection_names() if not name.startswith("system.")
+        ]
+        os.makedirs(output_dir, exist_ok=True)
+
+        results = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(infer_collection_schema, db, name, output_dir, sample_size, force): name
+                for name in names
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"❌ Error inferring schema for '{name}': {e}")
+                    continue
+
+                if result["skipped"]:
+                    print(f"🔁 Schema {result['path']} ya existe, se omite (usa --force para sobrescribir).")
+                else:
+                    print(f"✅ {name}: {result['documents']} documents sampled → {result['path']}")
+                results.append(result)
+        return results
+    finally:
+        client.close()
@@ -0,0 +1,136 @@
+import gzip
+
+try:
+    import brotli
+except ImportError:  # brotli es opcional: sin él solo se usa gzip
+    brotli = None
+
+DEFAULT_MIME_TYPES = (
+    "application/json",
+    "application/ld+json",
+    "application/geo+json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+
+def accepted_encodings(accept_encoding: bytes) -> dict:
+    """Codificaciones de Accept-Encoding con su q (las de q=0 quedan fuera)."""
+    encodings = {}
+    for part in accept_encoding.decode("latin-1").split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name and quality > 0:
+            encodings[name.strip().lower()] = quality
+    return encodings
+
+
+class CompressionMiddleware:
+    """
+    Comprime con brotli (si está instalado y el cliente lo acepta) o gzip las respuestas de
+    tipos de texto/JSON por encima de 'minimum_size' bytes. Las respuestas en streaming
+    (varios trozos de cuerpo) y las que ya traen Content-Encoding se envían tal cual.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, use_brotli: bool = True,
+                 brotli_quality: int = 4, mime_types: tuple = DEFAULT_MIME_TYPES):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.use_brotli = use_brotli and brotli is not None
+        self.brotli_quality = brotli_quality
+        self.mime_types = tuple(mime_types)
+
+    def choose_encoding(self, scope):
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                encodings = accepted_encodings(value)
+                if self.use_brotli and "br" in encodings:
+                    return "br"
+                if "gzip" in encodings or "*" in encodings:
+                    return "gzip"
+        return None
+
+    def compress(self, encoding: str, body: bytes) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        # mtime=0: misma entrada, misma salida (no rompe cachés intermedias)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+    def compressible(self, headers) -> bool:
+        content_type = b""
+        for name, value in headers:
+            lowered = name.lower()
+            if lowered == b"content-encoding":
+                return False
+            if lowered == b"content-type":
+                content_type = value
+        return content_type.decode("latin-1").startswith(self.mime_types)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self.choose_encoding(scope)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+
+        async def send_compressed(message):
+            nonlocal start_message
+
+            if message["type"] == "http.response.start":
+                if not self.compressible(message.get("headers", [])):
+                    await send(message)
+                    return
+                start_message = message
+                return
+
+            if start_message is None:
+                await send(message)
+                return
+
+            pending, start_message = start_message, None
+            body = message.get("body", b"")
+
+            if message.get("more_body", False) or len(body) < self.minimum_size:
+                await send(pending)
+                await send(message)
+                return
+
+            compressed = self.compress(encoding, body)
+            headers = [
+                (name, value) for name, value in pending.get("headers", [])
+                if name.lower() not in (b"content-length", b"vary")
+            ]
+            vary = [value for name, value in pending.get("headers", []) if name.lower() == b"vary"]
+            headers.append((b"vary", b", ".join(vary + [b"Accept-Encoding"])))
+            headers.append((b"content-encoding", encoding.encode()))
+            headers.append((b"content-length", str(len(compressed)).encode()))
+
+            await send({**pending, "headers": headers})
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
+
+
+def compression_middleware_options(compression_config: dict) -> dict:
+    """Traduce la sección server.compression de config/*.json a los argumentos del middleware."""
+    return {
+        "minimum_size": int(compression_config.get("minimum_size", 1024)),
+        "gzip_level": int(compression_config.get("gzip_level", 6)),
+        "use_brotli": bool(compression_config.get("brotli", True)),
+        "brotli_quality": int(compression_config.get("brotli_quality", 4)),
+        "mime_types": tuple(compression_config.get("mime_types", DEFAULT_MIME_TYPES)),
+    }
@@ -0,0 +1,243 @@
+import contextvars
+import json
+import threading
+from urllib.parse import parse_qs
+
+from fastapi.routing import APIRoute
+
+from backend.read_cache import ModelCache
+
+COUNT_MODES = ("exact", "estimated", "none")
+DEFAULT_MODE = "exact"
+DEFAULT_TTL = 30
+DEFAULT_MAX_COUNT = 100000
+DEFAULT_MAX_ENTRIES = 1000
+
+# Nombre de la función de búsqueda que laiagenlib registra para cada modelo (POST /{model}s/)
+SEARCH_ENDPOINT_NAMES = {"search_element"}
+
+# Búsqueda en curso (la pone CountMiddleware): el repositorio decide con ella cómo contar
+current_search = contextvars.ContextVar("laia_current_search", default=None)
+
+
+def read_count_settings(schemas: dict, count_config: dict) -> dict:
+    """
+    Modo de conteo de las búsquedas: 'default' de server.count en config/*.json y, por modelo,
+    la extensión x-count de los schemas (x-count: estimated | none | exact).
+    """
+    default = count_config.get("default", DEFAULT_MODE)
+    if default not in COUNT_MODES:
+        raise ValueError(f"Unknown server.count.default '{default}'. Use one of: {', '.join(COUNT_MODES)}")
+    models = {}
+    for name, schema in schemas.items():
+        mode = schema.get("x-count") if isinstance(schema, dict) else None
+        if mode is None:
+            continue
+        if mode not in COUNT_MODES:
+            raise ValueError(f"Unknown x-count '{mode}' in {name}. Use one of: {', '.join(COUNT_MODES)}")
+        models[name.lower()] = mode
+    return {
+        "default": default,
+        "models": models,
+        "ttl": float(count_config.get("ttl", DEFAULT_TTL)),
+        "max_count": int(count_config.get("max_count", DEFAULT_MAX_COUNT)),
+        "max_entries": int(count_config.get("max_entries", DEFAULT_MAX_ENTRIES)),
+    }
+
+
+def filter_key(query: dict) -> str:
+    return json.dumps(query, sort_keys=True, default=str)
+
+
+class SearchCount:
+    """Conteo de una búsqueda: el modo pedido y, tras la consulta, el total y si hay más páginas."""
+
+    __slots__ = ("counts", "model", "mode", "skip", "limit", "total", "has_more")
+
+    def __init__(self, counts, model: str, mode: str, skip: int, limit: int):
+        self.counts = counts
+        self.model = model
+        self.mode = mode
+        self.skip = max(skip, 0)
+        self.limit = limit
+        self.total = None
+        self.has_more = None
+
+    def applies_to(self, model_name: str) -> bool:
+        # laiagenlib también lista roles y access rights en la misma petición: esos se cuentan siempre
+        return self.model == model_name
+
+
+class Counts:
+    """
+    Totales baratos para las búsquedas:
+      - exact:     count_documents en cada petición (lo que hace laiagenlib)
+      - estimated: sin filtros, estimated_document_count (metadatos de la colección); con filtros,
+                   count_documents limitado a max_count y cacheado por filtro con TTL
+      - none:      sin total; solo se comprueba si existe un documento después de la página
+    """
+
+    def __init__(self, settings: dict):
+        self.settings = settings
+        self.caches = {}
+        self.lock = threading.Lock()
+
+    def mode_for(self, model_name: str, requested: str = None) -> str:
+        return requested or self.settings["models"].get(model_name, self.settings["default"])
+
+    def cached(self, model_name: str, query: dict):
+        with self.lock:
+            cache = self.caches.get(model_name)
+            return None if cache is None else cache.get(filter_key(query))
+
+    def remember(self, model_name: str, query: dict, total: int):
+        with self.lock:
+            cache = self.caches.get(model_name)
+            if cache is None:
+                cache = self.caches[model_name] = ModelCache(self.settings["ttl"], self.settings["max_entries"])
+            cache.put(filter_key(query), total, cache.generation)
+
+    def count_mongo(self, collection, query: dict, state: SearchCount) -> int:
+        if state.mode == "exact":
+            return collection.count_documents(query)
+
+        if state.mode == "none":
+            following = collection.find(query, {"_id": 1}, skip=state.skip + state.limit, limit=1)
+            state.has_more = next(iter(following), None) is not None
+            # Con uno más que la página basta para que el paginador ofrezca la siguiente
+            return state.skip + state.limit + (1 if state.has_more else 0)
+
+        if not query:
+            return collection.estimated_document_count()
+        total = self.cached(state.model, query)
+        if total is None:
+            max_count = self.settings["max_count"]
+            total = collection.count_documents(query, limit=max_count) if max_count > 0 else collection.count_documents(query)
+            self.remember(state.model, query, total)
+        return total
+
+
+class CountingCollection:
+    """Collection de pymongo cuyo count_documents sigue el modo de la búsqueda en curso."""
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    def count_documents(self, filter, *args, **kwargs):
+        state = current_search.get()
+        if state is None or args or kwargs or not state.applies_to(self.collection.name):
+            return self.collection.count_documents(filter, *args, **kwargs)
+        state.total = state.counts.count_mongo(self.collection, filter, state)
+        return state.total
+
+    def __getattr__(self, name):
+        return getattr(self.collection, name)
+
+
+class CountingDatabase:
+    def __init__(self, db):
+        self.db = db
+
+    def __getitem__(self, name):
+        return CountingCollection(self.db[name])
+
+    def __getattr__(self, name):
+        return getattr(self.db, name)
+
+
+def count_mongo_searches(repository):
+    """
+    MongoModelRepository.get_items hace un count_documents por página: su base de datos pasa a ser
+    un CountingDatabase. Con route_reads, get_items pertenece a la copia que lee de los secundarios.
+    """
+    owner = getattr(repository.get_items, "__self__", repository)
+    owner.db = CountingDatabase(owner.db)
+    return repository
+
+
+def search_route_models(app) -> dict:
+    """{regex de la ruta de búsqueda: modelo}; laiagenlib las registra como /{model}s/."""
+    return {
+        route.path_regex: route.path.strip("/")[:-1]
+        for route in app.routes
+        if isinstance(route, APIRoute) and route.name in SEARCH_ENDPOINT_NAMES
+    }
+
+
+def query_int(params: dict, name: str, default: int) -> int:
+    try:
+        return int(params.get(name, [default])[0])
+    except ValueError:
+        return default
+
+
+class CountMiddleware:
+    """
+    Lee ?count=exact|estimated|none de las búsquedas, deja el modo en current_search para el
+    repositorio y devuelve el resultado en cabeceras: X-Total-Count, X-Total-Count-Mode
+    (exact / estimated / none) y X-Has-More en el modo none. El cuerpo no cambia.
+    """
+
+    def __init__(self, app, counts: Counts, search_models: dict = None):
+        self.app = app
+        self.counts = counts
+        self.search_models = search_models or {}
+
+    def search_model(self, scope):
+        if scope["type"] != "http" or scope["method"] != "POST":
+            return None
+        for regex, model_name in self.search_models.items():
+            if regex.match(scope["path"]):
+                return model_name
+        return None
+
+    async def __call__(self, scope, receive, send):
+        model_name = self.search_model(scope)
+        if model_name is None:
+            await self.app(scope, receive, send)
+            return
+
+        params = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        requested = params.get("count", [None])[0]
+        if requested is not None and requested not in COUNT_MODES:
+            body = json.dumps({"detail": f"Invalid count '{requested}'. Use one of: {', '.join(COUNT_MODES)}"}).encode()
+            await send({"type": "http.response.start", "status": 400, "headers": [
+                (b"content-type", b"application/json"), (b"content-length", str(len(body)).encode()),
+            ]})
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        state = SearchCount(self.counts, model_name, self.counts.mode_for(model_name, requested),
+                            query_int(params, "skip", 0), query_int(params, "limit", 10))
+        cross_origin = any(name == b"origin" for name, _ in scope["headers"])
+
+        async def send_with_count(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                # Total calculado por otra vía (búsquedas geoespaciales): es exacto
+                mode = state.mode if state.total is not None else "exact"
+                headers = list(message.get("headers", []))
+                headers.append((b"x-total-count-mode", mode.encode()))
+                if state.total is not None and mode != "none":
+                    headers.append((b"x-total-count", str(state.total).encode()))
+                if mode == "none" and state.has_more is not None:
+                    headers.append((b"x-has-more", b"true" if state.has_more else b"false"))
+                if cross_origin:
+                    headers.append((b"access-control-expose-headers", b"X-Total-Count, X-Total-Count-Mode, X-Has-More"))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        token = current_search.set(state)
+        try:
+            await self.app(scope, receive, send_with_count)
+        finally:
+            current_search.reset(token)
+
+
+def enable_counts(repository, settings: dict, use_postgres: bool = False) -> Counts:
+    counts = Counts(settings)
+    # PostgresModelRepository lee current_search directamente
+    if not use_postgres:
+        count_mongo_searches(repository)
+    overrides = ", ".join(f"{name}={mode}" for name, mode in sorted(settings["models"].items()))
+    print(f"🔢 Search counts: {settings['default']}" + (f" ({overrides})" if overrides else ""))
+    return counts
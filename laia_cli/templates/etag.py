@@ -0,0 +1,100 @@
+import hashlib
+
+from fastapi.routing import APIRoute
+
+# Nombre de la función de búsqueda que laiagenlib registra para cada modelo (POST /{model}s/)
+SEARCH_ENDPOINT_NAMES = {"search_element"}
+
+
+def search_route_paths(app) -> list:
+    """Regex de las rutas de búsqueda: son POST pero de solo lectura, así que también llevan ETag."""
+    return [
+        route.path_regex
+        for route in app.routes
+        if isinstance(route, APIRoute) and route.name in SEARCH_ENDPOINT_NAMES
+    ]
+
+
+def weak_etag(body: bytes) -> bytes:
+    return b'W/"' + hashlib.blake2b(body, digest_size=16).hexdigest().encode() + b'"'
+
+
+def etag_matches(if_none_match: bytes, etag: bytes) -> bool:
+    """Comparación débil (RFC 9110): se ignora el prefijo W/ en ambos lados."""
+    if if_none_match.strip() == b"*":
+        return True
+    opaque = etag.removeprefix(b"W/")
+    return any(tag.strip().removeprefix(b"W/") == opaque for tag in if_none_match.split(b","))
+
+
+class ETagMiddleware:
+    """
+    Añade un ETag débil (hash del contenido) a las respuestas 200 de lecturas (GET) y búsquedas
+    y contesta 304 sin cuerpo cuando el cliente envía un If-None-Match que coincide.
+    """
+
+    def __init__(self, app, search_paths: list = None):
+        self.app = app
+        self.search_paths = search_paths or []
+
+    def applies_to(self, scope) -> bool:
+        if scope["method"] == "GET":
+            return True
+        return scope["method"] == "POST" and any(regex.match(scope["path"]) for regex in self.search_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.applies_to(scope):
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = dict(scope["headers"])
+        if_none_match = request_headers.get(b"if-none-match")
+        cross_origin = b"origin" in request_headers
+
+        start_message = None
+
+        async def send_with_etag(message):
+            nonlocal start_message
+
+            if message["type"] == "http.response.start":
+                headers = message.get("headers", [])
+                if message["status"] != 200 or any(name.lower() == b"etag" for name, _ in headers):
+                    await send(message)
+                    return
+                # Se retiene la cabecera hasta tener el cuerpo completo para calcular el hash
+                start_message = message
+                return
+
+            if start_message is None:
+                await send(message)
+                return
+
+            # Respuestas en streaming (descargas de storage, ...): sin ETag y sin retenerlas en memoria
+            if message.get("more_body", False):
+                pending, start_message = start_message, None
+                await send(pending)
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            etag = weak_etag(body)
+            headers = [
+                (name, value) for name, value in start_message.get("headers", [])
+                if name.lower() not in (b"etag", b"cache-control")
+            ]
+            headers.append((b"etag", etag))
+            # El navegador debe revalidar siempre: así un cambio en Mongo se ve en la siguiente petición
+            headers.append((b"cache-control", b"private, no-cache"))
+            if cross_origin:
+                headers.append((b"access-control-expose-headers", b"ETag"))
+
+            if if_none_match is not None and etag_matches(if_none_match, etag):
+                headers = [(name, value) for name, value in headers if name.lower() not in (b"content-length", b"content-type")]
+                await send({"type": "http.response.start", "status": 304, "headers": headers})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send({**start_message, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_with_etag)
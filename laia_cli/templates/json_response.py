@@ -0,0 +1,136 @@
+import asyncio
+import dataclasses
+import datetime
+import enum
+import json
+import math
+import re
+import uuid
+from decimal import Decimal
+
+from bson import Decimal128, ObjectId
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, request_response
+from pydantic import BaseModel
+from starlette.responses import Response
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional: sin él se usa json con una salida idéntica
+    orjson = None
+
+
+def default(obj):
+    """Tipos que ni orjson ni json serializan por sí mismos (ObjectId, Geometry y demás modelos pydantic...)."""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(by_alias=True)
+    if isinstance(obj, Decimal128):
+        obj = obj.to_decimal()
+    if isinstance(obj, Decimal):
+        return int(obj) if obj.as_tuple().exponent >= 0 else float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, bytes):
+        return obj.decode()
+    # A partir de aquí, tipos que orjson ya serializa de forma nativa: solo llegan desde json
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def orjson_float(value: float) -> str:
+    """Mismo formato de float que orjson: exponente sin '+' ni ceros y decimal hasta 1e-5; NaN/Inf → null."""
+    if math.isnan(value) or math.isinf(value):
+        return "null"
+    text = repr(value)
+    if "e" not in text:
+        return text
+    mantissa, exponent = text.split("e")
+    exponent = int(exponent)
+    if exponent == -5:
+        sign = "-" if mantissa.startswith("-") else ""
+        return f"{sign}0.0000{mantissa.lstrip('-').replace('.', '')}"
+    return f"{mantissa}e{exponent}"
+
+
+_stdlib_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=default)
+# Solo los floats con exponente (1e+16, 1e-05) y NaN/Infinity se escriben distinto en json y en orjson
+_STDLIB_EXPONENT = re.compile(r"\de[+-]\d|NaN|Infinity")
+# Tokens del JSON ya serializado: las cadenas se saltan enteras para no tocar su contenido
+_STDLIB_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|-?Infinity|NaN|-?\d+(?:\.\d+)?e[+-]\d+')
+
+
+def _orjson_token(match) -> str:
+    token = match.group(0)
+    if token.startswith('"'):
+        return token
+    return orjson_float(float(token))
+
+
+def stdlib_dumps(content) -> bytes:
+    text = _stdlib_encoder.encode(content)
+    if _STDLIB_EXPONENT.search(text):
+        text = _STDLIB_TOKEN.sub(_orjson_token, text)
+    return text.encode()
+
+
+def dumps(content) -> bytes:
+    if orjson is None:
+        return stdlib_dumps(content)
+    try:
+        return orjson.dumps(content, default=default, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        # Enteros de más de 64 bits o anidamientos muy profundos: json sí los admite
+        return stdlib_dumps(content)
+
+
+class LaiaJSONResponse(JSONResponse):
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+def _uses_response_param(dependant) -> bool:
+    return dependant.response_param_name is not None or any(
+        _uses_response_param(sub_dependant) for sub_dependant in dependant.dependencies
+    )
+
+
+def _direct_response(call, response_class, status_code):
+    """Devuelve la respuesta ya serializada: FastAPI no pasa el resultado por jsonable_encoder."""
+    async def endpoint(**kwargs):
+        result = await call(**kwargs)
+        if isinstance(result, Response):
+            return result
+        return response_class(result, status_code=status_code)
+    return endpoint
+
+
+def use_fast_json_responses(app, response_class=LaiaJSONResponse):
+    """
+    Cambia la clase de respuesta por defecto de las rutas ya creadas (las de LaiaFastApi y las extra).
+    En las rutas async sin response_model se salta además jsonable_encoder.
+    """
+    app.router.default_response_class = response_class
+    for route in app.routes:
+        if not isinstance(route, APIRoute) or not isinstance(route.response_class, DefaultPlaceholder):
+            continue
+
+        route.response_class = response_class
+        dependant = route.dependant
+        if (
+            route.response_field is None
+            and asyncio.iscoroutinefunction(dependant.call)
+            and not _uses_response_param(dependant)
+        ):
+            dependant.call = _direct_response(dependant.call, response_class, route.status_code or 200)
+
+        route.app = request_response(route.get_route_handler())
@@ -4,7 +4,6 @@ from laiagenlib.Infrastructure.LaiaBaseModel.MongoModelRepository import MongoMo
 from laiagenlib.Infrastructure.Openapi.FastAPIOpenapiRepository import FastAPIOpenapiRepository
 from pymongo import MongoClient
 from laiagenlib.Domain.LaiaBaseModel.LaiaBaseModel import LaiaBaseModel
-from laia_ontology_sync import start_background_watcher
 import os
 import uvicorn
 import asyncio
@@ -32,6 +31,11 @@ config = load_config()
 # --- MongoDB ---
 mongo_client_url = config["mongo"].get("url", "mongodb://localhost:27017")
 mongo_database_name = config["mongo"].get("database", "test")
+mongo_replica_set = config["mongo"].get("replica_set")
+mongo_config = config["mongo"]
+
+# --- PostgreSQL ---
+postgres_config = config.get("postgres", {})
 
 # --- JWT ---
 backend_jwt_secret_key = config["jwt"].get("secret_key", "mysecret")
@@ -40,12 +44,18 @@ backend_jwt_refresh_secret_key = config["jwt"].get("refresh_secret_key", "mysecr
 # --- Server ---
 backend_port = int(config["server"].get("port", 8005))
 base_uri_prefix = config["server"].get("base_uri_prefix", "http://localhost:8005")
+etag_enabled = config["server"].get("etag", True)
+compression_config = config["server"].get("compression", {})
+fast_json_enabled = config["server"].get("fast_json", False)
+count_config = config["server"].get("count", {})
+cache_stats_enabled = config["server"].get("cache_stats", False)
 
 # --- Fuseki ---
 fuseki_config = config.get("fuseki", {})
 fuseki_base_url = fuseki_config.get("base_url", "")
 fuseki_user = fuseki_config.get("user", "")
 fuseki_pwd = fuseki_config.get("password", "")
+fuseki_sync_config = fuseki_config.get("sync", {})
 
 # --- Storage ---
 storage_config = config.get("storage", {})
@@ -56,12 +66,21 @@ minio_data_path = storage_config.get("MINIO_DATA_PATH", "./data")
 minio_api_port = storage_config.get("MINIO_API_PORT", 9000)
 minio_console_port = storage_config.get("MINIO_CONSOLE_PORT", 9001)
 minio_endpoint_url = storage_config.get("MINIO_ENDPOINT_URL", f"http://localhost:{minio_api_port}")
+minio_public_url = storage_config.get("MINIO_PUBLIC_URL", minio_endpoint_url)
+storage_uploads_config = storage_config.get("uploads", {})
 
 openapi_file_name = "openapi.yaml"
 backend_folder_name = "backend"
 frontend_folder_name = "frontend"
 
-client = MongoClient(mongo_client_url)
+laia_config_path = os.path.join(os.getcwd(), "laia.json")
+with open(laia_config_path, "r", encoding="utf-8") as f:
+    laia_config = json.load(f)
+
+use_postgres = laia_config.get("database", "MongoDB") == "PostgreSQL"
+
+# Con replica set el driver descubre todos los miembros y puede leer de los secundarios
+client = MongoClient(mongo_client_url, replicaSet=mongo_replica_set) if mongo_replica_set else MongoClient(mongo_client_url)
 db = client[mongo_database_name]
 
 base_path = os.path.join("backend", "openapi")
@@ -98,16 +117,20 @@ with open(output_file, "w") as f:
 
 openapi_path = os.path.join(os.getcwd(), "backend", openapi_file_name)
 
-laia_config_path = os.path.join(os.getcwd(), "laia.json")
-with open(laia_config_path, "r", encoding="utf-8") as f:
-    laia_config = json.load(f)
-
 async def main():
+    database, repository_class = db, MongoModelRepository
+    if use_postgres:
+        # El pool se crea dentro del event loop de uvicorn
+        from backend.postgres_repository import PostgresModelRepository, create_postgres_pool, prepare_postgres
+        database = await create_postgres_pool(postgres_config)
+        await prepare_postgres(database, openapi_doc["components"]["schemas"])
+        repository_class = PostgresModelRepository
+
     app_instance = await LaiaFastApi(
         openapi_path,
         backend_folder_name,
-        db,
-        MongoModelRepository,
+        database,
+        repository_class,
         FastAPIOpenapiRepository,
         laia_config.get("use_ontology", False),
         laia_config.get("use_access_rights", True),
@@ -121,11 +144,58 @@ async def main():
 
     app = app_instance.api
 
+    if use_postgres:
+        # StatsController consulta colecciones de Mongo (count_documents, aggregate): sin Mongo se quita
+        app.router.routes = [route for route in app.router.routes if "Stats" not in getattr(route, "tags", [])]
+        app.openapi_schema = None
+
     from backend.routes import ExtraRoutes
+    from backend.read_cache import CacheStatsRoutes, enable_read_cache, read_cache_settings
     app.include_router(ExtraRoutes(app_instance.repository_instance))
 
-    config = uvicorn.Config(app, host="0.0.0.0", port=backend_port)
-    server = uvicorn.Server(config)
+    if mongo_replica_set and not use_postgres:
+        from backend.read_routing import route_reads
+        route_reads(app_instance.repository_instance, client, mongo_database_name, mongo_config)
+
+    if laia_config.get("storage", True):
+        from backend.storage_uploads import StorageUploadRoutes, storage_clients
+        s3, presign_s3 = storage_clients(minio_endpoint_url, minio_public_url, minio_root_user, minio_root_password)
+        app.include_router(StorageUploadRoutes(s3, presign_s3, storage_uploads_config, backend_jwt_secret_key))
+
+    # Builds de producción ('laia build --backoffice / --frontend'), con sus variantes .br/.gz
+    from backend.static_files import REVALIDATE, mount_spa
+    build_config = laia_config.get("build", {})
+    mount_spa(app, os.path.join("backend", "static", "backoffice"), build_config.get("backoffice", {}).get("base_href", "/backoffice/"))
+    # Flutter no pone hash en sus ficheros (salvo main.dart.js, que renombra 'laia build'): se revalidan siempre
+    mount_spa(app, os.path.join("backend", "static", "frontend"), build_config.get("frontend", {}).get("base_href", "/app/"), default_cache=REVALIDATE)
+
+    cache_settings = read_cache_settings(openapi_doc["components"]["schemas"])
+    if cache_settings:
+        read_cache = enable_read_cache(app_instance.repository_instance, None if use_postgres else db, cache_settings)
+        # GET /cache/stats no tiene autenticación: solo se monta con server.cache_stats
+        if cache_stats_enabled:
+            app.include_router(CacheStatsRoutes(read_cache))
+
+    if fast_json_enabled:
+        from backend.json_response import use_fast_json_responses
+        use_fast_json_responses(app)
+
+    # Totales de las búsquedas: exactos, estimados o sin total (?count=, x-count o server.count)
+    from backend.counts import CountMiddleware, enable_counts, read_count_settings, search_route_models
+    counts = enable_counts(app_instance.repository_instance, read_count_settings(openapi_doc["components"]["schemas"], count_config), use_postgres)
+    app.add_middleware(CountMiddleware, counts=counts, search_models=search_route_models(app))
+
+    if etag_enabled:
+        from backend.etag import ETagMiddleware, search_route_paths
+        app.add_middleware(ETagMiddleware, search_paths=search_route_paths(app))
+
+    # Se añade después del ETag para quedar por fuera: el ETag se calcula sobre el cuerpo sin comprimir
+    if compression_config.get("enabled", False):
+        from backend.compression import CompressionMiddleware, compression_middleware_options
+        app.add_middleware(CompressionMiddleware, **compression_middleware_options(compression_config))
+
+    server_config = uvicorn.Config(app, host="0.0.0.0", port=backend_port)
+    server = uvicorn.Server(server_config)
 
     await server.serve()
 
@@ -142,16 +212,19 @@ if __name__ == "__main__":
 
     ontology_enabled = laia_config.get("use_ontology", False)
 
-    if ontology_enabled:
-        start_background_watcher(
-            mongo_url=f"{mongo_client_url}/?replicaSet=rs0",
+    if ontology_enabled and use_postgres:
+        print("⚠️  Fuseki sync reads the Mongo change stream: it is disabled with PostgreSQL.")
+    elif ontology_enabled:
+        from backend.ontology_sync import start_fuseki_sync
+        start_fuseki_sync(
+            mongo_url=f"{mongo_client_url}/?replicaSet={mongo_replica_set or 'rs0'}",
             db_name=mongo_database_name,
-            models={}, 
+            schemas=openapi_doc["components"]["schemas"],
             fuseki_base=fuseki_base_url,
             user=fuseki_user,
             pwd=fuseki_pwd,
             base_uri_prefix=base_uri_prefix,
-            watch_whole_db=True,
+            sync_config=fuseki_sync_config,
         )
 
     print("Loading...")
@@ -0,0 +1,198 @@
+import os
+import queue
+import threading
+import time
+
+from bson import json_util
+from laia_ontology_sync import build_resource_uri, doc_to_rdf, ensure_dataset_exists, sparql_update
+from pymongo import MongoClient
+from pymongo.errors import OperationFailure, PyMongoError
+
+DEFAULT_SYNC_CONFIG = {
+    "batch_size": 500,
+    "flush_interval": 2.0,
+    "queue_size": 10000,
+    "collections": [],
+    "resume_token_file": "backend/.fuseki_resume_token",
+}
+
+SYNC_OPERATIONS = ["insert", "update", "replace", "delete"]
+CHANGE_STREAM_HISTORY_LOST = 286
+MAX_RETRY_INTERVAL = 60
+
+
+def ontology_contexts(schemas: dict) -> dict:
+    """{colección: {campo: IRI}} de los schemas con propiedades x_ontology (igual que el @context de laiagenlib)."""
+    contexts = {}
+    for name, schema in schemas.items():
+        properties = schema.get("properties", {}) if isinstance(schema, dict) else {}
+        context = {
+            prop: definition["x_ontology"]
+            for prop, definition in properties.items()
+            if isinstance(definition, dict) and "x_ontology" in definition
+        }
+        if context:
+            contexts[name.lower()] = context
+    return contexts
+
+
+def load_resume_token(path: str):
+    if not os.path.exists(path):
+        return None
+    with open(path, "r") as f:
+        return json_util.loads(f.read())
+
+
+def save_resume_token(path: str, token):
+    # Escritura atómica: un corte a medias no debe dejar un token corrupto
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(json_util.dumps(token))
+    os.replace(tmp_path, path)
+
+
+class FusekiSync:
+    """
+    Sincronización Mongo → Fuseki por lotes.
+    Un hilo lee el change stream y deja los cambios en una cola acotada (si se llena, deja de leer:
+    el oplog hace de buffer). Otro hilo agrupa hasta 'batch_size' cambios o 'flush_interval' segundos,
+    se queda con el último cambio de cada documento y manda una única SPARQL update por dataset.
+    El resume token solo se guarda cuando el lote está en Fuseki, así un reinicio no pierde cambios.
+    """
+
+    def __init__(self, mongo_url: str, db_name: str, contexts: dict, fuseki_base: str, user: str, pwd: str,
+                 base_uri_prefix: str, sync_config: dict = None):
+        config = {**DEFAULT_SYNC_CONFIG, **(sync_config or {})}
+        allowlist = set(config["collections"])
+
+        self.mongo_url = mongo_url
+        self.db_name = db_name
+        self.contexts = {coll: ctx for coll, ctx in contexts.items() if not allowlist or coll in allowlist}
+        self.fuseki_base = fuseki_base
+        self.user = user
+        self.pwd = pwd
+        self.base_uri_prefix = base_uri_prefix
+        self.batch_size = int(config["batch_size"])
+        self.flush_interval = float(config["flush_interval"])
+        self.resume_token_file = config["resume_token_file"]
+        self.changes = queue.Queue(maxsize=int(config["queue_size"]))
+        self.datasets = set()
+        self.stats = {"changes": 0, "batches": 0, "updates": 0}
+
+    # --- Lectura del change stream ---
+
+    def watch(self):
+        client = MongoClient(self.mongo_url)
+        db = client[self.db_name]
+        pipeline = [{"$match": {
+            "ns.coll": {"$in": sorted(self.contexts)},
+            "operationType": {"$in": SYNC_OPERATIONS},
+        }}]
+
+        resume_token = load_resume_token(self.resume_token_file)
+        retry_interval = 1
+        while True:
+            try:
+                with db.watch(pipeline, full_document="updateLookup", resume_after=resume_token) as stream:
+                    retry_interval = 1
+                    for change in stream:
+                        # Bloquea si la cola está llena: backpressure en lugar de crecer en memoria
+                        self.changes.put(change)
+                        resume_token = change["_id"]
+            except OperationFailure as e:
+                if e.code == CHANGE_STREAM_HISTORY_LOST:
+                    print("⚠️  Fuseki sync: resume token is too old, syncing from now on. Run 'laia ontology sync --full' to catch up.")
+                    resume_token = None
+                    continue
+                print(f"⚠️  Fuseki sync: change stream failed ({e}), retrying in {retry_interval}s.")
+            except PyMongoError as e:
+                print(f"⚠️  Fuseki sync: change stream interrupted ({e}), retrying in {retry_interval}s.")
+            time.sleep(retry_interval)
+            retry_interval = min(retry_interval * 2, MAX_RETRY_INTERVAL)
+
+    # --- Escritura por lotes ---
+
+    def next_batch(self) -> list:
+        batch = [self.changes.get()]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.changes.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def build_updates(self, batch: list) -> dict:
+        """{dataset: SPARQL update} con el último estado de cada documento del lote."""
+        latest = {}
+        for change in batch:
+            coll = change["ns"]["coll"]
+            latest[(coll, change["documentKey"]["_id"])] = change
+
+        statements = {}
+        for (coll, _id), change in latest.items():
+            resource_uri = build_resource_uri(self.base_uri_prefix, coll, _id)
+            parts = statements.setdefault(coll.lower(), [])
+            parts.append(f"DELETE WHERE {{ <{resource_uri}> ?p ?o }}")
+
+            document = change.get("fullDocument")
+            if change["operationType"] != "delete" and document:
+                base_uri = f"{self.base_uri_prefix.rstrip('/')}/{coll}/"
+                triples = doc_to_rdf(document, self.contexts[coll], base_uri).serialize(format="nt")
+                if triples.strip():
+                    parts.append(f"INSERT DATA {{ {triples} }}")
+
+        return {dataset: " ;\n".join(parts) for dataset, parts in statements.items()}
+
+    def send(self, updates: dict):
+        retry_interval = 1
+        while True:
+            try:
+                for dataset, update in updates.items():
+                    if dataset not in self.datasets:
+                        ensure_dataset_exists(dataset, self.fuseki_base, self.user, self.pwd)
+                        self.datasets.add(dataset)
+                    sparql_update(dataset, update, self.fuseki_base, self.user, self.pwd)
+                return
+            except Exception as e:
+                # Fuseki caído: se reintenta el lote entero (DELETE + INSERT es idempotente)
+                print(f"⚠️  Fuseki sync: update failed ({e}), retrying in {retry_interval}s.")
+                time.sleep(retry_interval)
+                retry_interval = min(retry_interval * 2, MAX_RETRY_INTERVAL)
+
+    def flush_loop(self):
+        while True:
+            batch = self.next_batch()
+            updates = self.build_updates(batch)
+            self.send(updates)
+            save_resume_token(self.resume_token_file, batch[-1]["_id"])
+
+            self.stats["changes"] += len(batch)
+            self.stats["batches"] += 1
+            self.stats["updates"] += len(updates)
+            for _ in batch:
+                self.changes.task_done()
+
+    def start(self) -> list:
+        if not self.contexts:
+            print("ℹ️  Fuseki sync: no schema has x_ontology properties, nothing to sync.")
+            return []
+
+        print(f"🔄 Fuseki sync for: {', '.join(sorted(self.contexts))} (batch {self.batch_size}, every {self.flush_interval}s)")
+        threads = [
+            threading.Thread(target=self.watch, name="fuseki-sync-watch", daemon=True),
+            threading.Thread(target=self.flush_loop, name="fuseki-sync-flush", daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+        return threads
+
+
+def start_fuseki_sync(mongo_url: str, db_name: str, schemas: dict, fuseki_base: str, user: str, pwd: str,
+                      base_uri_prefix: str, sync_config: dict = None) -> FusekiSync:
+    sync = FusekiSync(mongo_url, db_name, ontology_contexts(schemas), fuseki_base, user, pwd, base_uri_prefix, sync_config)
+    sync.start()
+    return sync
@@ -0,0 +1,215 @@
+import threading
+import time
+from collections import OrderedDict
+
+from fastapi import APIRouter
+from pymongo.errors import OperationFailure, PyMongoError
+
+DEFAULT_TTL = 60
+DEFAULT_MAX_ENTRIES = 1000
+
+# Operaciones del change stream que invalidan un documento o la colección entera
+DOCUMENT_OPERATIONS = {"update", "replace", "delete"}
+COLLECTION_OPERATIONS = {"drop", "rename", "dropDatabase", "invalidate"}
+
+
+def read_cache_settings(schemas: dict) -> dict:
+    """{modelo en minúsculas: (ttl, max_entries)} de los schemas con la extensión x-cache."""
+    settings = {}
+    for name, schema in schemas.items():
+        option = schema.get("x-cache") if isinstance(schema, dict) else None
+        if not option:
+            continue
+        if option is True:
+            option = {}
+        settings[name.lower()] = (
+            float(option.get("ttl", DEFAULT_TTL)),
+            int(option.get("max_entries", DEFAULT_MAX_ENTRIES)),
+        )
+    return settings
+
+
+class ModelCache:
+    """Caché TTL + LRU de los documentos de un modelo, indexada por id."""
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        # Se incrementa en cada invalidación: una lectura lanzada antes no debe guardar un valor viejo
+        self.generation = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def get(self, key: str):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self.entries[key]
+            self.stats["misses"] += 1
+            return None
+        self.entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return value
+
+    def put(self, key: str, value, generation: int):
+        if generation != self.generation:
+            return
+        self.entries[key] = (time.monotonic() + self.ttl, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def invalidate(self, key: str = None):
+        self.generation += 1
+        self.stats["invalidations"] += 1
+        if key is None:
+            self.entries.clear()
+        else:
+            self.entries.pop(key, None)
+
+
+class ReadCache:
+    """
+    Caché de lectura (read-through) delante de repository.get_item para los modelos con x-cache.
+    Las escrituras hechas por este proceso invalidan al momento; las de otros procesos
+    llegan por el change stream de Mongo (ver start_change_stream_listener).
+    """
+
+    def __init__(self, settings: dict):
+        self.models = {name: ModelCache(ttl, max_entries) for name, (ttl, max_entries) in settings.items()}
+        self.lock = threading.Lock()
+        self.change_stream_active = False
+
+    def invalidate(self, model_name: str, key: str = None):
+        cache = self.models.get(model_name)
+        if cache is not None:
+            with self.lock:
+                cache.invalidate(key)
+
+    def invalidate_all(self):
+        with self.lock:
+            for cache in self.models.values():
+                cache.invalidate()
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                "change_stream": self.change_stream_active,
+                "models": {
+                    name: {**cache.stats, "size": len(cache.entries), "ttl": cache.ttl, "max_entries": cache.max_entries}
+                    for name, cache in self.models.items()
+                },
+            }
+
+    def wrap(self, repository):
+        """Sustituye get_item/put_item/delete_item de la instancia del repositorio compartida por todas las rutas."""
+        get_item = repository.get_item
+        put_item = repository.put_item
+        delete_item = repository.delete_item
+
+        async def cached_get_item(model_name: str, item_id: str):
+            cache = self.models.get(model_name)
+            if cache is None:
+                return await get_item(model_name, item_id)
+
+            key = str(item_id)
+            with self.lock:
+                value = cache.get(key)
+                generation = cache.generation
+            if value is not None:
+                # Copia superficial: el read quita campos no visibles del dict que recibe
+                return dict(value)
+
+            item = await get_item(model_name, item_id)
+            with self.lock:
+                cache.put(key, dict(item), generation)
+            return item
+
+        async def invalidating_put_item(model_name: str, item_id: str, update_fields: dict):
+            try:
+                return await put_item(model_name, item_id, update_fields)
+            finally:
+                self.invalidate(model_name, str(item_id))
+
+        async def invalidating_delete_item(model_name: str, item_id: str):
+            try:
+                return await delete_item(model_name, item_id)
+            finally:
+                self.invalidate(model_name, str(item_id))
+
+        repository.get_item = cached_get_item
+        repository.put_item = invalidating_put_item
+        repository.delete_item = invalidating_delete_item
+        return repository
+
+    def handle_change(self, change: dict):
+        operation = change.get("operationType")
+        if operation in COLLECTION_OPERATIONS:
+            if operation in ("dropDatabase", "invalidate"):
+                self.invalidate_all()
+            else:
+                self.invalidate(change.get("ns", {}).get("coll"))
+            return
+        if operation in DOCUMENT_OPERATIONS:
+            document_id = change.get("documentKey", {}).get("_id")
+            self.invalidate(change.get("ns", {}).get("coll"), str(document_id))
+
+    def start_change_stream_listener(self, db, retry_interval: float = 5):
+        """Escucha el change stream de las colecciones cacheadas en un hilo aparte (requiere replica set)."""
+        pipeline = [{"$match": {"$or": [
+            {"ns.coll": {"$in": list(self.models)}},
+            {"operationType": {"$in": ["dropDatabase", "invalidate"]}},
+        ]}}]
+
+        def listen():
+            resume_token = None
+            while True:
+                try:
+                    with db.watch(pipeline, resume_after=resume_token) as stream:
+                        self.change_stream_active = True
+                        for change in stream:
+                            resume_token = stream.resume_token
+                            self.handle_change(change)
+                except OperationFailure as e:
+                    self.change_stream_active = False
+                    if e.code == 40573:  # Mongo sin replica set: no hay change streams
+                        print("⚠️  Read cache: change streams need a replica set, entries expire by TTL only.")
+                        return
+                    # El token ya no es válido (oplog rotado): lo cacheado puede estar obsoleto
+                    print(f"⚠️  Read cache: change stream failed ({e}), clearing cache and restarting.")
+                    resume_token = None
+                    self.invalidate_all()
+                except PyMongoError as e:
+                    self.change_stream_active = False
+                    print(f"⚠️  Read cache: change stream interrupted ({e}), retrying in {retry_interval}s.")
+                    self.invalidate_all()
+                time.sleep(retry_interval)
+
+        thread = threading.Thread(target=listen, name="read-cache-change-stream", daemon=True)
+        thread.start()
+        return thread
+
+
+def enable_read_cache(repository, db, settings: dict) -> ReadCache:
+    cache = ReadCache(settings)
+    cache.wrap(repository)
+    if db is not None:
+        cache.start_change_stream_listener(db)
+    else:
+        print("⚠️  Read cache: no change stream for this database, entries expire by TTL only.")
+    print(f"🗃️  Read cache enabled for: {', '.join(sorted(settings))}")
+    return cache
+
+
+def CacheStatsRoutes(cache: ReadCache):
+    router = APIRouter(tags=["Cache"])
+
+    @router.get("/cache/stats")
+    async def cache_stats():
+        return cache.stats()
+
+    return router
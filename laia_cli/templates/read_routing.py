@@ -0,0 +1,45 @@
+from pymongo.read_preferences import Nearest, Primary, PrimaryPreferred, Secondary, SecondaryPreferred
+
+READ_PREFERENCES = {
+    "primary": Primary,
+    "primaryPreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest,
+}
+
+# Mínimo que admite el driver para maxStalenessSeconds
+MIN_MAX_STALENESS = 90
+
+
+def read_preference_from_config(mongo_config: dict):
+    """ReadPreference de la sección mongo de config/*.json ('read_preference' y 'max_staleness_seconds')."""
+    name = mongo_config.get("read_preference", "secondaryPreferred")
+    if name not in READ_PREFERENCES:
+        raise ValueError(f"Unknown read_preference '{name}'. Use one of: {', '.join(READ_PREFERENCES)}")
+    if name == "primary":
+        return Primary()
+
+    max_staleness = mongo_config.get("max_staleness_seconds")
+    if max_staleness is None or max_staleness < 0:
+        return READ_PREFERENCES[name]()
+    return READ_PREFERENCES[name](max_staleness=max(int(max_staleness), MIN_MAX_STALENESS))
+
+
+def route_reads(repository, client, db_name: str, mongo_config: dict):
+    """
+    Búsquedas y listados (get_items) contra una copia del repositorio cuya base de datos usa la
+    read preference configurada. get_item, las escrituras y aggregate_items ($out/$merge) siguen
+    en el primario: así una lectura justo después de guardar siempre ve el cambio.
+    """
+    read_preference = read_preference_from_config(mongo_config)
+    if isinstance(read_preference, Primary):
+        return repository
+
+    read_db = client.get_database(db_name, read_preference=read_preference)
+    read_repository = type(repository)(read_db)
+    repository.get_items = read_repository.get_items
+
+    staleness = read_preference.max_staleness
+    print(f"📖 Searches and lists read from {read_preference.mongos_mode}" + (f" (max staleness {staleness}s)" if staleness > 0 else ""))
+    return repository
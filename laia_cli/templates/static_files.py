@@ -0,0 +1,104 @@
+import mimetypes
+import os
+import re
+from email.utils import formatdate
+
+from starlette.responses import FileResponse, Response
+from starlette.routing import Route
+
+from backend.compression import accepted_encodings
+
+# Ficheros con hash en el nombre (main-4GQZ2XKE.js, styles.3f2a9c1d0b7e5a46.css): nunca cambian de contenido
+HASHED_FILE = re.compile(r"[.-]([0-9a-f]{16,}|[0-9A-Z]{8})\.[a-z0-9]+$")
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+DEFAULT_CACHE = "public, max-age=3600"
+# Extensiones precomprimidas por 'laia build' (.br y .gz junto al original)
+PRECOMPRESSED_SUFFIXES = (("br", ".br"), ("gzip", ".gz"))
+
+
+def cache_control(path: str, default: str = DEFAULT_CACHE) -> str:
+    name = os.path.basename(path)
+    if name == "index.html":
+        return REVALIDATE  # Siempre se revalida: apunta a los bundles de la última build
+    if HASHED_FILE.search(name):
+        return IMMUTABLE
+    return default
+
+
+def file_etag(stat_result, encoding: str = "") -> str:
+    return f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}{"-" + encoding if encoding else ""}"'
+
+
+class SpaFiles:
+    """
+    Sirve una build de producción (backoffice o frontend web) desde el backend:
+      - variantes .br/.gz generadas en la build según Accept-Encoding, sin comprimir en cada petición
+      - Cache-Control immutable para los ficheros con hash, no-cache para index.html
+      - ETag + 304, y fallback a index.html para las rutas del router del SPA
+    """
+
+    def __init__(self, directory: str, default_cache: str = DEFAULT_CACHE):
+        self.directory = os.path.realpath(directory)
+        self.default_cache = default_cache
+        self.index = os.path.join(self.directory, "index.html")
+
+    def resolve(self, relative_path: str):
+        path = os.path.realpath(os.path.join(self.directory, relative_path))
+        # Nada fuera del directorio de la build ('../' en la URL)
+        if path != self.directory and not path.startswith(self.directory + os.sep):
+            return None
+        return path if os.path.isfile(path) else None
+
+    def choose_variant(self, path: str, accept_encoding: bytes) -> tuple:
+        accepted = accepted_encodings(accept_encoding)
+        for encoding, suffix in PRECOMPRESSED_SUFFIXES:
+            if accepted.get(encoding, 0) > 0 and os.path.isfile(path + suffix):
+                return path + suffix, encoding
+        return path, ""
+
+    async def handle(self, request):
+        relative_path = request.path_params.get("path", "").lstrip("/")
+        path = self.resolve(relative_path) if relative_path else None
+        if path is None:
+            # Las rutas del SPA no tienen extensión: /backoffice/models/book → index.html
+            if os.path.splitext(relative_path)[1] and not relative_path.endswith(".html"):
+                return Response(status_code=404)
+            path = self.index
+
+        served_path, encoding = self.choose_variant(path, request.headers.get("accept-encoding", "").encode())
+        stat_result = os.stat(served_path)
+        etag = file_etag(stat_result, encoding)
+        headers = {
+            "Cache-Control": cache_control(path, self.default_cache),
+            "ETag": etag,
+            "Vary": "Accept-Encoding",
+            "Last-Modified": formatdate(stat_result.st_mtime, usegmt=True),
+        }
+        if etag in [tag.strip() for tag in request.headers.get("if-none-match", "").split(",")]:
+            return Response(status_code=304, headers=headers)
+
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        if request.method == "HEAD":
+            headers["Content-Length"] = str(stat_result.st_size)
+            return Response(status_code=200, headers=headers, media_type=media_type)
+        return FileResponse(served_path, headers=headers, media_type=media_type, stat_result=stat_result)
+
+
+def mount_spa(app, directory: str, prefix: str, default_cache: str = DEFAULT_CACHE) -> bool:
+    """
+    Añade las rutas de una build de SPA bajo 'prefix' si existe su index.html.
+    default_cache: Cache-Control de los ficheros sin hash en el nombre.
+    """
+    if not os.path.isfile(os.path.join(directory, "index.html")):
+        return False
+
+    prefix = "/" + prefix.strip("/") if prefix.strip("/") else ""
+    files = SpaFiles(directory, default_cache)
+    app.router.routes.append(Route(f"{prefix}/{{path:path}}", files.handle, methods=["GET", "HEAD"]))
+    if prefix:
+        app.router.routes.append(Route(prefix, files.handle, methods=["GET", "HEAD"]))
+    print(f"🌐 Serving {directory} at {prefix or '/'}")
+    return True
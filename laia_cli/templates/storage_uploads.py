@@ -0,0 +1,216 @@
+import math
+import threading
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from laiagenlib.Application.LaiaUser import JWTToken
+from pydantic import BaseModel
+
+MB = 1024 * 1024
+# Límites de S3/MinIO para multipart: partes de al menos 5 MiB (salvo la última) y como mucho 10000
+MIN_PART_SIZE = 5 * MB
+MAX_PARTS = 10000
+
+DEFAULT_UPLOADS_CONFIG = {
+    "bucket": "uploads",
+    "presign_expires": 3600,
+    "part_size_mb": 16,
+    "multipart_threshold_mb": 32,
+    "max_parallel_parts": 4,
+}
+
+
+class PresignedUploadRequest(BaseModel):
+    key: str
+    content_type: str = "application/octet-stream"
+
+
+class PresignedDownloadRequest(BaseModel):
+    key: str
+
+
+class MultipartUploadRequest(BaseModel):
+    key: str
+    size: int
+    content_type: str = "application/octet-stream"
+
+
+class UploadedPart(BaseModel):
+    part_number: int
+    etag: str
+
+
+class CompleteMultipartRequest(BaseModel):
+    key: str
+    parts: List[UploadedPart]
+
+
+class AbortMultipartRequest(BaseModel):
+    key: str
+
+
+def uploads_settings(uploads_config: dict) -> dict:
+    config = {**DEFAULT_UPLOADS_CONFIG, **(uploads_config or {})}
+    return {
+        "bucket": config["bucket"],
+        # Únicos buckets que aceptan estas rutas: el de por defecto y los de 'buckets'
+        "buckets": [config["bucket"], *[bucket for bucket in config.get("buckets", []) if bucket != config["bucket"]]],
+        "presign_expires": int(config["presign_expires"]),
+        "part_size": max(int(float(config["part_size_mb"]) * MB), MIN_PART_SIZE),
+        "multipart_threshold": int(float(config["multipart_threshold_mb"]) * MB),
+        "max_parallel_parts": int(config["max_parallel_parts"]),
+    }
+
+
+def part_size_for(size: int, part_size: int) -> int:
+    """Tamaño de parte configurado, subido lo justo para que el fichero quepa en MAX_PARTS partes."""
+    return max(part_size, math.ceil(size / MAX_PARTS), MIN_PART_SIZE)
+
+
+def storage_clients(endpoint_url: str, public_url: str, access_key: str, secret_key: str):
+    """
+    Dos clientes S3: uno para hablar con MinIO desde el backend y otro solo para firmar URLs
+    con la dirección pública, que es la que usará el navegador (la firma incluye el host).
+    """
+    import boto3
+    from botocore.client import Config
+
+    def client(url: str):
+        return boto3.client(
+            "s3",
+            endpoint_url=url,
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+            config=Config(signature_version="s3v4", s3={"addressing_style": "path"}),
+        )
+
+    s3 = client(endpoint_url)
+    return s3, client(public_url) if public_url and public_url != endpoint_url else s3
+
+
+def StorageUploadRoutes(s3, presign_s3, uploads_config: dict = None, jwt_secret_key: str = "secret_key"):
+    """
+    Subidas directas a MinIO: el backend solo firma URLs (PUT simple o partes de un multipart)
+    y el navegador envía los bytes a MinIO, así que los workers de la API nunca los reciben.
+    Las URLs se firman con las credenciales de MinIO: todas las rutas piden un token de sesión
+    y solo trabajan con los buckets de storage.uploads.
+    """
+    http_bearer = HTTPBearer(auto_error=False)
+
+    def verify_token(credentials: Optional[HTTPAuthorizationCredentials] = Depends(http_bearer)):
+        if not credentials:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing or invalid authorization header")
+        try:
+            JWTToken.verify_jwt_token(credentials.credentials, jwt_secret_key)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid session token")
+        return True
+
+    router = APIRouter(tags=["Storage"], dependencies=[Depends(verify_token)])
+    settings = uploads_settings(uploads_config)
+    expires = settings["presign_expires"]
+    allowed_buckets = set(settings["buckets"])
+    ready_buckets = set()
+    buckets_lock = threading.Lock()
+
+    def check_bucket(bucket: str):
+        if bucket not in allowed_buckets:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Bucket '{bucket}' is not configured in storage.uploads")
+
+    def ensure_bucket(bucket: str):
+        with buckets_lock:
+            if bucket in ready_buckets:
+                return
+            try:
+                s3.head_bucket(Bucket=bucket)
+            except Exception:
+                s3.create_bucket(Bucket=bucket)
+            ready_buckets.add(bucket)
+
+    # Rutas síncronas: FastAPI las ejecuta en su pool de hilos y boto3 no bloquea el event loop
+    @router.get("/storage-uploads/settings")
+    def upload_settings():
+        return {key: value for key, value in settings.items() if key != "presign_expires"}
+
+    @router.post("/storage/{bucket}/presigned-upload")
+    def presigned_upload(bucket: str, request: PresignedUploadRequest):
+        """URL firmada para subir un fichero pequeño con un único PUT."""
+        check_bucket(bucket)
+        try:
+            ensure_bucket(bucket)
+            url = presign_s3.generate_presigned_url(
+                "put_object",
+                Params={"Bucket": bucket, "Key": request.key, "ContentType": request.content_type},
+                ExpiresIn=expires,
+            )
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+        return {"url": url, "method": "PUT", "headers": {"Content-Type": request.content_type}, "expires_in": expires}
+
+    @router.post("/storage/{bucket}/presigned-download")
+    def presigned_download(bucket: str, request: PresignedDownloadRequest):
+        check_bucket(bucket)
+        try:
+            url = presign_s3.generate_presigned_url(
+                "get_object", Params={"Bucket": bucket, "Key": request.key}, ExpiresIn=expires
+            )
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+        return {"url": url, "expires_in": expires}
+
+    @router.post("/storage/{bucket}/multipart-uploads")
+    def create_multipart_upload(bucket: str, request: MultipartUploadRequest):
+        """Abre una subida multipart y devuelve una URL firmada por parte."""
+        check_bucket(bucket)
+        if request.size <= 0:
+            raise HTTPException(status_code=400, detail="size must be greater than 0")
+
+        part_size = part_size_for(request.size, settings["part_size"])
+        part_count = math.ceil(request.size / part_size)
+        try:
+            ensure_bucket(bucket)
+            upload = s3.create_multipart_upload(Bucket=bucket, Key=request.key, ContentType=request.content_type)
+            upload_id = upload["UploadId"]
+            parts = [
+                {
+                    "part_number": part_number,
+                    "url": presign_s3.generate_presigned_url(
+                        "upload_part",
+                        Params={"Bucket": bucket, "Key": request.key, "UploadId": upload_id, "PartNumber": part_number},
+                        ExpiresIn=expires,
+                    ),
+                }
+                for part_number in range(1, part_count + 1)
+            ]
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+        return {"upload_id": upload_id, "key": request.key, "part_size": part_size, "parts": parts, "expires_in": expires}
+
+    @router.post("/storage/{bucket}/multipart-uploads/{upload_id}/complete")
+    def complete_multipart_upload(bucket: str, upload_id: str, request: CompleteMultipartRequest):
+        check_bucket(bucket)
+        parts = sorted(request.parts, key=lambda part: part.part_number)
+        try:
+            s3.complete_multipart_upload(
+                Bucket=bucket,
+                Key=request.key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": [{"PartNumber": part.part_number, "ETag": part.etag} for part in parts]},
+            )
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+        return {"message": f"Archivo '{request.key}' subido con éxito a '{bucket}'", "key": request.key}
+
+    @router.post("/storage/{bucket}/multipart-uploads/{upload_id}/abort")
+    def abort_multipart_upload(bucket: str, upload_id: str, request: AbortMultipartRequest):
+        """Descarta las partes ya subidas de una subida cancelada o fallida."""
+        check_bucket(bucket)
+        try:
+            s3.abort_multipart_upload(Bucket=bucket, Key=request.key, UploadId=upload_id)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+        return {"message": f"Subida de '{request.key}' cancelada", "key": request.key}
+
+    return router
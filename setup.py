@@ -17,7 +17,12 @@ setup(
         "python-dotenv>=1.0",
         "uvicorn>=0.22",
         "rdflib>=7.0",
+        "requests>=2.0",
     ],
+    extras_require={
+        "zstd": ["zstandard>=0.21"],
+        "brotli": ["brotli>=1.1"],
+    },
     entry_points={
         "console_scripts": [
             "laia=laia_cli.cli:main",